@@ -0,0 +1 @@
+"""Offline benchmarks for the search and export hot paths."""
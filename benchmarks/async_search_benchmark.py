@@ -0,0 +1,144 @@
+"""
+Benchmark for AsyncSearchClient against a local stand-in for YouTube.
+
+The stand-in server (tests/standin_server.py, shared with the tests)
+answers the two requests of the search protocol (`/results` HTML page
+and `youtubei/v1/search` continuations) with recorded results, split
+into pages like the real site. The same queries are run with a new
+session per query (what scrapetube does), with one pooled session one
+query at a time, and with the pooled session running queries
+concurrently; every result list is checked against the recorded one.
+
+Usage:
+    python -m benchmarks.async_search_benchmark [--latency 0.05] [--concurrency 8]
+"""
+
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import time
+
+from src.clients import AsyncSearchClient, FixtureBackend
+from src.clients.query_planner import SEARCH_PATTERNS
+from src.utils import config, get_poems_as_objects
+from tests.standin_server import StandInServer
+
+
+def benchmark_queries(count: int) -> List[str]:
+    """
+    Build search queries the way YouTubeClient does for the built-in dataset.
+    
+    Args:
+        count: Number of queries
+        
+    Returns:
+        Distinct query strings
+    """
+    queries = []
+    for pattern in SEARCH_PATTERNS:
+        for poem in get_poems_as_objects():
+            queries.append(pattern.format(titulo=poem.titulo, autor=poem.autor, genero=poem.genero))
+    return list(dict.fromkeys(queries))[:count]
+
+
+async def run_mode(
+    label: str,
+    server: StandInServer,
+    queries: List[str],
+    limit: int,
+    concurrency: int,
+    shared: bool
+) -> Dict[str, object]:
+    """
+    Run every query against the stand-in server and check the results.
+    
+    Args:
+        label: Name shown in the report
+        server: Running stand-in server
+        queries: Queries to run
+        limit: Videos per query
+        concurrency: Requests in flight (pooled session only)
+        shared: Use one pooled session for every query instead of one per query
+        
+    Returns:
+        Dictionary with throughput, request and connection figures
+    """
+    requests = connections = 0
+    start = time.perf_counter()
+    if shared:
+        async with AsyncSearchClient(server.base_url, concurrency=concurrency, pool_size=concurrency) as client:
+            results = await client.search_many(queries, limit)
+        requests, connections = client.requests, client.connections
+    else:
+        results = {}
+        for query in queries:
+            async with AsyncSearchClient(server.base_url, concurrency=1, pool_size=1) as client:
+                results[query] = await client.search(query, limit)
+            requests += client.requests
+            connections += client.connections
+    elapsed = time.perf_counter() - start
+    
+    mismatches = sum(1 for query in queries if results[query] != server.backend.search(query, limit))
+    return {
+        'label': label,
+        'queries': len(queries),
+        'seconds': elapsed,
+        'queries_per_sec': len(queries) / elapsed if elapsed else 0.0,
+        'requests': requests,
+        'connections': connections,
+        'mismatches': mismatches,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Start the stand-in server and time every mode."""
+    server = StandInServer(FixtureBackend(args.fixtures, synthesize_missing=True), latency=args.latency)
+    await server.start()
+    queries = benchmark_queries(args.queries)
+    try:
+        return [
+            await run_mode("Sesión por consulta", server, queries, args.limit, 1, shared=False),
+            await run_mode("Sesión compartida", server, queries, args.limit, 1, shared=True),
+            await run_mode(f"Compartida x{args.concurrency}", server, queries, args.limit,
+                           args.concurrency, shared=True),
+        ]
+    finally:
+        await server.stop()
+
+
+def print_report(results: List[Dict[str, object]]):
+    """
+    Print benchmark results as a table.
+    
+    Args:
+        results: Rows returned by run_mode
+    """
+    print(f"\n{'Modo':<22}{'Consultas':>10}{'Seg.':>9}{'Cons./s':>10}{'Peticiones':>12}{'Conexiones':>12}{'Difieren':>10}")
+    print('-' * 85)
+    for row in results:
+        print(
+            f"{row['label']:<22}{row['queries']:>10}{row['seconds']:>9.2f}{row['queries_per_sec']:>10.1f}"
+            f"{row['requests']:>12}{row['connections']:>12}{row['mismatches']:>10}"
+        )
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, object]]:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark del cliente de búsqueda asíncrono (servidor local)")
+    parser.add_argument("--fixtures", help="JSON de resultados grabados (por defecto: resultados sintéticos)")
+    parser.add_argument("--queries", type=int, default=200, help="Número de consultas")
+    parser.add_argument("--limit", type=int, default=config.SEARCH_PAGE_SIZE * 2,
+                        help="Videos por consulta (más de una página usa continuaciones)")
+    parser.add_argument("--latency", type=float, default=0.02, help="Latencia del servidor por petición (s)")
+    parser.add_argument("--concurrency", type=int, default=config.ASYNC_SEARCH_CONCURRENCY,
+                        help="Peticiones simultáneas del cliente compartido")
+    args = parser.parse_args(argv)
+    
+    results = asyncio.run(run_benchmark(args))
+    print_report(results)
+    return results
+
+
+if __name__ == "__main__":
+    main()
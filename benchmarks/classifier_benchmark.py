@@ -0,0 +1,147 @@
+"""
+Title classification benchmark: per-table keyword scans vs ContentClassifier.
+
+Usage:
+    python -m benchmarks.classifier_benchmark [--size 100000]
+"""
+
+from typing import Callable, List, Optional, Tuple
+import argparse
+import gc
+import random
+import re
+import time
+
+from src.clients.classifier import ContentClassifier, Classification
+
+
+def legacy_classify(title: str, view_count: int = 0) -> Tuple[str, str, str]:
+    """
+    Classify a title the way YouTubeClient did before ContentClassifier:
+    one `any(word in ...)` scan per keyword table and regexes compiled
+    through re.search on every call.
+    
+    Args:
+        title: Video title
+        view_count: Number of views
+        
+    Returns:
+        Tuple of (content type, quality, recitador)
+    """
+    combined = f"{title.lower()} "
+    if any(word in combined for word in ['recitación', 'recita', 'recitando']):
+        content_type = "Recitación"
+    elif any(word in combined for word in ['dramatización', 'drama', 'teatral', 'teatro']):
+        content_type = "Dramatización"
+    elif any(word in combined for word in ['lectura', 'leyendo', 'lee']):
+        content_type = "Lectura"
+    elif any(word in combined for word in ['performance', 'presentación', 'actuación']):
+        content_type = "Performance"
+    elif any(word in combined for word in ['compilación', 'antología', 'colección']):
+        content_type = "Compilación"
+    elif any(word in combined for word in ['documental', 'educativo', 'análisis']):
+        content_type = "Documental"
+    elif any(word in combined for word in ['audio', 'audiopoesía']):
+        content_type = "Audiopoesía"
+    elif any(word in combined for word in ['fragmento', 'extracto', 'parcial']):
+        content_type = "Fragmentos"
+    else:
+        content_type = "Video Poético"
+        
+    title_lower = title.lower()
+    is_professional = any(kw in title_lower for kw in ['profesional', 'oficial', 'hd', 'alta calidad', 'audio limpio'])
+    is_amateur = any(kw in title_lower for kw in ['celular', 'phone', 'baja calidad', 'audio malo'])
+    if is_professional or view_count > 10000:
+        quality = "Excelente"
+    elif is_amateur or view_count < 100:
+        quality = "Aceptable"
+    else:
+        quality = "Buena"
+        
+    recitador = "N/A"
+    for pattern in [r'recitado por (.+?)(?:\||$)', r'por (.+?)(?:\||$)',
+                    r'voz de (.+?)(?:\||$)', r'narrado por (.+?)(?:\||$)']:
+        match = re.search(pattern, title, re.IGNORECASE)
+        if match:
+            name = re.sub(r'\s*[-–—]\s*.*$', '', match.group(1).strip())
+            recitador = name[:50]
+            break
+            
+    return content_type, quality, recitador
+
+
+def title_corpus(count: int, seed: int = 7) -> Tuple[List[str], List[int]]:
+    """
+    Build a corpus of realistic video titles and view counts.
+    
+    Args:
+        count: Number of titles
+        seed: Random seed
+        
+    Returns:
+        Tuple of (titles, view counts)
+    """
+    rng = random.Random(seed)
+    poems = ["Hay un país en el mundo", "A la Patria", "Yelidá", "Compadre Mon", "Vuelo de la ausencia"]
+    authors = ["Pedro Mir", "Salomé Ureña", "Tomás Hernández Franco", "Manuel del Cabral"]
+    markers = [
+        "recitación", "Recitado por Juan Pérez", "dramatización teatral", "lectura", "leyendo",
+        "performance en vivo", "antología", "documental educativo", "audiopoesía", "fragmento",
+        "HD oficial", "grabado con celular", "voz de María Gómez - 2019", "", "", "",
+    ]
+    titles = []
+    for idx in range(count):
+        parts = [rng.choice(poems), "-", rng.choice(authors), rng.choice(markers)]
+        if idx % 3 == 0:
+            parts.append(f"| {rng.choice(markers)}")
+        titles.append(' '.join(part for part in parts if part))
+    views = [rng.choice([50, 500, 5000, 50000]) for _ in range(count)]
+    return titles, views
+
+
+def time_call(run: Callable[[], list]) -> Tuple[float, list]:
+    """
+    Time one classification pass.
+    
+    Args:
+        run: Callable classifying the whole corpus
+        
+    Returns:
+        Tuple of (elapsed seconds, results)
+    """
+    gc.collect()
+    start = time.perf_counter()
+    results = run()
+    return time.perf_counter() - start, results
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark de clasificación de títulos")
+    parser.add_argument("--size", type=int, default=100000)
+    args = parser.parse_args(argv)
+    
+    titles, views = title_corpus(args.size)
+    classifier = ContentClassifier()
+    
+    legacy_time, legacy = time_call(lambda: [legacy_classify(t, v) for t, v in zip(titles, views)])
+    single_time, single = time_call(lambda: [classifier.classify(t, view_count=v) for t, v in zip(titles, views)])
+    batch_time, batch = time_call(lambda: classifier.classify_batch(titles, views))
+    
+    mismatches = sum(1 for old, new in zip(legacy, batch) if Classification(*old) != new)
+    
+    print(f"\nClasificación de {args.size} títulos:")
+    print(f"{'Método':<28}{'Segundos':>10}{'Títulos/s':>14}")
+    print('-' * 52)
+    for label, elapsed in (("Actual (búsquedas por tabla)", legacy_time),
+                           ("ContentClassifier.classify", single_time),
+                           ("ContentClassifier (lote)", batch_time)):
+        print(f"{label:<28}{elapsed:>10.2f}{args.size / elapsed:>14.0f}")
+    print(f"\nResultados distintos al método actual: {mismatches}")
+    if single != batch:
+        print("Aviso: classify y classify_batch no coinciden")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Excel export benchmark: FileHandler.save_to_excel vs save_to_excel_fast.
+
+Usage:
+    python -m benchmarks.excel_benchmark [--sizes 1000 10000 100000]
+"""
+
+from typing import List, Dict, Optional
+import argparse
+import os
+import tempfile
+import time
+
+from src.models.poem import Poem
+from src.utils import FileHandler
+from benchmarks.search_benchmark import synthetic_poems
+
+
+def exported_poems(count: int) -> List[Poem]:
+    """
+    Build a synthetic catalogue with a realistic mix of search results.
+    
+    Args:
+        count: Number of poems
+        
+    Returns:
+        List of Poem objects
+    """
+    poems = synthetic_poems(count)
+    for poem in poems:
+        if poem.numero % 5 == 0:
+            continue
+        url = f"https://www.youtube.com/watch?v={poem.numero:011d}"
+        notas = f"Video: {poem.titulo} - {poem.autor} recitación completa"
+        if poem.numero % 7 == 0:
+            poem.mark_as_partial(url, "1:45", notas=notas, puntuacion=0.41)
+        else:
+            poem.mark_as_found(url, "3:20", "Recitación", notas=notas, puntuacion=0.87)
+    return poems
+
+
+def time_export(export, poems: List[Poem], filepath: str) -> float:
+    """
+    Time one export call.
+    
+    Args:
+        export: Export function taking (poems, filepath)
+        poems: Poems to export
+        filepath: Output filepath
+        
+    Returns:
+        Elapsed seconds
+    """
+    start = time.perf_counter()
+    if not export(poems, filepath):
+        raise RuntimeError(f"Export to {filepath} failed")
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, float]]:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark de exportación a Excel")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args(argv)
+    
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in args.sizes:
+            poems = exported_poems(size)
+            current = time_export(FileHandler.save_to_excel, poems, os.path.join(tmpdir, "current.xlsx"))
+            fast = time_export(FileHandler.save_to_excel_fast, poems, os.path.join(tmpdir, "fast.xlsx"))
+            results.append({'rows': size, 'current': current, 'fast': fast})
+            
+    print(f"\n{'Filas':>10}{'Actual (s)':>14}{'Rápido (s)':>14}{'Mejora':>10}")
+    print('-' * 48)
+    for row in results:
+        speedup = row['current'] / row['fast'] if row['fast'] else 0.0
+        print(f"{row['rows']:>10}{row['current']:>14.2f}{row['fast']:>14.2f}{speedup:>9.1f}x")
+    print()
+    return results
+
+
+if __name__ == "__main__":
+    main()
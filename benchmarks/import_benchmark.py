@@ -0,0 +1,162 @@
+"""
+Import-time budget check for the command line.
+
+Runs short invocations of main.py under `python -X importtime`, adds up
+the cumulative time of every module imported after interpreter startup,
+and fails (exit status 1) when a command goes over its budget or loads a
+heavy dependency it should not need.
+
+Usage:
+    python -m benchmarks.import_benchmark [--repeat 3] [--budget-ms 60]
+
+The --help and stats budgets are also enforced by tests/test_import_budget.py.
+"""
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+
+from src.models.poem import EXPORT_COLUMNS, Poem
+from src.utils import config
+
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+
+# Dependencies that only searches, exports and detailed statistics need
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'scrapetube', 'requests', 'aiohttp', 'sqlite3', 'multiprocessing')
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    Parse `-X importtime` output.
+    
+    Args:
+        stderr: Standard error of the process
+        
+    Returns:
+        (module, depth, cumulative microseconds) per imported module
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # Nested imports are indented by two spaces per level
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        modules.append((name.strip(), depth, int(cumulative)))
+    return modules
+
+
+def import_profile(argv: List[str], startup: Set[str]) -> Tuple[float, Set[str]]:
+    """
+    Measure the imports of one invocation of main.py.
+    
+    Args:
+        argv: Arguments for main.py
+        startup: Modules imported by a bare interpreter (not counted)
+        
+    Returns:
+        Tuple of (milliseconds spent importing, names of imported modules)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', MAIN_SCRIPT, *argv],
+        capture_output=True, text=True, cwd=os.path.dirname(MAIN_SCRIPT)
+    )
+    modules = parse_importtime(result.stderr)
+    total = sum(cumulative for name, depth, cumulative in modules if depth == 0 and name not in startup)
+    return total / 1000, {name for name, _, _ in modules}
+
+
+def startup_modules() -> Set[str]:
+    """Get the modules a bare interpreter imports."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'], capture_output=True, text=True)
+    return {name for name, _, _ in parse_importtime(result.stderr)}
+
+
+def write_sample_export(filepath: str, rows: int = 50):
+    """
+    Write a small export CSV for the stats command.
+    
+    Args:
+        filepath: Output filepath
+        rows: Number of poems
+    """
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        for idx in range(1, rows + 1):
+            poem = Poem(idx, f"Poema {idx}", f"Autor {idx % 7}", "1950", "Lírico")
+            poem.mark_as_found(f"https://www.youtube.com/watch?v=v{idx}", "3:05", "Recitación", puntuacion=0.8)
+            writer.writerow(poem.to_row())
+
+
+def measure_commands(
+    repeat: int = 3,
+    budget_ms: float = config.CLI_IMPORT_BUDGET_MS,
+    commands: Optional[Sequence[str]] = None
+) -> List[Dict[str, object]]:
+    """
+    Measure the import time and heavy imports of the light commands.
+    
+    Args:
+        repeat: Measurements per command (the fastest one is kept)
+        budget_ms: Import milliseconds allowed per command
+        commands: Labels of the commands to measure (defaults to all)
+        
+    Returns:
+        One dictionary per command with its label, import_ms, heavy
+        modules loaded and whether it is within the budget
+    """
+    startup = startup_modules()
+    with tempfile.TemporaryDirectory() as tmp:
+        sample = os.path.join(tmp, 'export.csv')
+        write_sample_export(sample)
+        cases = [
+            ("--help", ['--help']),
+            ("search --help", ['search', '--help']),
+            ("export --help", ['export', '--help']),
+            ("stats export.csv", ['stats', sample]),
+            ("merge --help", ['merge', '--help']),
+            ("runs --help", ['runs', '--help']),
+        ]
+        
+        results = []
+        for label, case_argv in cases:
+            if commands is not None and label not in commands:
+                continue
+            runs = [import_profile(case_argv, startup) for _ in range(max(1, repeat))]
+            millis = min(ms for ms, _ in runs)
+            heavy = sorted(module for module in HEAVY_MODULES if module in runs[0][1])
+            results.append({'command': label, 'import_ms': millis, 'heavy': heavy,
+                            'ok': millis <= budget_ms and not heavy})
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, object]]:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Presupuesto de tiempo de importación de la CLI")
+    parser.add_argument("--repeat", type=int, default=3, help="Mediciones por comando (se usa la mínima)")
+    parser.add_argument("--budget-ms", type=float, default=config.CLI_IMPORT_BUDGET_MS,
+                        help="Máximo de ms de importación por comando (por defecto: %(default)s)")
+    args = parser.parse_args(argv)
+    
+    results = measure_commands(args.repeat, args.budget_ms)
+    
+    print(f"\nTiempo de importación por comando (presupuesto {args.budget_ms:.0f} ms):")
+    print(f"{'Comando':<22}{'ms':>8}  {'Estado':<8}Dependencias pesadas")
+    print('-' * 66)
+    for result in results:
+        status = "OK" if result['ok'] else "EXCEDE"
+        print(f"{result['command']:<22}{result['import_ms']:>8.1f}  {status:<8}{', '.join(result['heavy']) or '-'}")
+    print()
+    
+    if not all(result['ok'] for result in results):
+        sys.exit(1)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Memory footprint of large catalogues: dict-backed Poem, slotted Poem and PoemTable.
+
+Usage:
+    python -m benchmarks.memory_benchmark [--size 100000]
+"""
+
+from dataclasses import dataclass, fields, MISSING
+from typing import Callable, List, Optional
+import argparse
+import gc
+import tracemalloc
+
+from src.models.poem import Poem
+from src.models.poem_table import PoemTable
+
+
+def _legacy_poem_class() -> type:
+    """
+    Rebuild Poem as a regular (non-slotted) dataclass, as it was before.
+    
+    Returns:
+        Dataclass with the same fields as Poem and a per-instance __dict__
+    """
+    namespace = {'__annotations__': {f.name: f.type for f in fields(Poem)}}
+    for f in fields(Poem):
+        if f.default is not MISSING:
+            namespace[f.name] = f.default
+    return dataclass(type('LegacyPoem', (), namespace))
+
+
+def catalogue_records(count: int) -> List[dict]:
+    """
+    Build field dictionaries for a processed catalogue.
+    
+    Args:
+        count: Number of poems
+        
+    Returns:
+        List of keyword-argument dictionaries for the Poem constructor
+    """
+    authors = [f"Autor {idx}" for idx in range(500)]
+    genres = ["Lírico", "Patriótico", "Social", "Amor", "N/A"]
+    records = []
+    for idx in range(1, count + 1):
+        record = {
+            'numero': idx,
+            'titulo': f"Poema {idx}",
+            'autor': authors[idx % len(authors)],
+            'año': "N/A",
+            'genero': genres[idx % len(genres)],
+        }
+        if idx % 4:
+            record.update({
+                'url_youtube': f"https://www.youtube.com/watch?v={idx:011d}",
+                'duracion': f"{idx % 9}:{idx % 60:02d}",
+                'tipo_contenido': "Recitación",
+                'calidad': "Buena",
+                'puntuacion': 0.8,
+                'notas': f"Video: Poema {idx} recitado",
+                'disponibilidad': "ENCONTRADO",
+            })
+        records.append(record)
+    return records
+
+
+def measure(build: Callable[[], object]) -> int:
+    """
+    Measure the memory retained by the object a callable builds.
+    
+    Args:
+        build: Callable returning the structure to measure
+        
+    Returns:
+        Bytes still allocated after building (the structure is kept alive)
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = build()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Memoria por catálogo de poemas")
+    parser.add_argument("--size", type=int, default=100000)
+    args = parser.parse_args(argv)
+    
+    # Field values are built up front so only the containers are measured
+    records = catalogue_records(args.size)
+    legacy_cls = _legacy_poem_class()
+    
+    results = [
+        ("Poem (dataclass con __dict__)", measure(lambda: [legacy_cls(**r) for r in records])),
+        ("Poem (slots)", measure(lambda: [Poem(**r) for r in records])),
+        ("PoemTable (columnar)", measure(lambda: PoemTable.from_poems(Poem(**r) for r in records))),
+    ]
+    
+    print(f"\nMemoria para {args.size} poemas (sin contar las cadenas compartidas):")
+    print(f"{'Representación':<32}{'MB':>10}{'Bytes/poema':>14}")
+    print('-' * 56)
+    for label, retained in results:
+        print(f"{label:<32}{retained / 2**20:>10.1f}{retained / args.size:>14.0f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Relevance check benchmark: title matching speed and accuracy.
+
+Builds candidate titles for the built-in catalogue: titles that name the
+poem (with accents dropped, changed case, plurals and the usual "poema
+recitado" decorations) and titles of other poems or unrelated videos.
+Times RelevanceIndex with the catalogue precomputed and with every
+profile built per check, and reports how many titles of each kind are
+accepted.
+
+Usage:
+    python -m benchmarks.relevance_benchmark [--size 100000]
+"""
+
+from typing import List, Optional, Tuple
+import argparse
+import gc
+import random
+import time
+
+from src.clients.ranking import normalize_text
+from src.clients.relevance import RelevanceIndex, similarity, title_profile
+from src.utils import config, get_poems_as_objects
+
+DECORATIONS = [
+    "{t}", "{t} - {a}", "{a} - {t} (poema recitado)", "Poema \"{t}\" | recitación",
+    "{t} de {a} | Declamación", "{T}", "{t} - versión completa HD", "Recital: {t}",
+]
+UNRELATED = [
+    "Himno Nacional Dominicano", "Merengue típico en vivo", "Clase de historia dominicana",
+    "Poesía dominicana para niños", "Recital de poesía en Santo Domingo", "Entrevista a {a}",
+]
+
+
+def candidate_corpus(count: int, seed: int = 11) -> List[Tuple[str, str, str, bool]]:
+    """
+    Build labelled (video title, poem title, author, relevant) cases.
+    
+    Args:
+        count: Number of cases
+        seed: Random seed
+        
+    Returns:
+        List of cases, half of them relevant
+    """
+    rng = random.Random(seed)
+    poems = get_poems_as_objects()
+    cases = []
+    for idx in range(count):
+        poem = rng.choice(poems)
+        if idx % 2 == 0:
+            title = poem.titulo
+            if rng.random() < 0.3:
+                title = normalize_text(title)
+            template = rng.choice(DECORATIONS)
+            video = template.format(t=title, T=title.upper(), a=poem.autor)
+            cases.append((video, poem.titulo, poem.autor, True))
+        else:
+            other = rng.choice(poems)
+            while other.titulo == poem.titulo:
+                other = rng.choice(poems)
+            if rng.random() < 0.5:
+                video = f"{other.titulo} - {other.autor}"
+            else:
+                video = rng.choice(UNRELATED).format(a=poem.autor)
+            cases.append((video, poem.titulo, poem.autor, False))
+    return cases
+
+
+def uncached_score(index: RelevanceIndex, video: str, titulo: str, autor: str) -> float:
+    """Score a case building every profile on the spot (no precomputed catalogue)."""
+    found = title_profile(video)
+    title = similarity(title_profile(titulo), found)
+    if title == 1.0:
+        return title
+    author = similarity(title_profile(autor), found)
+    return max(title, (1 - index.AUTHOR_WEIGHT) * title + index.AUTHOR_WEIGHT * author)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark de la comprobación de relevancia de títulos")
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--min-score", type=float, default=config.RELEVANCE_MIN_SCORE)
+    args = parser.parse_args(argv)
+    
+    cases = candidate_corpus(args.size)
+    index = RelevanceIndex(min_score=args.min_score)
+    index.register(text for poem in get_poems_as_objects() for text in (poem.titulo, poem.autor))
+    
+    gc.collect()
+    start = time.perf_counter()
+    cold = [uncached_score(index, video, titulo, autor) for video, titulo, autor, _ in cases]
+    cold_time = time.perf_counter() - start
+    
+    gc.collect()
+    start = time.perf_counter()
+    accepted = [index.is_relevant(video, titulo, autor) for video, titulo, autor, _ in cases]
+    warm_time = time.perf_counter() - start
+    
+    mismatches = sum(1 for score, ok in zip(cold, accepted) if (score >= args.min_score) != ok)
+    relevant = [ok for ok, case in zip(accepted, cases) if case[3]]
+    unrelated = [ok for ok, case in zip(accepted, cases) if not case[3]]
+    
+    print(f"\nComprobación de relevancia de {args.size} candidatos:")
+    print(f"{'Método':<30}{'Segundos':>10}{'Candidatos/s':>15}")
+    print('-' * 55)
+    for label, elapsed in (("Perfiles por comprobación", cold_time),
+                           ("Catálogo precalculado", warm_time)):
+        print(f"{label:<30}{elapsed:>10.2f}{args.size / elapsed:>15.0f}")
+    print(f"\nAceptados que nombran el poema: {sum(relevant) / len(relevant) * 100:.1f}%")
+    print(f"Aceptados de otros poemas o sin relación: {sum(unrelated) / len(unrelated) * 100:.1f}%")
+    if mismatches:
+        print(f"Aviso: {mismatches} resultados distintos entre ambos métodos")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Result store benchmark: write throughput and export from the store.
+
+Records a synthetic catalogue (with candidates) from several threads,
+committing every poem vs. committing in batches, then exports the stored
+run to CSV and checks it against the export of the in-memory list.
+
+Usage:
+    python -m benchmarks.result_store_benchmark [--size 100000] [--workers 4]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import argparse
+import filecmp
+import os
+import tempfile
+import time
+
+from src.clients.candidate import VideoCandidate
+from src.models.poem import Poem
+from src.utils import FileHandler, ResultStore, config
+from benchmarks.excel_benchmark import exported_poems
+
+
+def poem_candidates(poem: Poem, count: int) -> List[VideoCandidate]:
+    """Build the candidates a search could have scored for a poem."""
+    return [
+        VideoCandidate(
+            video_id=f"{poem.numero:08d}{rank:03d}", title=f"{poem.titulo} - {poem.autor} ({rank})",
+            length_seconds=200, duration="3:20", channel="Canal", type="Recitación", quality="Buena",
+            score=1.0 - rank / 10, pattern="{titulo} {autor} poema"
+        )
+        for rank in range(count)
+    ]
+
+
+def run_mode(poems: List[Poem], filepath: str, batch_size: int, workers: int) -> Dict[str, object]:
+    """
+    Record a whole run into a new store.
+    
+    Args:
+        poems: Processed poems
+        filepath: SQLite file to create
+        batch_size: Poems per transaction
+        workers: Threads recording poems at once
+        
+    Returns:
+        Dictionary with timing and commit figures
+    """
+    store = ResultStore(filepath, batch_size=batch_size)
+    candidates = {poem.numero: poem_candidates(poem, store.candidates_per_poem) for poem in poems}
+    
+    def record(chunk: List[Poem]):
+        for poem in chunk:
+            store.add_candidates(poem, candidates[poem.numero])
+            store.record(poem)
+    
+    start = time.perf_counter()
+    store.start_run(poems, label="benchmark")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(record, (poems[idx::workers] for idx in range(workers))))
+    store.finish_run(poems)
+    elapsed = time.perf_counter() - start
+    store.close()
+    return {
+        'label': f"Lote de {batch_size}",
+        'seconds': elapsed,
+        'poems_per_sec': len(poems) / elapsed if elapsed else 0.0,
+        'commits': store.commits,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, object]]:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark de la base de resultados (SQLite)")
+    parser.add_argument("--size", type=int, default=20000, help="Poemas por ejecución")
+    parser.add_argument("--workers", type=int, default=config.MAX_WORKERS, help="Hilos escribiendo a la vez")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, config.RESULT_STORE_BATCH_SIZE],
+                        help="Poemas por transacción a comparar")
+    args = parser.parse_args(argv)
+    
+    poems = exported_poems(args.size)
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for batch_size in args.batch_sizes:
+            filepath = os.path.join(tmpdir, f"batch{batch_size}.db")
+            results.append(run_mode(poems, filepath, batch_size, args.workers))
+            
+        # Export the last stored run and compare with the in-memory export
+        store = ResultStore(filepath)
+        view = store.view(store.runs(1)[0].id)
+        memory_csv, stored_csv = os.path.join(tmpdir, "memory.csv"), os.path.join(tmpdir, "stored.csv")
+        start = time.perf_counter()
+        FileHandler.save_to_csv(poems, memory_csv)
+        memory_time = time.perf_counter() - start
+        start = time.perf_counter()
+        FileHandler.save_to_csv(view, stored_csv)
+        stored_time = time.perf_counter() - start
+        same = filecmp.cmp(memory_csv, stored_csv, shallow=False)
+        store.close()
+        
+    print(f"\nEscritura de {args.size} poemas desde {args.workers} hilos:")
+    print(f"{'Modo':<20}{'Segundos':>10}{'Poemas/s':>12}{'Commits':>10}")
+    print('-' * 52)
+    for row in results:
+        print(f"{row['label']:<20}{row['seconds']:>10.2f}{row['poems_per_sec']:>12.0f}{row['commits']:>10}")
+    print(f"\nCSV desde la lista: {memory_time:.2f} s, desde la base: {stored_time:.2f} s "
+          f"({'idénticos' if same else 'DISTINTOS'})\n")
+    return results
+
+
+if __name__ == "__main__":
+    main()
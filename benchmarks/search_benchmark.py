@@ -0,0 +1,174 @@
+"""
+Throughput benchmark for PoemService.process_multiple_poems.
+
+Runs entirely offline against FixtureBackend, over the built-in
+DOMINICAN_POEMS dataset and a synthetic catalogue, and reports poems/sec,
+queries per poem and p50/p95 per-poem latency.
+
+Usage:
+    python -m benchmarks.search_benchmark [--latency 0.05] [--workers 4]
+"""
+
+from typing import List, Dict, Optional
+import argparse
+import contextlib
+import io
+import math
+import threading
+import time
+
+from src.clients import YouTubeClient, RateLimiter, FixtureBackend
+from src.models.poem import Poem
+from src.services import PoemService
+from src.utils import config, get_poems_as_objects
+
+
+def synthetic_poems(count: int) -> List[Poem]:
+    """
+    Build a synthetic catalogue of poems.
+    
+    Args:
+        count: Number of poems to generate
+        
+    Returns:
+        List of Poem objects
+    """
+    return [
+        Poem(
+            numero=idx,
+            titulo=f"Poema Sintético {idx}",
+            autor=f"Autor {idx % 250}",
+            año="N/A",
+            genero="Lírico" if idx % 3 else "N/A"
+        )
+        for idx in range(1, count + 1)
+    ]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of a list of values.
+    
+    Args:
+        values: Sample values
+        fraction: Percentile as a fraction (0.5 for p50)
+        
+    Returns:
+        Percentile value (0.0 for an empty sample)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_benchmark(
+    label: str,
+    poems: List[Poem],
+    backend: FixtureBackend,
+    max_workers: int
+) -> Dict[str, float]:
+    """
+    Time process_multiple_poems over a poem list.
+    
+    The client is built without cache and with an effectively unlimited
+    rate limiter so only the search path itself is measured.
+    
+    Args:
+        label: Name shown in the report
+        poems: Poems to process
+        backend: Offline backend to search against
+        max_workers: Worker pool size passed to the service
+        
+    Returns:
+        Dictionary with throughput and latency figures
+    """
+    client = YouTubeClient(
+        videos_per_search=config.VIDEOS_PER_SEARCH,
+        rate_limiter=RateLimiter(rate=1e9, burst=10**9),
+        backend=backend
+    )
+    service = PoemService(client)
+    
+    latencies = []
+    latencies_lock = threading.Lock()
+    process_poem = service.process_poem
+    
+    def timed_process_poem(poem: Poem, verbose: bool = True):
+        start = time.perf_counter()
+        try:
+            return process_poem(poem, verbose)
+        finally:
+            elapsed = time.perf_counter() - start
+            with latencies_lock:
+                latencies.append(elapsed)
+                
+    service.process_poem = timed_process_poem
+    
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        service.process_multiple_poems(poems, show_progress=False, max_workers=max_workers)
+    elapsed = time.perf_counter() - start
+    
+    return {
+        'label': label,
+        'poems': len(poems),
+        'seconds': elapsed,
+        'poems_per_sec': len(poems) / elapsed if elapsed else 0.0,
+        'queries_per_poem': client.query_count / len(poems) if poems else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+    }
+
+
+def print_report(results: List[Dict[str, float]]):
+    """
+    Print benchmark results as a table.
+    
+    Args:
+        results: Rows returned by run_benchmark
+    """
+    print(f"\n{'Dataset':<22}{'Poemas':>8}{'Seg.':>9}{'Poemas/s':>11}{'Q/poema':>9}{'p50 ms':>9}{'p95 ms':>9}")
+    print('-' * 77)
+    for row in results:
+        print(
+            f"{row['label']:<22}{row['poems']:>8}{row['seconds']:>9.2f}{row['poems_per_sec']:>11.1f}"
+            f"{row['queries_per_poem']:>9.2f}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+        )
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, float]]:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark offline del motor de búsqueda")
+    parser.add_argument("--fixtures", help="JSON de resultados grabados (por defecto: resultados sintéticos)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latencia inyectada por consulta (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latencia aleatoria adicional máxima (s)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probabilidad de fallo por consulta")
+    parser.add_argument("--workers", type=int, default=config.MAX_WORKERS, help="Búsquedas en paralelo")
+    parser.add_argument("--synthetic-size", type=int, default=10000, help="Tamaño del catálogo sintético")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    def make_backend() -> FixtureBackend:
+        return FixtureBackend(
+            args.fixtures,
+            latency=args.latency,
+            latency_jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            synthesize_missing=True,
+            seed=args.seed
+        )
+        
+    results = [
+        run_benchmark("DOMINICAN_POEMS", get_poems_as_objects(), make_backend(), args.workers),
+        run_benchmark(f"Sintético {args.synthetic_size}", synthetic_poems(args.synthetic_size),
+                      make_backend(), args.workers),
+    ]
+    print_report(results)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -5,72 +5,793 @@ Poems Eater - Dominican Poetry Recitation Finder
 Searches for Dominican poetry recitations on YouTube
 """
 
-from src.clients import YouTubeClient
-from src.services import PoemService
-from src.utils import config, FileHandler, get_poems_as_objects
+import argparse
+import os
+import sys
 
+# Only config is imported up front; every command imports what it needs,
+# so `--help` and the light commands never load the search stack,
+# openpyxl or pandas
+from src.utils import config
 
-def main() -> None:
-    """Main entry point for the application."""
+
+# Subcommands (a search runs when none is given)
+COMMANDS = ('search', 'export', 'stats', 'merge', 'runs', 'bench')
+
+# Benchmarks runnable with `bench NAME` -> module
+BENCHMARKS = {
+    'async': 'benchmarks.async_search_benchmark',
+    'classifier': 'benchmarks.classifier_benchmark',
+    'excel': 'benchmarks.excel_benchmark',
+    'imports': 'benchmarks.import_benchmark',
+    'memory': 'benchmarks.memory_benchmark',
+    'relevance': 'benchmarks.relevance_benchmark',
+    'search': 'benchmarks.search_benchmark',
+    'store': 'benchmarks.result_store_benchmark',
+}
+
+
+def shard_argument(text: str):
+    """Parse --shard i/N for argparse."""
+    from src.services.sharding import parse_shard
     
-    print(f"\n{'='*70}")
-        print("Poems Eater - Buscador de Recitaciones de Poemas Dominicanos")
-    print(f"{'='*70}\n")
+    try:
+        return parse_shard(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def add_search_arguments(parser: argparse.ArgumentParser):
+    """Add the options of the search command."""
+    parser.add_argument(
+        "--input",
+        nargs="+",
+        metavar="ARCHIVO",
+        help="Catálogos de poemas a cargar (.txt, .csv, .jsonl, .xlsx), en orden"
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="No usar la caché de búsquedas (todas las consultas van a la red)"
+    )
+    cache_group.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignorar los resultados en caché y reemplazarlos con búsquedas nuevas"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=config.RATE_LIMIT_PER_SECOND,
+        help="Máximo de búsquedas por segundo (por defecto: %(default)s)"
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=config.RATE_LIMIT_BURST,
+        help="Búsquedas permitidas en ráfaga antes de limitar (por defecto: %(default)s)"
+    )
+    backend_group = parser.add_mutually_exclusive_group()
+    backend_group.add_argument(
+        "--fixtures",
+        metavar="ARCHIVO",
+        help="Reproducir resultados grabados desde un JSON en lugar de buscar en YouTube"
+    )
+    backend_group.add_argument(
+        "--record-fixtures",
+        metavar="ARCHIVO",
+        help="Grabar los resultados de búsqueda en un JSON reproducible con --fixtures"
+    )
+    parser.add_argument(
+        "--async-search",
+        action="store_true",
+        help="Buscar con el cliente asíncrono (conexiones HTTP reutilizadas, requiere aiohttp)"
+    )
+    parser.add_argument(
+        "--lazy-search",
+        action="store_true",
+        help="Descargar las páginas de resultados de una en una y parar al tener suficientes candidatos"
+    )
+    parser.add_argument(
+        "--page-budget",
+        type=int,
+        default=config.SEARCH_PAGE_BUDGET,
+        metavar="N",
+        help="Máximo de páginas por consulta con --lazy-search (por defecto: %(default)s)"
+    )
+    parser.add_argument(
+        "--no-planner",
+        action="store_true",
+        help="Usar siempre el orden fijo de patrones de búsqueda"
+    )
+    parser.add_argument(
+        "--planner-stats",
+        nargs="?",
+        const="",
+        metavar="AUTOR",
+        help="Mostrar la tabla de aciertos por patrón (global o de un autor) y salir"
+    )
+    parser.add_argument(
+        "--stream",
+        metavar="ARCHIVO",
+        help="Escribir cada poema al terminar en un CSV o JSON Lines (.jsonl)"
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help=f"No guardar la ejecución en la base de resultados '{config.RESULTS_DB}'"
+    )
+    parser.add_argument(
+        "--stats-parquet",
+        metavar="DIRECTORIO",
+        help="Guardar las tablas de estadísticas como archivos Parquet (requiere pyarrow)"
+    )
+    parser.add_argument(
+        "--refresh-from",
+        metavar="ARCHIVO",
+        help="Reutilizar los resultados encontrados de una exportación anterior (.csv, .jsonl, .xlsx)"
+    )
+    parser.add_argument(
+        "--refresh-max-age",
+        type=float,
+        default=config.REFRESH_MAX_AGE_DAYS,
+        metavar="DIAS",
+        help="Volver a buscar resultados más antiguos que esto (por defecto: %(default)s días)"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=config.PROFILE_FILE,
+        metavar="ARCHIVO",
+        help=f"Medir la ejecución y guardar el perfil en JSON (por defecto: {config.PROFILE_FILE})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Reanudar una ejecución interrumpida usando '{config.CHECKPOINT_FILE}'"
+    )
+    shard_group = parser.add_mutually_exclusive_group()
+    shard_group.add_argument(
+        "--shards",
+        type=int,
+        metavar="N",
+        help="Dividir el catálogo en N shards y buscarlos en N procesos a la vez"
+    )
+    shard_group.add_argument(
+        "--shard",
+        type=shard_argument,
+        metavar="i/N",
+        help="Buscar solo el shard i de N (para repartir entre máquinas y unir con 'merge')"
+    )
+
+
+def add_files_argument(parser: argparse.ArgumentParser, help: str):
+    """Add the input files and --stats-parquet of the file commands."""
+    parser.add_argument("files", nargs="+", metavar="ARCHIVO", help=help)
+    parser.add_argument(
+        "--stats-parquet",
+        metavar="DIRECTORIO",
+        help="Guardar las tablas de estadísticas como archivos Parquet (requiere pyarrow)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        description="Busca recitaciones de poemas dominicanos en YouTube",
+        epilog="Sin COMANDO se ejecuta 'search' (p. ej. 'main.py --resume')."
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMANDO")
     
-    # Try to load poems from file first
-        poems = FileHandler.load_poems_from_file(config.POEMS_FILE)
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Buscar recitaciones en YouTube y exportar los resultados (por defecto)"
+    )
+    add_search_arguments(search_parser)
     
-    if poems:
-            print(f"Cargados {len(poems)} poemas desde '{config.POEMS_FILE}'")
-    else:
-        # Use predefined dataset
-            print(f"Usando dataset predefinido de poesía dominicana")
-        poems = get_poems_as_objects()
-            print(f"{len(poems)} poemas en el dataset")
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Convertir exportaciones o catálogos (.csv, .jsonl, .xlsx) a Excel y CSV"
+    )
+    add_files_argument(export_parser, "Archivos a exportar, en orden")
+    export_parser.add_argument(
+        "--excel",
+        default=config.OUTPUT_FILE,
+        metavar="ARCHIVO",
+        help="Archivo Excel de salida (por defecto: %(default)s)"
+    )
+    export_parser.add_argument(
+        "--csv",
+        default=config.OUTPUT_CSV,
+        metavar="ARCHIVO",
+        help="Archivo CSV de salida (por defecto: %(default)s)"
+    )
     
-    print(f"\n{'='*70}")
-    print("Iniciando búsqueda en YouTube...")
-    print(f"{'='*70}\n")
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Mostrar las estadísticas de una exportación sin buscar"
+    )
+    add_files_argument(stats_parser, "Exportaciones a analizar (.csv, .jsonl, .xlsx)")
+    stats_parser.add_argument(
+        "--tables",
+        action="store_true",
+        help="Mostrar también las tablas por autor, género y duración (requiere pandas)"
+    )
+    
+    root, ext = os.path.splitext(config.SHARD_RESULTS_FILE)
+    merge_parser = subparsers.add_parser(
+        "merge",
+        help="Unir los resultados de ejecuciones con --shard en las salidas habituales"
+    )
+    add_files_argument(merge_parser, f"Resultados de shard ('{root}.shard-1-of-4{ext}', ...)")
+    
+    runs_parser = subparsers.add_parser(
+        "runs",
+        help="Listar las ejecuciones guardadas, ver la historia de un poema o exportar una ejecución"
+    )
+    runs_parser.add_argument(
+        "--db",
+        default=config.RESULTS_DB,
+        metavar="ARCHIVO",
+        help="Base de resultados (por defecto: %(default)s)"
+    )
+    runs_parser.add_argument("--limit", type=int, default=20, help="Ejecuciones a listar (por defecto: %(default)s)")
+    runs_group = runs_parser.add_mutually_exclusive_group()
+    runs_group.add_argument(
+        "--poem",
+        metavar="TÍTULO",
+        help="Mostrar el resultado de un poema en cada ejecución (acepta 'Título | Autor')"
+    )
+    runs_group.add_argument(
+        "--export",
+        type=int,
+        metavar="ID",
+        help="Exportar una ejecución guardada a Excel y CSV"
+    )
+    runs_parser.add_argument(
+        "--excel",
+        default=config.OUTPUT_FILE,
+        metavar="ARCHIVO",
+        help="Archivo Excel de salida con --export (por defecto: %(default)s)"
+    )
+    runs_parser.add_argument(
+        "--csv",
+        default=config.OUTPUT_CSV,
+        metavar="ARCHIVO",
+        help="Archivo CSV de salida con --export (por defecto: %(default)s)"
+    )
+    
+    bench_parser = subparsers.add_parser("bench", help="Ejecutar un benchmark")
+    bench_parser.add_argument("name", choices=sorted(BENCHMARKS), help="Benchmark a ejecutar")
+    bench_parser.add_argument(
+        "bench_args",
+        nargs=argparse.REMAINDER,
+        metavar="...",
+        help="Opciones del benchmark (ver 'bench NOMBRE --help')"
+    )
+    return parser
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed arguments
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Without a command, run a search (keeps existing invocations working)
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ('-h', '--help')):
+        argv.insert(0, 'search')
+        
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'search':
+        if args.shards is not None and args.shards < 1:
+            parser.error("--shards debe ser al menos 1")
+        if args.shards and args.record_fixtures:
+            parser.error("--record-fixtures no se puede usar con --shards")
+        if args.shards and args.profile:
+            parser.error("--profile no se puede usar con --shards")
+        if args.page_budget < 1:
+            parser.error("--page-budget debe ser al menos 1")
+    return args
+
+
+def run_search(
+    poems: list,
+    args: argparse.Namespace,
+    planner,
+    profiler,
+    shard=None,
+    store=None
+) -> tuple:
+    """
+    Search the poems in this process.
+    
+    Args:
+        poems: Poems to search
+        args: Parsed command line arguments
+        planner: Optional query planner
+        profiler: RunProfiler or NULL_PROFILER
+        shard: Optional (shard number, total shards) whose files are used
+        store: Optional ResultStore the run is written to
+        
+    Returns:
+        Tuple of (processed poems, statistics dictionary)
+    """
+    from src.clients import (
+        YouTubeClient, SearchCache, RateLimiter, ScrapetubeBackend, FixtureBackend, RecordingBackend,
+        AsyncSearchBackend
+    )
+    from src.services import PoemService, RefreshIndex, shard_path
+    from src.utils import CheckpointJournal, StreamWriter
+    
+    # Open the persistent search cache unless disabled
+    cache = None
+    if not args.no_cache:
+        cache = SearchCache(
+            config.CACHE_FILE,
+            ttl_seconds=config.CACHE_TTL_HOURS * 3600,
+            max_entries=config.CACHE_MAX_ENTRIES,
+            refresh=args.refresh_cache,
+            busy_timeout=config.CACHE_BUSY_TIMEOUT_SECONDS
+        )
+        
+    # One limiter shared by every search worker
+    rate_limiter = RateLimiter(
+        rate=args.rate,
+        burst=args.burst,
+        min_rate=config.RATE_LIMIT_MIN_PER_SECOND
+    )
+    
+    # Choose where search results come from
+    live_backend = AsyncSearchBackend() if args.async_search else ScrapetubeBackend()
+    if args.fixtures:
+        backend = FixtureBackend(args.fixtures)
+    elif args.record_fixtures:
+        backend = RecordingBackend(live_backend)
+    else:
+        backend = live_backend
     
     # Initialize YouTube client (no API key needed!)
-    youtube_client = YouTubeClient(videos_per_search=config.VIDEOS_PER_SEARCH)
-        print("Cliente de YouTube inicializado (sin límites de API!)\n")
+    youtube_client = YouTubeClient(
+        videos_per_search=config.VIDEOS_PER_SEARCH,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        backend=backend,
+        planner=planner,
+        page_budget=args.page_budget if args.lazy_search else 0,
+        profiler=profiler
+    )
+    print("Cliente de YouTube inicializado (sin límites de API!)\n")
     
     # Initialize service
     poem_service = PoemService(youtube_client)
     
+    # Previous export whose fresh results are reused
+    refresh = None
+    if args.refresh_from:
+        refresh = RefreshIndex.from_export(args.refresh_from, max_age_days=args.refresh_max_age)
+        print(f"Exportación anterior: {len(refresh)} poemas en '{args.refresh_from}'\n")
+    
+    # Each shard keeps its own journal and stream file
+    checkpoint_file = shard_path(config.CHECKPOINT_FILE, *shard) if shard else config.CHECKPOINT_FILE
+    stream_file = shard_path(args.stream, *shard) if shard and args.stream else args.stream
+    
+    # Journal every processed poem so the run can be resumed
+    checkpoint = CheckpointJournal(checkpoint_file, resume=args.resume)
+    
+    # Optionally stream rows to downstream consumers as poems complete
+    writer = StreamWriter(stream_file) if stream_file else None
+    
+    # Record the run in the result store as poems complete
+    if store:
+        store.start_run(poems, label=' '.join(sys.argv[1:]))
+    
     # Process all poems
-    poems, stats = poem_service.process_multiple_poems(poems)
+    try:
+        with profiler.timer('search'):
+            poems, stats = poem_service.process_multiple_poems(
+                poems,
+                checkpoint=checkpoint,
+                writer=writer,
+                refresh=refresh,
+                store=store
+            )
+        if store:
+            store.finish_run(poems)
+        return poems, stats
+    finally:
+        checkpoint.close()
+        if writer:
+            writer.close()
+        if cache:
+            cache.close()
+        if planner:
+            planner.save()
+        backend.close()
+        if args.record_fixtures:
+            backend.save(args.record_fixtures)
+            print(f"Resultados grabados en '{args.record_fixtures}'")
+
+
+def save_results(
+    poems: list,
+    stats: dict,
+    args: argparse.Namespace,
+    profiler,
+    output_file: str = config.OUTPUT_FILE,
+    output_csv: str = config.OUTPUT_CSV,
+    store=None
+):
+    """
+    Export processed poems to Excel and CSV and print the statistics.
     
-    if poems:
-        print(f"\n{'='*70}")
-            print("Guardando resultados...")
-        print(f"{'='*70}\n")
+    Args:
+        poems: Processed poems
+        stats: Statistics dictionary
+        args: Parsed command line arguments
+        profiler: RunProfiler or NULL_PROFILER
+        output_file: Excel output filepath
+        output_csv: CSV output filepath
+        store: Optional ResultStore holding the run; the Excel and CSV
+            files are then streamed from it
+    """
+    from src.services import PoemService, StatisticsEngine
+    
+    print(f"\n{'='*70}")
+    print("Guardando resultados...")
+    print(f"{'='*70}\n")
+    
+    # Vectorized statistics tables (extra sheets / Parquet)
+    with profiler.timer('statistics'):
+        statistics = StatisticsEngine.from_poems(poems)
+        stats_sheets = statistics.excel_sheets() if config.EXCEL_STATS_SHEETS else None
+        if args.stats_parquet:
+            statistics.export_parquet(args.stats_parquet)
+    
+    # The statistics sheets are written into the same workbook as the poems
+    export_files(store.view() if store else poems, output_file, output_csv, profiler, stats_sheets)
+    
+    # Print statistics
+    PoemService.print_statistics(stats)
+    statistics.print_summary()
+    print()
+    
+    print(f"Archivos generados:")
+    print(f"   - {output_file}")
+    print(f"   - {output_csv}")
+    if store:
+        print(f"   - {store.filepath} (ejecución {store.run_id})")
+
+
+def export_files(poems, output_file: str, output_csv: str, profiler, extra_sheets=None):
+    """
+    Write the Excel and CSV exports.
+    
+    Args:
+        poems: Poems list, PoemTable or StoredRun
+        output_file: Excel output filepath
+        output_csv: CSV output filepath
+        profiler: RunProfiler or NULL_PROFILER
+        extra_sheets: Optional sheet name -> rows added to the Excel file
+    """
+    from src.utils import FileHandler
+    
+    # Save to Excel (streaming writer for large catalogues)
+    with profiler.timer('export_excel'):
+        if len(poems) >= config.EXCEL_FAST_EXPORT_MIN_ROWS:
+            FileHandler.save_to_excel_fast(
+                poems,
+                output_file,
+                rows_per_sheet=config.EXCEL_ROWS_PER_SHEET,
+                extra_sheets=extra_sheets
+            )
+        else:
+            FileHandler.save_to_excel(poems, output_file, extra_sheets)
         
-        # Save to Excel
-        FileHandler.save_to_excel(poems, config.OUTPUT_FILE)
+    # Optionally save to CSV
+    with profiler.timer('export_csv'):
+        FileHandler.save_to_csv(poems, output_csv)
+
+
+def merge_command(args: argparse.Namespace) -> None:
+    """
+    Merge the results of --shard runs into the usual outputs.
+    
+    Args:
+        args: Parsed command line arguments (merge command)
+    """
+    from src.services import merge_results, missing_shards, load_shard_result
+    from src.utils import NULL_PROFILER
+    
+    results = []
+    for filepath in args.files:
+        try:
+            results.append(load_shard_result(filepath))
+        except (OSError, ValueError) as e:
+            print(f"No se pudo leer '{filepath}': {e}")
+            return
+            
+    try:
+        missing = missing_shards(results)
+    except ValueError as e:
+        print(f"No se pueden unir los resultados: {e}")
+        return
+    if missing:
+        print(f"Aviso: faltan los shards {', '.join(map(str, missing))}; se unen los disponibles")
         
-        # Optionally save to CSV
-        FileHandler.save_to_csv(poems, config.OUTPUT_CSV)
+    poems, stats = merge_results(results)
+    print(f"Unidos {len(poems)} poemas de {len(results)} shards")
+    if poems:
+        save_results(poems, stats, args, NULL_PROFILER)
+    else:
+        print("\nNo se procesaron poemas")
+
+
+def export_command(args: argparse.Namespace) -> None:
+    """
+    Re-export previous exports or catalogues to Excel and CSV.
+    
+    Args:
+        args: Parsed command line arguments (export command)
+    """
+    from src.models.poem_table import PoemTable
+    from src.services import PoemService
+    from src.utils import PoemLoader, NULL_PROFILER
+    
+    loader = PoemLoader()
+    poems = loader.load(args.files)
+    loader.report.print_summary()
+    if not poems:
+        print("\nNo se cargó ningún poema de los archivos indicados")
+        return
         
-        # Print statistics
-        poem_service.print_statistics(stats)
+    stats = PoemService.statistics_from_table(PoemTable.from_poems(poems))
+    save_results(poems, stats, args, NULL_PROFILER, output_file=args.excel, output_csv=args.csv)
+
+
+def stats_command(args: argparse.Namespace) -> None:
+    """
+    Print the statistics of previous exports without searching.
+    
+    Args:
+        args: Parsed command line arguments (stats command)
+    """
+    from src.services import PoemService
+    from src.utils import PoemLoader
+    
+    loader = PoemLoader()
+    table = loader.load_table(args.files)
+    loader.report.print_summary()
+    if not len(table):
+        print("\nNo se cargó ningún poema de los archivos indicados")
+        return
         
-            print(f"Archivos generados:")
-        print(f"   - {config.OUTPUT_FILE}")
-        print(f"   - {config.OUTPUT_CSV}")
+    PoemService.print_statistics(PoemService.statistics_from_table(table))
+    
+    # pandas is only imported for the detailed tables
+    if args.tables or args.stats_parquet:
+        from src.services import StatisticsEngine
         
-    else:
+        statistics = StatisticsEngine.from_poems(table)
+        if args.tables:
+            statistics.print_summary()
+        if args.stats_parquet:
+            statistics.export_parquet(args.stats_parquet)
+
+
+def runs_command(args: argparse.Namespace) -> None:
+    """
+    List stored runs, show a poem's results across runs or export a run.
+    
+    Args:
+        args: Parsed command line arguments (runs command)
+    """
+    from src.utils import ResultStore, NULL_PROFILER
+    
+    if not os.path.exists(args.db):
+        print(f"No existe la base de resultados '{args.db}'")
+        return
+    store = ResultStore(args.db)
+    try:
+        if args.export is not None:
+            view = store.view(args.export)
+            if not len(view):
+                print(f"La ejecución {args.export} no tiene poemas guardados")
+                return
+            export_files(view, args.excel, args.csv, NULL_PROFILER)
+            print(f"Ejecución {args.export} exportada ({len(view)} poemas):")
+            print(f"   - {args.excel}")
+            print(f"   - {args.csv}")
+            
+        elif args.poem:
+            titulo, _, autor = (part.strip() for part in args.poem.partition('|'))
+            history = store.history(titulo, autor or None)
+            if not history:
+                print(f"'{args.poem}' no aparece en ninguna ejecución guardada")
+            for poem_titulo, poem_autor, results in history:
+                print(f"\n{poem_titulo} - {poem_autor}")
+                for result in results:
+                    print(f"   #{result.run_id:<5}{result.started_at:<22}{result.disponibilidad:<16}"
+                          f"{result.puntuacion:>6.3f}  {result.url_youtube}")
+            
+        else:
+            runs = store.runs(args.limit)
+            if not runs:
+                print(f"No hay ejecuciones guardadas en '{args.db}'")
+                return
+            print(f"\n{'ID':>5}  {'Inicio':<20}{'Poemas':>8}{'Encontr.':>10}{'Parciales':>11}{'No encontr.':>13}  Comando")
+            print('-' * 90)
+            for run in runs:
+                state = "" if run.finished_at else " (sin terminar)"
+                print(f"{run.id:>5}  {run.started_at:<20}{run.total:>8}{run.found:>10}{run.partial:>11}"
+                      f"{run.not_found:>13}  {run.label or 'search'}{state}")
+            print()
+    finally:
+        store.close()
+
+
+def bench_command(args: argparse.Namespace) -> None:
+    """
+    Run one of the benchmarks.
+    
+    Args:
+        args: Parsed command line arguments (bench command)
+    """
+    from importlib import import_module
+    
+    module = import_module(BENCHMARKS[args.name])
+    module.main(args.bench_args)
+
+
+def search_command(args: argparse.Namespace) -> None:
+    """
+    Search YouTube for every poem and export the results.
+    
+    Args:
+        args: Parsed command line arguments (search command)
+    """
+    from src.clients import QueryPlanner
+    from src.services import ShardedRunner, ShardOptions, ShardResult, select_shard, shard_path, save_shard_result
+    from src.utils import FileHandler, PoemLoader, ResultStore, get_poems_as_objects, RunProfiler, NULL_PROFILER
+    
+    planner = None
+    if not args.no_planner:
+        planner = QueryPlanner(
+            config.PLANNER_STATS_FILE,
+            min_attempts=config.PLANNER_MIN_ATTEMPTS,
+            prune_below=config.PLANNER_PRUNE_BELOW
+        )
+    
+    if args.planner_stats is not None:
+        if planner:
+            print(planner.format_table(args.planner_stats or None))
+        return
+    
+    # Instrumentation (no-op unless --profile is given)
+    profiler = RunProfiler() if args.profile else NULL_PROFILER
+    
+    print(f"\n{'='*70}")
+    print("Poems Eater - Buscador de Recitaciones de Poemas Dominicanos")
+    print(f"{'='*70}\n")
+    
+    with profiler.timer('load'):
+        if args.input:
+            # Explicit catalogues: report every rejected line
+            loader = PoemLoader()
+            poems = loader.load(args.input)
+            loader.report.print_summary()
+            if not poems:
+                print("\nNo se cargó ningún poema de los archivos indicados")
+                return
+        else:
+            # Try to load poems from file first
+            poems = FileHandler.load_poems_from_file(config.POEMS_FILE)
+            
+            if poems:
+                print(f"Cargados {len(poems)} poemas desde '{config.POEMS_FILE}'")
+            else:
+                # Use predefined dataset
+                print(f"Usando dataset predefinido de poesía dominicana")
+                poems = get_poems_as_objects()
+                print(f"{len(poems)} poemas en el dataset")
+                
+    if args.shard:
+        poems = select_shard(poems, *args.shard)
+        print(f"Shard {args.shard[0]} de {args.shard[1]}: {len(poems)} poemas")
+        
+    print(f"\n{'='*70}")
+    print("Iniciando búsqueda en YouTube...")
+    print(f"{'='*70}\n")
+    
+    # Every run is kept in the result store; the exports are read from it
+    store = None if args.no_store else ResultStore(config.RESULTS_DB)
+    try:
+        if args.shards:
+            # One process (client, rate limiter, journal) per shard
+            options = ShardOptions(
+                rate=args.rate,
+                burst=args.burst,
+                use_cache=not args.no_cache,
+                refresh_cache=args.refresh_cache,
+                fixtures=args.fixtures,
+                async_search=args.async_search,
+                page_budget=args.page_budget if args.lazy_search else 0,
+                use_planner=planner is not None,
+                refresh_from=args.refresh_from,
+                refresh_max_age=args.refresh_max_age,
+                stream=args.stream,
+                resume=args.resume
+            )
+            print(f"Buscando en {args.shards} procesos (un shard por proceso)\n")
+            try:
+                with profiler.timer('search'):
+                    poems, stats = ShardedRunner(args.shards, options).run(poems, planner=planner)
+            finally:
+                if planner:
+                    planner.save()
+            # Shard processes do not write to the store: the merged run is stored at once
+            if store and poems:
+                store.save_run(poems, label=' '.join(sys.argv[1:]))
+        else:
+            poems, stats = run_search(poems, args, planner, profiler, shard=args.shard, store=store)
+            
+        if poems:
+            if args.shard:
+                # Keep the shard's results for a later merge
+                results_file = shard_path(config.SHARD_RESULTS_FILE, *args.shard)
+                save_shard_result(ShardResult(*args.shard, poems, stats, {}), results_file)
+                save_results(
+                    poems, stats, args, profiler,
+                    output_file=shard_path(config.OUTPUT_FILE, *args.shard),
+                    output_csv=shard_path(config.OUTPUT_CSV, *args.shard),
+                    store=store
+                )
+                print(f"   - {results_file} (unir con: python main.py merge ...)")
+            else:
+                save_results(poems, stats, args, profiler, store=store)
+            
+        else:
             print("\nNo se procesaron poemas")
+    finally:
+        if store:
+            store.close()
+        
+    if args.profile:
+        profiler.attach('cache', stats.get('cache'))
+        profiler.attach('rate_limit', stats.get('rate_limit'))
+        print(profiler.format_table())
+        if profiler.save(args.profile):
+            print(f"\nPerfil guardado en '{args.profile}'")
+
+
+def main() -> None:
+    """Main entry point for the application."""
+    args = parse_args()
+    handlers = {
+        'search': search_command,
+        'export': export_command,
+        'stats': stats_command,
+        'merge': merge_command,
+        'runs': runs_command,
+        'bench': bench_command,
+    }
+    handlers[args.command](args)
 
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-            print("\n\nPrograma interrumpido por el usuario")
-            print("¡Hasta luego!")
+        print("\n\nPrograma interrumpido por el usuario")
+        print("¡Hasta luego!")
     except Exception as e:
-            print(f"\nError fatal: {e}")
+        print(f"\nError fatal: {e}")
         import traceback
         traceback.print_exc()
@@ -1,5 +1,41 @@
-"""YouTube client for searching poem recitations."""
+"""
+YouTube client for searching poem recitations.
 
-from .youtube_client import YouTubeClient
+Public names are imported from their submodule on first use.
+"""
 
-__all__ = ['YouTubeClient']
+from importlib import import_module
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'YouTubeClient': 'youtube_client',
+    'SearchCache': 'search_cache',
+    'RateLimiter': 'rate_limiter',
+    'SearchBackend': 'search_backends',
+    'ScrapetubeBackend': 'search_backends',
+    'FixtureBackend': 'search_backends',
+    'RecordingBackend': 'search_backends',
+    'AsyncSearchClient': 'async_search',
+    'AsyncSearchBackend': 'async_search',
+    'CandidateRanker': 'ranking',
+    'VideoCandidate': 'candidate',
+    'SearchReport': 'candidate',
+    'ContentClassifier': 'classifier',
+    'Classification': 'classifier',
+    'QueryPlanner': 'query_planner',
+    'AuthorPool': 'author_pool',
+    'RelevanceIndex': 'relevance',
+    'VideoIndex': 'video_index',
+    'video_id_from_url': 'video_index',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining a public name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,348 @@
+"""Asyncio search client speaking YouTube's search continuation protocol."""
+
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional
+import asyncio
+import json
+import threading
+
+from .search_backends import SearchBackend
+from src.utils import config
+
+# `sp` filter scrapetube sends by default: sort by relevance, videos only
+SEARCH_FILTER = "CAASAhAB"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+)
+
+
+def json_from_html(html: str, key: str, num_chars: int = 2, stop: str = '"') -> str:
+    """
+    Cut the text following a key out of a results page.
+    
+    Args:
+        html: Results page
+        key: Text the value follows
+        num_chars: Characters between the key and the value
+        stop: Text the value ends before
+        
+    Returns:
+        Raw value text
+    """
+    begin = html.find(key) + len(key) + num_chars
+    return html[begin:html.find(stop, begin)]
+
+
+def search_dict(partial: object, search_key: str) -> Iterator:
+    """
+    Yield every value stored under a key, breadth first, at any depth.
+    
+    Args:
+        partial: Decoded JSON document
+        search_key: Key to look for
+        
+    Yields:
+        Values of the key, in document order
+    """
+    stack = [partial]
+    while stack:
+        current = stack.pop(0)
+        if isinstance(current, dict):
+            for key, value in current.items():
+                if key == search_key:
+                    yield value
+                else:
+                    stack.append(value)
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def continuation_of(data: Optional[Dict]) -> Optional[Dict]:
+    """
+    Get the continuation request of a results page.
+    
+    Args:
+        data: Decoded results page
+        
+    Returns:
+        Dictionary with 'token' and 'click_params', or None on the last page
+    """
+    endpoint = next(search_dict(data, 'continuationEndpoint'), None)
+    if not endpoint:
+        return None
+    return {
+        'token': endpoint['continuationCommand']['token'],
+        'click_params': {'clickTrackingParams': endpoint.get('clickTrackingParams', '')},
+    }
+
+
+class AsyncSearchClient:
+    """
+    Asyncio YouTube search client with a pooled, keep-alive HTTP session.
+    
+    Sends the same requests scrapetube.get_search does (results page, then
+    `youtubei/v1/search` continuations) and yields the same raw
+    `videoRenderer` dictionaries. One aiohttp session is shared by every
+    query, so connections are reused instead of set up per search, and a
+    semaphore bounds the requests in flight. aiohttp is imported when the
+    session is first opened.
+    """
+    
+    def __init__(
+        self,
+        base_url: str = config.YOUTUBE_BASE_URL,
+        concurrency: int = config.ASYNC_SEARCH_CONCURRENCY,
+        pool_size: int = config.ASYNC_SEARCH_POOL_SIZE,
+        timeout: float = config.ASYNC_SEARCH_TIMEOUT
+    ):
+        """
+        Initialize the client (no connection is opened yet).
+        
+        Args:
+            base_url: Site to search (a local stand-in server for offline runs)
+            concurrency: Maximum HTTP requests in flight
+            pool_size: Maximum open connections kept in the pool
+            timeout: Seconds allowed per request
+        """
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = max(1, concurrency)
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+        
+        # Counters (connections opened vs. requests sent shows pool reuse)
+        self.requests = 0
+        self.connections = 0
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    def _open(self):
+        """Create the shared session on first use (inside the running loop)."""
+        if self._session is not None:
+            return self._session
+        import aiohttp
+        
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._on_connection_created)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={'User-Agent': USER_AGENT, 'Accept-Language': 'en'},
+            trace_configs=[trace]
+        )
+        return self._session
+    
+    async def _on_connection_created(self, session, context, params):
+        self.connections += 1
+    
+    async def close(self):
+        """Close the session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> 'AsyncSearchClient':
+        self._open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _results_page(self, query: str) -> str:
+        """
+        Fetch the HTML results page of a query.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Page HTML
+        """
+        session = self._open()
+        async with self._semaphore:
+            self.requests += 1
+            async with session.get(
+                f"{self.base_url}/results",
+                params={'search_query': query, 'sp': SEARCH_FILTER, 'ucbcb': 1},
+                headers={'Cookie': 'CONSENT=YES+cb'}
+            ) as response:
+                response.raise_for_status()
+                return await response.text()
+    
+    async def _continuation_page(self, api_key: str, client: Dict, continuation: Dict) -> Dict:
+        """
+        Fetch the next page of results.
+        
+        Args:
+            api_key: innertubeApiKey of the results page
+            client: INNERTUBE_CONTEXT client of the results page
+            continuation: Request returned by continuation_of
+            
+        Returns:
+            Decoded page
+        """
+        session = self._open()
+        payload = {
+            'context': {'clickTracking': continuation['click_params'], 'client': client},
+            'continuation': continuation['token'],
+        }
+        headers = {
+            'X-YouTube-Client-Name': '1',
+            'X-YouTube-Client-Version': client.get('clientVersion', ''),
+        }
+        async with self._semaphore:
+            self.requests += 1
+            async with session.post(
+                f"{self.base_url}/youtubei/v1/search",
+                params={'key': api_key},
+                json=payload,
+                headers=headers
+            ) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+    
+    async def iter_pages(self, query: str) -> AsyncIterator[List[Dict]]:
+        """
+        Yield the result pages of a query, fetching each continuation only
+        when the next page is asked for.
+        
+        Args:
+            query: Search query string
+            
+        Yields:
+            Lists of raw video dictionaries, one per results page
+            
+        Raises:
+            ConnectionError: If the results page carries no result data
+        """
+        html = await self._results_page(query)
+        if 'var ytInitialData = ' not in html:
+            raise ConnectionError(f"Results page without data for query: {query}")
+        client = json.loads(json_from_html(html, 'INNERTUBE_CONTEXT', 2, '"}},') + '"}}')['client']
+        api_key = json_from_html(html, 'innertubeApiKey', 3)
+        data = json.loads(json_from_html(html, 'var ytInitialData = ', 0, '};') + '}')
+        data = next(search_dict(data, 'contents'), None)
+        
+        while True:
+            yield list(search_dict(data, 'videoRenderer'))
+            continuation = continuation_of(data)
+            if not continuation:
+                return
+            data = await self._continuation_page(api_key, client, continuation)
+    
+    async def iter_search(self, query: str, limit: Optional[int] = None) -> AsyncIterator[Dict]:
+        """
+        Yield the videos of a query, fetching continuation pages as needed.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of videos (None for every page)
+            
+        Yields:
+            Raw video dictionaries
+        """
+        count = 0
+        async for page in self.iter_pages(query):
+            for video in page:
+                yield video
+                count += 1
+                if limit and count >= limit:
+                    return
+    
+    async def search(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Run a search query.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of videos (None for every page)
+            
+        Returns:
+            List of raw video dictionaries
+        """
+        return [video async for video in self.iter_search(query, limit)]
+    
+    async def search_many(self, queries: Iterable[str], limit: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        Run several queries concurrently over the shared session.
+        
+        Args:
+            queries: Search query strings
+            limit: Maximum number of videos per query
+            
+        Returns:
+            Dictionary mapping each query to its videos
+        """
+        queries = list(dict.fromkeys(queries))
+        results = await asyncio.gather(*(self.search(query, limit) for query in queries))
+        return dict(zip(queries, results))
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get request counters for the current session.
+        
+        Returns:
+            Dictionary with requests sent and connections opened
+        """
+        return {'requests': self.requests, 'connections': self.connections}
+
+
+class AsyncSearchBackend(SearchBackend):
+    """
+    Live backend running AsyncSearchClient on a background event loop.
+    
+    Lets the threaded search workers share one pooled session: each
+    worker submits its query to the loop and waits for the result.
+    """
+    
+    name = "async"
+    
+    def __init__(self, client: Optional[AsyncSearchClient] = None):
+        """
+        Args:
+            client: Async client to run queries with (defaults to one built
+                from config)
+        """
+        self.client = client or AsyncSearchClient()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="async-search", daemon=True)
+                self._thread.start()
+            return self._loop
+    
+    def search(self, query: str, limit: int) -> List[Dict]:
+        future = asyncio.run_coroutine_threadsafe(self.client.search(query, limit), self._event_loop())
+        return future.result()
+    
+    def iter_pages(self, query: str, page_size: int) -> Iterator[List[Dict]]:
+        # Pages are YouTube's own, so page_size is only a hint here
+        loop = self._event_loop()
+        pages = self.client.iter_pages(query)
+        try:
+            while True:
+                try:
+                    page = asyncio.run_coroutine_threadsafe(pages.__anext__(), loop).result()
+                except StopAsyncIteration:
+                    return
+                yield page
+        finally:
+            asyncio.run_coroutine_threadsafe(pages.aclose(), loop).result()
+    
+    def close(self):
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.client.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,110 @@
+"""Author-level search results shared by every poem of the same author."""
+
+from collections import Counter
+from typing import Callable, Dict, Iterable, List
+import threading
+
+from .ranking import normalize_text
+
+
+class AuthorPool:
+    """
+    Fetches one broad, deeper result list per author and shares it.
+    
+    Only authors registered with enough poems in the catalogue are pooled
+    (for a single poem the author query would rarely be worth running).
+    The first poem of an author runs the author query; every other poem of
+    that author reuses the pooled results instead of querying again.
+    Fetches are serialized per author only, so searches for different
+    authors never wait on each other.
+    """
+    
+    def __init__(self, size: int = 60, min_title_match: float = 0.8, min_poems: int = 2):
+        """
+        Initialize the pool.
+        
+        Args:
+            size: Videos fetched per author
+            min_title_match: Fraction of the poem title's words a pooled
+                video title must contain to become a candidate
+            min_poems: Poems an author needs in the catalogue to be pooled
+        """
+        self.size = size
+        self.min_title_match = min_title_match
+        self.min_poems = min_poems
+        self.fetches = 0
+        self.reuses = 0
+        self._pools: Dict[str, List[Dict]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._authors: Counter = Counter()
+        self._lock = threading.Lock()
+    
+    def register(self, authors: Iterable[str]):
+        """
+        Count the poems of each author about to be searched.
+        
+        Args:
+            authors: Author of every poem in the catalogue
+        """
+        counts = Counter(normalize_text(autor.strip()) for autor in authors)
+        with self._lock:
+            self._authors.update(counts)
+    
+    def covers(self, autor: str) -> bool:
+        """
+        Check whether an author's poems share pooled results.
+        
+        Args:
+            autor: Author name
+            
+        Returns:
+            True if the author has at least min_poems registered poems
+        """
+        key = normalize_text(autor.strip())
+        with self._lock:
+            return bool(key) and self._authors[key] >= self.min_poems
+    
+    def get(self, autor: str, fetch: Callable[[], List[Dict]]) -> List[Dict]:
+        """
+        Get the pooled results of an author, fetching them the first time.
+        
+        A failed fetch is not pooled, so the next poem of the author tries
+        again.
+        
+        Args:
+            autor: Author name
+            fetch: Runs the author query (called at most once per author)
+            
+        Returns:
+            Raw video dictionaries
+        """
+        key = normalize_text(autor.strip())
+        with self._lock:
+            author_lock = self._locks.setdefault(key, threading.Lock())
+            
+        with author_lock:
+            videos = self._pools.get(key)
+            if videos is not None:
+                with self._lock:
+                    self.reuses += 1
+                return videos
+                
+            videos = fetch()
+            self._pools[key] = videos
+            with self._lock:
+                self.fetches += 1
+            return videos
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get pool counters for the current run.
+        
+        Returns:
+            Dictionary with authors fetched and queries saved by reuse
+        """
+        with self._lock:
+            return {'authors': self.fetches, 'reuses': self.reuses}
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pools)
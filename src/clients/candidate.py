@@ -0,0 +1,132 @@
+"""Typed candidate records extracted from raw search results."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import re
+
+# Raw result keys read by extract_candidate (everything else is dropped
+# before results are cached)
+RAW_FIELDS = (
+    'videoId', 'title', 'lengthText', 'viewCountText', 'ownerText',
+    'longBylineText', 'shortBylineText', 'detailedMetadataSnippets',
+    'descriptionSnippet', 'publishedTimeText',
+)
+
+
+@dataclass
+class VideoCandidate:
+    """One search result with everything classification and ranking use."""
+    video_id: str
+    title: str
+    length_seconds: int = 0
+    duration: str = "N/A"
+    view_count: int = 0
+    channel: str = ""
+    description: str = ""  # Snippet shown in the results page
+    published: str = ""  # Relative publish time, e.g. "hace 2 años"
+    type: str = ""
+    quality: str = ""
+    recitador: str = "N/A"
+    score: float = 0.0
+    query: str = ""
+    pattern: str = ""
+
+
+@dataclass
+class SearchReport:
+    """Search cost of one poem, filled in by YouTubeClient.search_poem_recitation."""
+    pages: int = 0  # Result pages fetched from the backend
+    discarded: int = 0  # Results dropped by the filters (duration, repeated, claimed...)
+    candidates: List[VideoCandidate] = field(default_factory=list)  # Scored candidates, best first
+
+
+def text_of(node: Optional[Dict]) -> str:
+    """
+    Get the text of a YouTube text node ({'simpleText': ...} or {'runs': [...]}).
+    
+    Args:
+        node: Text node from a raw result
+        
+    Returns:
+        Text with all runs joined ("" if missing)
+    """
+    if not node:
+        return ""
+    if 'simpleText' in node:
+        return node['simpleText']
+    return ''.join(run.get('text', '') for run in node.get('runs', ()))
+
+
+def description_of(video: Dict) -> str:
+    """
+    Get the description snippet of a raw result.
+    
+    Args:
+        video: Raw video dictionary
+        
+    Returns:
+        Snippet text ("" if the result has none)
+    """
+    snippets = video.get('detailedMetadataSnippets')
+    if snippets:
+        return ' '.join(text_of(snippet.get('snippetText')) for snippet in snippets)
+    return text_of(video.get('descriptionSnippet'))
+
+
+def channel_of(video: Dict) -> str:
+    """
+    Get the channel name of a raw result.
+    
+    Args:
+        video: Raw video dictionary
+        
+    Returns:
+        Channel name ("" if the result has none)
+    """
+    for key in ('ownerText', 'longBylineText', 'shortBylineText'):
+        name = text_of(video.get(key))
+        if name:
+            return name
+    return ""
+
+
+def view_count_of(view_text: str) -> int:
+    """
+    Extract numeric view count from text like "1.2K views" or "1,234 visualizaciones".
+    
+    Args:
+        view_text: View count text
+        
+    Returns:
+        Numeric view count
+    """
+    try:
+        # Remove non-numeric characters except K, M, and digits
+        cleaned = re.sub(r'[^\d.KM]', '', view_text.upper())
+        
+        if 'K' in cleaned:
+            return int(float(cleaned.replace('K', '')) * 1000)
+        elif 'M' in cleaned:
+            return int(float(cleaned.replace('M', '')) * 1000000)
+        else:
+            return int(cleaned) if cleaned else 0
+    except ValueError:
+        return 0
+
+
+def slim_video(video: Dict) -> Dict:
+    """
+    Drop the parts of a raw result that are never read (thumbnails, badges...).
+    
+    Args:
+        video: Raw video dictionary
+        
+    Returns:
+        Raw video dictionary with only RAW_FIELDS
+    """
+    return {key: video[key] for key in RAW_FIELDS if key in video}
+
+
+def slim_videos(videos: List[Dict]) -> List[Dict]:
+    """Apply slim_video to a page of results."""
+    return [slim_video(video) for video in videos]
@@ -0,0 +1,253 @@
+"""Single-pass keyword classification of video titles."""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import re
+import unicodedata
+
+
+# Content types in priority order: the first type with a keyword in the
+# title (or description) wins
+CONTENT_TYPE_KEYWORDS = [
+    ("Recitación", ['recitación', 'recita', 'recitando']),
+    ("Dramatización", ['dramatización', 'drama', 'teatral', 'teatro']),
+    ("Lectura", ['lectura', 'leyendo', 'lee']),
+    ("Performance", ['performance', 'presentación', 'actuación']),
+    ("Compilación", ['compilación', 'antología', 'colección']),
+    ("Documental", ['documental', 'educativo', 'análisis']),
+    ("Audiopoesía", ['audio', 'audiopoesía']),
+    ("Fragmentos", ['fragmento', 'extracto', 'parcial']),
+]
+DEFAULT_CONTENT_TYPE = "Video Poético"
+
+PROFESSIONAL_KEYWORDS = ['profesional', 'oficial', 'hd', 'alta calidad', 'audio limpio']
+AMATEUR_KEYWORDS = ['celular', 'phone', 'baja calidad', 'audio malo']
+
+# Recitador patterns, tried in order on the original title
+RECITADOR_PATTERNS = [
+    r'recitado por (.+?)(?:\||$)',
+    r'por (.+?)(?:\||$)',
+    r'voz de (.+?)(?:\||$)',
+    r'narrado por (.+?)(?:\||$)',
+]
+
+# Keyword tables
+_CONTENT = 'content'
+_PROFESSIONAL = 'professional'
+_AMATEUR = 'amateur'
+
+# Every recitador pattern needs one of these (lowercase) markers
+_RECITADOR_MARKERS = ('por ', 'voz de ')
+
+
+def fold_text(text: str) -> str:
+    """
+    Lowercase text and drop accents (and any other non-ASCII character).
+    
+    Equivalent to ranking.normalize_text for the ASCII keywords matched
+    here, but done by the codec machinery instead of per character.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Folded text
+    """
+    return unicodedata.normalize('NFKD', text.lower()).encode('ascii', 'ignore').decode('ascii')
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation factored as a prefix trie.
+    
+    At each node the branches are tried before ending the word, so a match
+    is always the longest keyword starting at that position.
+    
+    Args:
+        words: Literal keywords
+        
+    Returns:
+        Regex source
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+        
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if '' in node else body
+        
+    return build(trie)
+
+
+class Classification(NamedTuple):
+    """Content type, quality and recitador of one video."""
+    content_type: str
+    quality: str
+    recitador: str
+
+
+class ContentClassifier:
+    """
+    Classifies video titles with one precompiled matcher.
+    
+    Every keyword table (content types, professional and amateur quality
+    markers) is folded into a single trie-shaped regex over accent-free,
+    lowercased text. The regex sits in a lookahead so it reports the
+    longest keyword starting at every position, and each keyword is
+    precomputed to stand for every shorter keyword it starts with. One
+    scan therefore finds every keyword occurrence, with the same substring
+    semantics as the original per-table `in` checks.
+    """
+    
+    def __init__(self):
+        keywords: Dict[str, List[Tuple[str, int]]] = {}
+        for priority, (_, words) in enumerate(CONTENT_TYPE_KEYWORDS):
+            for word in words:
+                keywords.setdefault(fold_text(word), []).append((_CONTENT, priority))
+        for table, words in ((_PROFESSIONAL, PROFESSIONAL_KEYWORDS), (_AMATEUR, AMATEUR_KEYWORDS)):
+            for word in words:
+                keywords.setdefault(fold_text(word), []).append((table, 0))
+                
+        # Per matched keyword: best content-type priority, professional and
+        # amateur flags, over the keyword and every keyword it starts with
+        no_content = len(CONTENT_TYPE_KEYWORDS)
+        self._word_info: Dict[str, Tuple[int, bool, bool]] = {}
+        for word in keywords:
+            hits = [hit for other, other_hits in keywords.items() if word.startswith(other) for hit in other_hits]
+            self._word_info[word] = (
+                min((priority for table, priority in hits if table == _CONTENT), default=no_content),
+                any(table == _PROFESSIONAL for table, _ in hits),
+                any(table == _AMATEUR for table, _ in hits),
+            )
+        self._matcher = re.compile(f"(?=({trie_pattern(keywords)}))")
+        
+        self._recitador_patterns = [re.compile(p, re.IGNORECASE) for p in RECITADOR_PATTERNS]
+        self._recitador_suffix = re.compile(r'\s*[-–—]\s*.*$')
+    
+    def classify(self, title: str, description: str = "", view_count: int = 0) -> Classification:
+        """
+        Classify one video.
+        
+        Args:
+            title: Video title
+            description: Video description (only used for the content type)
+            view_count: Number of views
+            
+        Returns:
+            Classification of the video
+        """
+        words = self._matcher.findall(fold_text(title))
+        content_words = words
+        if description:
+            content_words = words + self._matcher.findall(fold_text(description))
+        return Classification(
+            self._content_type(content_words),
+            self._quality(words, view_count),
+            self.recitador(title)
+        )
+    
+    def classify_batch(
+        self,
+        titles: Sequence[str],
+        view_counts: Optional[Sequence[int]] = None
+    ) -> List[Classification]:
+        """
+        Classify many titles at once.
+        
+        The titles are folded in one call on their newline-joined text (no
+        keyword contains a newline) and the compiled matcher then runs on
+        each folded title.
+        
+        Args:
+            titles: Video titles
+            view_counts: Optional view count per title
+            
+        Returns:
+            One Classification per title, in order
+        """
+        if not titles:
+            return []
+        if view_counts is None:
+            view_counts = [0] * len(titles)
+            
+        folded = fold_text('\n'.join(title.replace('\n', ' ') for title in titles)).split('\n')
+        findall = self._matcher.findall
+        return [
+            Classification(self._content_type(words), self._quality(words, views), self.recitador(title))
+            for title, words, views in zip(titles, map(findall, folded), view_counts)
+        ]
+    
+    def content_type(self, title: str, description: str = "") -> str:
+        """
+        Classify the content type of a video.
+        
+        Args:
+            title: Video title
+            description: Video description
+            
+        Returns:
+            Content type classification
+        """
+        return self._content_type(self._matcher.findall(fold_text(f"{title} {description}")))
+    
+    def quality(self, title: str, view_count: int = 0) -> str:
+        """
+        Estimate video quality from title markers and views.
+        
+        Args:
+            title: Video title
+            view_count: Number of views
+            
+        Returns:
+            Quality estimation (Excelente, Buena, Aceptable)
+        """
+        return self._quality(self._matcher.findall(fold_text(title)), view_count)
+    
+    def recitador(self, title: str) -> str:
+        """
+        Extract the recitador name from a video title.
+        
+        Args:
+            title: Video title
+            
+        Returns:
+            Recitador name or "N/A"
+        """
+        lowered = title.lower()
+        if not any(marker in lowered for marker in _RECITADOR_MARKERS):
+            return "N/A"
+            
+        for pattern in self._recitador_patterns:
+            match = pattern.search(title)
+            if match:
+                name = match.group(1).strip()
+                # Clean up common suffixes
+                name = self._recitador_suffix.sub('', name)
+                return name[:50]  # Limit length
+        return "N/A"
+    
+    def _content_type(self, words: Iterable[str]) -> str:
+        """Pick the highest-priority content type among the matched keywords."""
+        if not words:
+            return DEFAULT_CONTENT_TYPE
+        info = self._word_info
+        priority = min(info[word][0] for word in words)
+        if priority == len(CONTENT_TYPE_KEYWORDS):
+            return DEFAULT_CONTENT_TYPE
+        return CONTENT_TYPE_KEYWORDS[priority][0]
+    
+    def _quality(self, words: Sequence[str], view_count: int) -> str:
+        """Combine the quality markers among the matched keywords and the view count."""
+        info = self._word_info
+        if view_count > 10000 or any(info[word][1] for word in words):
+            return "Excelente"
+        elif view_count < 100 or any(info[word][2] for word in words):
+            return "Aceptable"
+        else:
+            return "Buena"
@@ -0,0 +1,186 @@
+"""Adaptive ordering of search patterns based on past results."""
+
+from typing import Optional, Dict, List
+import json
+import os
+import threading
+
+
+# Search patterns in their default order, formatted with the poem fields.
+# The genre pattern is only used when the poem has a genre.
+SEARCH_PATTERNS = [
+    "{titulo} {autor} recitación",
+    "{titulo} poema dominicano",
+    "{titulo} {autor} poema {genero}",
+    "{autor} {titulo} completo",
+    "{titulo} {autor} dramatización",
+    "poema {titulo} recitado",
+    "{autor} poesía dominicana",
+]
+
+GENRE_PATTERN = "{titulo} {autor} poema {genero}"
+
+# Author-only pattern: its results are the same for every poem of the
+# author, so YouTubeClient can pool them (see AuthorPool)
+AUTHOR_PATTERN = "{autor} poesía dominicana"
+
+
+class QueryPlanner:
+    """
+    Learns which search patterns produce the accepted result.
+    
+    For every poem it records which patterns were run and which one found
+    the chosen video, globally and per author. Later searches run the most
+    productive patterns first and drop the ones that practically never win.
+    """
+    
+    # Pseudo-attempts used to shrink per-author rates towards the global rate
+    AUTHOR_PRIOR_WEIGHT = 5
+    
+    def __init__(
+        self,
+        filepath: Optional[str] = None,
+        min_attempts: int = 20,
+        prune_below: float = 0.02
+    ):
+        """
+        Initialize the planner, loading saved statistics if present.
+        
+        Args:
+            filepath: JSON file where statistics are persisted
+            min_attempts: Attempts a pattern needs before it can be pruned
+            prune_below: Global win rate under which a pattern is pruned
+        """
+        self.filepath = filepath
+        self.min_attempts = min_attempts
+        self.prune_below = prune_below
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict] = {'global': {}, 'authors': {}}
+        # Outcomes recorded by this instance only (merged across shards)
+        self.session: Dict[str, Dict] = {'global': {}, 'authors': {}}
+        
+        if filepath and os.path.exists(filepath):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    self.stats = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error loading query planner stats: {e}")
+    
+    def plan(self, autor: str, patterns: List[str]) -> List[str]:
+        """
+        Order (and prune) the search patterns for a poem.
+        
+        Args:
+            autor: Author name
+            patterns: Candidate patterns in their default order
+            
+        Returns:
+            Patterns to run, most productive first
+        """
+        with self._lock:
+            author_stats = self.stats['authors'].get(autor, {})
+            scored = []
+            for idx, pattern in enumerate(patterns):
+                entry = self.stats['global'].get(pattern, {'attempts': 0, 'wins': 0})
+                if (entry['attempts'] >= self.min_attempts
+                        and entry['wins'] / entry['attempts'] < self.prune_below):
+                    continue
+                    
+                rate = self._estimate(pattern, author_stats)
+                scored.append((-rate, idx, pattern))
+                
+        if not scored:
+            return list(patterns[:1])
+            
+        return [pattern for _, _, pattern in sorted(scored)]
+    
+    def record(self, autor: str, attempted: List[str], winner: Optional[str]):
+        """
+        Record the outcome of one poem search.
+        
+        Args:
+            autor: Author name
+            attempted: Patterns that were run
+            winner: Pattern that produced the accepted video (None if not found)
+        """
+        with self._lock:
+            for stats in (self.stats, self.session):
+                author_stats = stats['authors'].setdefault(autor, {})
+                for table in (stats['global'], author_stats):
+                    for pattern in attempted:
+                        entry = table.setdefault(pattern, {'attempts': 0, 'wins': 0})
+                        entry['attempts'] += 1
+                        if pattern == winner:
+                            entry['wins'] += 1
+    
+    def merge(self, session: Dict[str, Dict]):
+        """
+        Add outcomes recorded by another planner (e.g. a shard worker).
+        
+        Args:
+            session: The other planner's `session` statistics
+        """
+        with self._lock:
+            for stats in (self.stats, self.session):
+                tables = [(stats['global'], session.get('global', {}))]
+                for autor, author_session in session.get('authors', {}).items():
+                    tables.append((stats['authors'].setdefault(autor, {}), author_session))
+                for table, other in tables:
+                    for pattern, counts in other.items():
+                        entry = table.setdefault(pattern, {'attempts': 0, 'wins': 0})
+                        entry['attempts'] += counts['attempts']
+                        entry['wins'] += counts['wins']
+    
+    def save(self):
+        """Persist the statistics to the planner file."""
+        if not self.filepath:
+            return
+            
+        with self._lock:
+            data = json.dumps(self.stats, ensure_ascii=False, indent=2)
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            f.write(data)
+    
+    def format_table(self, autor: Optional[str] = None) -> str:
+        """
+        Render the hit-rate table for inspection.
+        
+        Args:
+            autor: Show this author's table instead of the global one
+            
+        Returns:
+            Table as text
+        """
+        with self._lock:
+            table = self.stats['authors'].get(autor, {}) if autor else self.stats['global']
+            rows = sorted(
+                table.items(),
+                key=lambda item: -item[1]['wins'] / max(1, item[1]['attempts'])
+            )
+            
+        lines = [f"{'Patrón':<36}{'Intentos':>10}{'Aciertos':>10}{'Tasa':>9}", '-' * 65]
+        for pattern, entry in rows:
+            rate = entry['wins'] / entry['attempts'] * 100 if entry['attempts'] else 0.0
+            lines.append(f"{pattern:<36}{entry['attempts']:>10}{entry['wins']:>10}{rate:>8.1f}%")
+        return '\n'.join(lines)
+    
+    def _estimate(self, pattern: str, author_stats: Dict[str, Dict]) -> float:
+        """
+        Estimate the chance that a pattern wins for an author.
+        
+        Args:
+            pattern: Search pattern
+            author_stats: The author's per-pattern counters
+            
+        Returns:
+            Smoothed win rate between 0 and 1
+        """
+        entry = self.stats['global'].get(pattern, {'attempts': 0, 'wins': 0})
+        global_rate = (entry['wins'] + 1) / (entry['attempts'] + 2)
+        
+        author_entry = author_stats.get(pattern)
+        if not author_entry:
+            return global_rate
+            
+        weight = self.AUTHOR_PRIOR_WEIGHT
+        return (author_entry['wins'] + global_rate * weight) / (author_entry['attempts'] + weight)
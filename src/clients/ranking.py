@@ -0,0 +1,156 @@
+"""Scoring of candidate videos against the poem being searched."""
+
+from typing import Set
+import math
+import re
+import unicodedata
+
+from .candidate import VideoCandidate
+
+
+# Words too common in Spanish titles to say anything about a match
+STOPWORDS = {
+    'a', 'al', 'de', 'del', 'el', 'en', 'la', 'las', 'lo', 'los',
+    'un', 'una', 'y', 'o', 'por', 'para', 'con', 'mi', 'tu', 'su',
+}
+
+# How well each content type matches what we are looking for
+CONTENT_TYPE_WEIGHTS = {
+    "Recitación": 1.0,
+    "Dramatización": 0.9,
+    "Lectura": 0.85,
+    "Performance": 0.8,
+    "Audiopoesía": 0.75,
+    "Video Poético": 0.6,
+    "Fragmentos": 0.5,
+    "Documental": 0.4,
+    "Compilación": 0.3,
+}
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase text and strip accents.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Normalized text
+    """
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Split normalized text into meaningful word tokens.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Set of tokens without stopwords
+    """
+    return {tok for tok in re.findall(r'\w+', normalize_text(text)) if tok not in STOPWORDS}
+
+
+class CandidateRanker:
+    """
+    Scores candidate videos between 0 and 1.
+    
+    The score combines title similarity to the poem title, the author
+    found in the title or channel name, how well the duration fits a
+    typical recitation, view count and the detected content type.
+    """
+    
+    WEIGHTS = {
+        'title': 0.5,
+        'author': 0.15,
+        'type': 0.15,
+        'duration': 0.1,
+        'views': 0.1,
+    }
+    
+    def __init__(
+        self,
+        confidence_threshold: float = 0.75,
+        min_duration: int = 30,
+        max_duration: int = 1200
+    ):
+        """
+        Initialize the ranker.
+        
+        Args:
+            confidence_threshold: Score at which a candidate is accepted
+                without running the remaining search patterns
+            min_duration: Shortest acceptable video in seconds
+            max_duration: Longest acceptable video in seconds
+        """
+        self.confidence_threshold = confidence_threshold
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+    
+    def score(self, candidate: VideoCandidate, titulo: str, autor: str) -> float:
+        """
+        Score a candidate video for a poem.
+        
+        Args:
+            candidate: Candidate video
+            titulo: Poem title
+            autor: Author name
+            
+        Returns:
+            Score between 0 and 1
+        """
+        author = self.title_similarity(candidate.title, autor)
+        if author < 1.0 and candidate.channel:
+            author = max(author, self.title_similarity(candidate.channel, autor))
+        components = {
+            'title': self.title_similarity(candidate.title, titulo),
+            'author': author,
+            'type': CONTENT_TYPE_WEIGHTS.get(candidate.type, 0.5),
+            'duration': self.duration_fit(candidate.length_seconds),
+            'views': min(1.0, math.log10(candidate.view_count + 1) / 6),
+        }
+        return sum(self.WEIGHTS[name] * value for name, value in components.items())
+    
+    @staticmethod
+    def title_similarity(video_title: str, text: str) -> float:
+        """
+        Fraction of the words of `text` that appear in the video title.
+        
+        Args:
+            video_title: Candidate video title
+            text: Poem title or author name
+            
+        Returns:
+            Similarity between 0 and 1 (1 when the full phrase appears)
+        """
+        if normalize_text(text) in normalize_text(video_title):
+            return 1.0
+            
+        wanted = tokenize(text)
+        if not wanted:
+            return 0.0
+        return len(wanted & tokenize(video_title)) / len(wanted)
+    
+    def duration_fit(self, length_seconds: int) -> float:
+        """
+        Score how typical a duration is for a single poem recitation.
+        
+        Args:
+            length_seconds: Video duration in seconds (0 if unknown)
+            
+        Returns:
+            1.0 for one to ten minutes, tapering towards the filter limits
+        """
+        if not length_seconds:
+            return 0.5
+        if 60 <= length_seconds <= 600:
+            return 1.0
+        if length_seconds < 60:
+            span = max(1, 60 - self.min_duration)
+            return max(0.0, (length_seconds - self.min_duration) / span)
+        span = max(1, self.max_duration - 600)
+        return max(0.0, (self.max_duration - length_seconds) / span)
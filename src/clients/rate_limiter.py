@@ -0,0 +1,111 @@
+"""Shared token-bucket rate limiter for YouTube search requests."""
+
+from typing import Dict
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket with burst capacity and adaptive backoff.
+    
+    One instance is meant to be shared by every thread issuing searches.
+    The refill rate drops on errors or empty result pages and climbs back
+    towards the configured maximum after successful requests.
+    """
+    
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 5,
+        min_rate: float = 0.2,
+        backoff_factor: float = 0.5,
+        recovery_factor: float = 1.1
+    ):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Maximum sustained requests per second
+            burst: Number of requests that may be issued back to back
+            min_rate: Lowest rate adaptive backoff may slow down to
+            backoff_factor: Multiplier applied to the rate after a failure
+            recovery_factor: Multiplier applied to the rate after a success
+        """
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = max(1, burst)
+        self.backoff_factor = backoff_factor
+        self.recovery_factor = recovery_factor
+        
+        self._rate = rate
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        
+        self.requests = 0
+        self.failures = 0
+        self.throttle_seconds = 0.0
+    
+    @property
+    def current_rate(self) -> float:
+        """Current refill rate in requests per second."""
+        return self._rate
+    
+    def acquire(self) -> float:
+        """
+        Block until a request may be issued.
+        
+        Returns:
+            Seconds spent waiting for a token
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests += 1
+                    self.throttle_seconds += waited
+                    return waited
+                wait = (1 - self._tokens) / self._rate
+                
+            time.sleep(wait)
+            waited += wait
+    
+    def record_success(self):
+        """Speed back up after a request that returned results."""
+        with self._lock:
+            self._refill()
+            self._rate = min(self.max_rate, self._rate * self.recovery_factor)
+    
+    def record_failure(self):
+        """Slow down after an error or an empty result page."""
+        with self._lock:
+            self._refill()
+            self.failures += 1
+            self._rate = max(self.min_rate, self._rate * self.backoff_factor)
+    
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get current rate and accumulated throttling.
+        
+        Returns:
+            Dictionary with rate settings, request counts and throttle time
+        """
+        with self._lock:
+            return {
+                'current_rate': self._rate,
+                'max_rate': self.max_rate,
+                'burst': self.burst,
+                'requests': self.requests,
+                'failures': self.failures,
+                'throttle_seconds': self.throttle_seconds
+            }
+    
+    def _refill(self):
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self._rate)
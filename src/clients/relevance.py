@@ -0,0 +1,209 @@
+"""Fuzzy matching of candidate video titles against the poem searched."""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, NamedTuple
+import re
+import threading
+
+from .ranking import STOPWORDS, normalize_text
+
+# Words video titles add around any poem ("Poema X recitado") that say
+# nothing about which poem it is
+TITLE_STOPWORDS = STOPWORDS | {
+    'poema', 'poemas', 'poesia', 'poesias', 'verso', 'versos',
+    'recita', 'recitado', 'recitada', 'recitando', 'recitacion', 'recital',
+    'declama', 'declamado', 'declamada', 'declamacion',
+    'lectura', 'leido', 'leida', 'narrado', 'narrada', 'voz',
+    'video', 'oficial', 'completo', 'completa', 'version', 'audio', 'hd',
+}
+
+# Trigram similarity at which a different word still counts as the same
+FUZZY_WORD_MATCH = 0.75
+
+_WORD = re.compile(r'\w+')
+
+
+class TitleProfile(NamedTuple):
+    """Normalized form of a title, ready for set intersections."""
+    phrase: str  # Remaining words joined by single spaces
+    tokens: FrozenSet[str]
+    trigrams: Dict[str, FrozenSet[str]]  # Trigrams of each word
+
+
+@lru_cache(maxsize=65536)
+def trigrams_of(word: str) -> FrozenSet[str]:
+    """
+    Character trigrams of a word padded with spaces ("sed" -> " se", "sed", "ed ").
+    
+    Cached: the same words come back in title after title.
+    """
+    padded = f" {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def title_profile(text: str) -> TitleProfile:
+    """
+    Normalize a title and build its word and trigram sets.
+    
+    Accents, case and punctuation are dropped, then stopwords; a title
+    made only of stopwords keeps all its words.
+    
+    Args:
+        text: Title, author or channel name
+        
+    Returns:
+        TitleProfile of the text
+    """
+    words = _WORD.findall(normalize_text(text))
+    kept = [word for word in words if word not in TITLE_STOPWORDS] or words
+    return TitleProfile(' '.join(kept), frozenset(kept), {word: trigrams_of(word) for word in kept})
+
+
+def similarity(wanted: TitleProfile, found: TitleProfile) -> float:
+    """
+    Share of the words of a wanted title present in a found title.
+    
+    A word missing from the found title still counts for its trigram
+    (Dice) similarity to the closest found word when that reaches
+    FUZZY_WORD_MATCH, so plurals and spelling variants match while a
+    word that merely starts the same way does not.
+    
+    Args:
+        wanted: Profile of the poem title (or author)
+        found: Profile of the video title (or channel)
+        
+    Returns:
+        Similarity between 0 and 1 (1 when the whole phrase appears)
+    """
+    if not wanted.tokens:
+        return 0.0
+    if f" {wanted.phrase} " in f" {found.phrase} ":
+        return 1.0
+        
+    total = 0.0
+    for word, grams in wanted.trigrams.items():
+        if word in found.tokens:
+            total += 1.0
+            continue
+        best = 0.0
+        for other in found.trigrams.values():
+            size = len(grams) + len(other)
+            # Dice can reach at most 2 * min / size: skip words of very different length
+            if 2 * min(len(grams), len(other)) < FUZZY_WORD_MATCH * size:
+                continue
+            best = max(best, 2 * len(grams & other) / size)
+        if best >= FUZZY_WORD_MATCH:
+            total += best
+    return total / len(wanted.tokens)
+
+
+class RelevanceIndex:
+    """
+    Checks that candidate videos are about the poem searched.
+    
+    Profiles of catalogue titles and authors are computed once (up front
+    with register, or on first use) and shared by every search thread;
+    only the candidate title is profiled per check. A candidate is
+    relevant when its title names the poem; naming the author in the
+    title or channel helps a partial title match.
+    """
+    
+    AUTHOR_WEIGHT = 0.25
+    
+    def __init__(self, min_score: float = 0.6):
+        """
+        Initialize the index.
+        
+        Args:
+            min_score: Relevance (0-1) a candidate needs to be kept
+        """
+        self.min_score = min_score
+        self.checked = 0
+        self.rejected = 0
+        self._profiles: Dict[str, TitleProfile] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, texts: Iterable[str]):
+        """
+        Precompute the profiles of catalogue titles and authors.
+        
+        Args:
+            texts: Poem titles and author names
+        """
+        profiles = {text: title_profile(text) for text in texts if text not in self._profiles}
+        with self._lock:
+            self._profiles.update(profiles)
+    
+    def profile(self, text: str) -> TitleProfile:
+        """
+        Get the profile of a catalogue text, computing it on first use.
+        
+        Args:
+            text: Poem title or author name
+            
+        Returns:
+            TitleProfile of the text
+        """
+        profile = self._profiles.get(text)
+        if profile is None:
+            profile = title_profile(text)
+            with self._lock:
+                self._profiles[text] = profile
+        return profile
+    
+    def score(self, video_title: str, titulo: str, autor: str = "", channel: str = "") -> float:
+        """
+        Score how clearly a video is about a poem.
+        
+        Args:
+            video_title: Candidate video title
+            titulo: Poem title
+            autor: Author name (optional)
+            channel: Candidate channel name (optional)
+            
+        Returns:
+            Relevance between 0 and 1
+        """
+        found = title_profile(video_title)
+        title = similarity(self.profile(titulo), found)
+        if title == 1.0 or not autor:
+            return title
+            
+        wanted_author = self.profile(autor)
+        author = similarity(wanted_author, found)
+        if author < 1.0 and channel:
+            author = max(author, similarity(wanted_author, title_profile(channel)))
+        return max(title, (1 - self.AUTHOR_WEIGHT) * title + self.AUTHOR_WEIGHT * author)
+    
+    def is_relevant(self, video_title: str, titulo: str, autor: str = "", channel: str = "") -> bool:
+        """
+        Check a candidate and count the outcome.
+        
+        Args:
+            video_title: Candidate video title
+            titulo: Poem title
+            autor: Author name (optional)
+            channel: Candidate channel name (optional)
+            
+        Returns:
+            True if the relevance reaches min_score
+        """
+        relevant = self.score(video_title, titulo, autor, channel) >= self.min_score
+        with self._lock:
+            self.checked += 1
+            if not relevant:
+                self.rejected += 1
+        return relevant
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get check counters for the current run.
+        
+        Returns:
+            Dictionary with candidates checked and rejected
+        """
+        with self._lock:
+            return {'checked': self.checked, 'rejected': self.rejected}
+    
+    def __len__(self) -> int:
+        return len(self._profiles)
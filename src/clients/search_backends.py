@@ -0,0 +1,262 @@
+"""Search backends used by YouTubeClient to run raw search queries."""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Iterator, List
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import zlib
+
+
+class SearchBackend(ABC):
+    """
+    Interface for anything that can turn a query into YouTube video results.
+    
+    Results are raw `videoRenderer` dictionaries, the same shape
+    scrapetube yields.
+    """
+    
+    name = "base"
+    
+    @abstractmethod
+    def search(self, query: str, limit: int) -> List[Dict]:
+        """
+        Run a search query.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of videos to return
+            
+        Returns:
+            List of raw video dictionaries
+        """
+    
+    def iter_pages(self, query: str, page_size: int) -> Iterator[List[Dict]]:
+        """
+        Yield the result pages of a query, fetching each one only when asked.
+        
+        Backends without continuation support re-run the query with a
+        larger limit for every page.
+        
+        Args:
+            query: Search query string
+            page_size: Videos per page
+            
+        Yields:
+            Lists of raw video dictionaries (the last page may be shorter)
+        """
+        served = 0
+        while True:
+            videos = self.search(query, served + page_size)
+            if len(videos) <= served:
+                return
+            yield videos[served:]
+            served = len(videos)
+    
+    def close(self):
+        """Release connections or threads held by the backend (no-op by default)."""
+
+
+class ScrapetubeBackend(SearchBackend):
+    """
+    Live backend that scrapes YouTube search results with scrapetube.
+    """
+    
+    name = "scrapetube"
+    
+    def search(self, query: str, limit: int) -> List[Dict]:
+        import scrapetube
+        
+        # Pacing is handled by the client's rate limiter, not scrapetube's sleep
+        return list(scrapetube.get_search(query, limit=limit, sleep=0))
+    
+    def iter_pages(self, query: str, page_size: int) -> Iterator[List[Dict]]:
+        import scrapetube
+        
+        # scrapetube's generator requests the next page when the current one
+        # is used up, so reading page_size videos at a time fetches lazily
+        videos = scrapetube.get_search(query, sleep=0)
+        try:
+            while True:
+                page = list(itertools.islice(videos, page_size))
+                if not page:
+                    return
+                yield page
+        finally:
+            videos.close()
+
+
+class FixtureBackend(SearchBackend):
+    """
+    Offline backend that replays recorded search results from a JSON file.
+    
+    The fixture file maps each query string to its list of videos. Latency
+    and failures can be injected to exercise the client under realistic
+    conditions without network access.
+    """
+    
+    name = "fixture"
+    
+    def __init__(
+        self,
+        filepath: Optional[str] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        synthesize_missing: bool = False,
+        seed: Optional[int] = None
+    ):
+        """
+        Load recorded results.
+        
+        Args:
+            filepath: JSON file mapping query -> list of videos (optional)
+            latency: Seconds to sleep per query
+            latency_jitter: Extra random latency, uniform in [0, jitter]
+            failure_rate: Probability (0-1) that a query raises ConnectionError
+            synthesize_missing: Generate deterministic fake results for
+                queries not in the fixture instead of returning nothing
+            seed: Seed for the latency/failure random generator
+        """
+        self.filepath = filepath
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.failure_rate = failure_rate
+        self.synthesize_missing = synthesize_missing
+        
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.fixtures: Dict[str, List[Dict]] = {}
+        
+        if filepath and os.path.exists(filepath):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                self.fixtures = json.load(f)
+    
+    def search(self, query: str, limit: int) -> List[Dict]:
+        self._simulate_request(query)
+        return self._results(query, limit)
+    
+    def iter_pages(self, query: str, page_size: int) -> Iterator[List[Dict]]:
+        # Latency and failures are injected per page, like real continuations
+        for start in itertools.count(0, page_size):
+            self._simulate_request(query)
+            page = self._results(query, start + page_size)[start:]
+            if not page:
+                return
+            yield page
+    
+    def _simulate_request(self, query: str):
+        """
+        Sleep for the injected latency and raise the injected failures.
+        
+        Args:
+            query: Search query string
+            
+        Raises:
+            ConnectionError: When the request is picked to fail
+        """
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            fail = self._random.random() < self.failure_rate
+            
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise ConnectionError(f"Injected failure for query: {query}")
+    
+    def _results(self, query: str, limit: int) -> List[Dict]:
+        """
+        Get the first recorded (or synthesized) results of a query.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of videos
+            
+        Returns:
+            List of raw video dictionaries
+        """
+        if query in self.fixtures:
+            return self.fixtures[query][:limit]
+        if self.synthesize_missing:
+            return self._synthesize(query, limit)
+        return []
+    
+    @staticmethod
+    def _synthesize(query: str, limit: int) -> List[Dict]:
+        """
+        Build plausible, deterministic video results for a query.
+        
+        Args:
+            query: Search query string
+            limit: Number of videos to build
+            
+        Returns:
+            List of raw video dictionaries
+        """
+        seed = zlib.crc32(query.encode('utf-8'))
+        videos = []
+        for i in range(limit):
+            value = seed + i * 7919
+            seconds = 20 + value % 900
+            videos.append({
+                'videoId': f"{value % 10**11:011d}",
+                'title': {'runs': [{'text': f"{query} - video {i + 1}"}]},
+                'lengthText': {'simpleText': f"{seconds // 60}:{seconds % 60:02d}"},
+                'viewCountText': {'simpleText': f"{value % 50000} visualizaciones"},
+                'ownerText': {'runs': [{'text': f"Canal {value % 97}"}]},
+                'publishedTimeText': {'simpleText': f"hace {value % 11 + 1} años"},
+            })
+        return videos
+
+
+class RecordingBackend(SearchBackend):
+    """
+    Wraps another backend and records every result for later replay.
+    """
+    
+    name = "recording"
+    
+    def __init__(self, backend: SearchBackend):
+        """
+        Args:
+            backend: Backend whose results are recorded
+        """
+        self.backend = backend
+        self.recorded: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+    
+    def search(self, query: str, limit: int) -> List[Dict]:
+        videos = self.backend.search(query, limit)
+        self._record(query, videos)
+        return videos
+    
+    def iter_pages(self, query: str, page_size: int) -> Iterator[List[Dict]]:
+        videos = []
+        for page in self.backend.iter_pages(query, page_size):
+            videos.extend(page)
+            self._record(query, list(videos))
+            yield page
+    
+    def _record(self, query: str, videos: List[Dict]):
+        """Keep the longest result list seen for a query."""
+        with self._lock:
+            if len(videos) >= len(self.recorded.get(query, ())):
+                self.recorded[query] = videos
+    
+    def close(self):
+        self.backend.close()
+    
+    def save(self, filepath: str):
+        """
+        Write the recorded results as a FixtureBackend JSON file.
+        
+        Args:
+            filepath: Output filepath
+        """
+        with self._lock:
+            data = dict(self.recorded)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
@@ -0,0 +1,167 @@
+"""Persistent on-disk cache for YouTube search results."""
+
+from typing import Optional, Dict, List
+import json
+import sqlite3
+import threading
+import time
+
+
+class SearchCache:
+    """
+    SQLite-backed cache mapping a search query to the raw video results.
+    
+    Entries expire after a TTL and the table is capped at a maximum number
+    of entries, evicting the least recently used ones first.
+    """
+    
+    def __init__(
+        self,
+        filepath: str,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 50000,
+        refresh: bool = False,
+        busy_timeout: float = 5.0
+    ):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            filepath: Path to the SQLite file
+            ttl_seconds: Age after which an entry is considered stale
+            max_entries: Maximum number of cached queries kept on disk
+            refresh: Ignore existing entries and overwrite them with fresh results
+            busy_timeout: Seconds to wait for another process (e.g. a shard
+                worker) holding the database lock before failing
+        """
+        self.filepath = filepath
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.refresh = refresh
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filepath, timeout=busy_timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                query TEXT NOT NULL,
+                result_limit INTEGER NOT NULL,
+                results TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (query, result_limit)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache (accessed_at)"
+        )
+        self._purge_expired()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        self._conn.commit()
+    
+    def get(self, query: str, limit: int) -> Optional[List[Dict]]:
+        """
+        Look up cached results for a query.
+        
+        Args:
+            query: Search query string
+            limit: Result limit the query was issued with
+            
+        Returns:
+            List of video dictionaries, or None on a miss
+        """
+        if self.refresh:
+            with self._lock:
+                self.misses += 1
+            return None
+            
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, created_at FROM search_cache WHERE query = ? AND result_limit = ?",
+                (query, limit)
+            ).fetchone()
+            
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+                
+            self._conn.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE query = ? AND result_limit = ?",
+                (now, query, limit)
+            )
+            self._conn.commit()
+            self.hits += 1
+            
+        return json.loads(row[0])
+    
+    def set(self, query: str, limit: int, results: List[Dict]):
+        """
+        Store the results of a query, evicting old entries if needed.
+        
+        Args:
+            query: Search query string
+            limit: Result limit the query was issued with
+            results: List of video dictionaries returned by the search
+        """
+        now = time.time()
+        payload = json.dumps(results, ensure_ascii=False)
+        
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM search_cache WHERE query = ? AND result_limit = ?",
+                (query, limit)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?)",
+                (query, limit, payload, now, now)
+            )
+            if not exists:
+                self._size += 1
+                
+            if self._size > self.max_entries:
+                overflow = self._size - self.max_entries
+                self._conn.execute(
+                    """
+                    DELETE FROM search_cache WHERE rowid IN (
+                        SELECT rowid FROM search_cache ORDER BY accessed_at LIMIT ?
+                    )
+                    """,
+                    (overflow,)
+                )
+                self._size -= overflow
+                self.evictions += overflow
+                
+            self._conn.commit()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters for the current run.
+        
+        Returns:
+            Dictionary with hits, misses, evictions and stored entries
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': self._size
+            }
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def _purge_expired(self):
+        """Delete entries older than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        self._conn.execute("DELETE FROM search_cache WHERE created_at < ?", (cutoff,))
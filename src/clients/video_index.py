@@ -0,0 +1,114 @@
+"""Run-wide index of which poems claimed each video."""
+
+from typing import Dict, Hashable, List, Optional
+from urllib.parse import parse_qs, urlparse
+import threading
+
+
+def video_id_from_url(url: str) -> Optional[str]:
+    """
+    Extract the video ID from a YouTube watch URL.
+    
+    Args:
+        url: URL such as "https://www.youtube.com/watch?v=abc123"
+        
+    Returns:
+        Video ID, or None if the URL has none (e.g. "NO ENCONTRADO")
+    """
+    if not url or '://' not in url:
+        return None
+    parsed = urlparse(url)
+    if parsed.hostname and parsed.hostname.endswith('youtu.be'):
+        return parsed.path.lstrip('/') or None
+    return parse_qs(parsed.query).get('v', [None])[0]
+
+
+class VideoIndex:
+    """
+    Maps video IDs to the poems (claimants) that were assigned them.
+    
+    Searches claim the video they pick; a video already claimed by another
+    poem is skipped in favour of the next candidate. Shared by every
+    search worker.
+    """
+    
+    def __init__(self):
+        self._claims: Dict[str, List[Hashable]] = {}
+        self._lock = threading.Lock()
+    
+    def is_claimed_by_other(self, video_id: str, claimant: Hashable) -> bool:
+        """
+        Check whether another poem already holds a video.
+        
+        Args:
+            video_id: YouTube video ID
+            claimant: Poem identifier
+            
+        Returns:
+            True if the video is claimed by a different poem
+        """
+        with self._lock:
+            owners = self._claims.get(video_id)
+            return bool(owners) and claimant not in owners
+    
+    def claim(self, video_id: str, claimant: Hashable) -> bool:
+        """
+        Claim a video if it is free (or already held by the same poem).
+        
+        Args:
+            video_id: YouTube video ID
+            claimant: Poem identifier
+            
+        Returns:
+            True if the poem now holds the video, False if another poem does
+        """
+        with self._lock:
+            owners = self._claims.setdefault(video_id, [])
+            if owners and claimant not in owners:
+                return False
+            if not owners:
+                owners.append(claimant)
+            return True
+    
+    def add(self, video_id: str, claimant: Hashable):
+        """
+        Record a poem as holding a video even if others already do.
+        
+        Used for results restored from a checkpoint or a previous export,
+        and for searches that found nothing but already-claimed videos.
+        
+        Args:
+            video_id: YouTube video ID
+            claimant: Poem identifier
+        """
+        with self._lock:
+            owners = self._claims.setdefault(video_id, [])
+            if claimant not in owners:
+                owners.append(claimant)
+    
+    def claimants(self, video_id: str) -> List[Hashable]:
+        """
+        Get the poems holding a video.
+        
+        Args:
+            video_id: YouTube video ID
+            
+        Returns:
+            Claimants in claim order
+        """
+        with self._lock:
+            return list(self._claims.get(video_id, []))
+    
+    def collisions(self) -> Dict[str, List[Hashable]]:
+        """
+        Get the videos held by more than one poem.
+        
+        Returns:
+            Dictionary of video ID -> claimants
+        """
+        with self._lock:
+            return {vid: list(owners) for vid, owners in self._claims.items() if len(owners) > 1}
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._claims)
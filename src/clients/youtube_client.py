@@ -1,41 +1,370 @@
 """YouTube scraper client for fetching poem recitation videos."""
 
-from typing import Optional, Dict, List
-import scrapetube
-import re
+from typing import Optional, Dict, Hashable, Iterator, List, Tuple
+import threading
+import time
+
+from .search_cache import SearchCache
+from .rate_limiter import RateLimiter
+from .search_backends import SearchBackend, ScrapetubeBackend
+from .ranking import CandidateRanker
+from .candidate import VideoCandidate, SearchReport, text_of, description_of, channel_of, view_count_of, slim_videos
+from .classifier import ContentClassifier
+from .video_index import VideoIndex
+from .author_pool import AuthorPool
+from .relevance import RelevanceIndex
+from .query_planner import QueryPlanner, SEARCH_PATTERNS, GENRE_PATTERN, AUTHOR_PATTERN
+from src.models.duration import parse_duration, format_duration
+from src.utils import config
+from src.utils.profiler import NULL_PROFILER
+
+
+# Compiled once and shared: classification holds no per-call state
+DEFAULT_CLASSIFIER = ContentClassifier()
 
 
 class YouTubeClient:
     """
-    Client for searching YouTube videos of Dominican poem recitations using scrapetube.
+    Client for searching YouTube videos of Dominican poem recitations.
+    Searches go through a pluggable backend (scrapetube by default).
     No API key needed!
     """
     
-    def __init__(self, videos_per_search: int = 3):
+    def __init__(
+        self,
+        videos_per_search: int = 3,
+        cache: Optional[SearchCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        backend: Optional[SearchBackend] = None,
+        ranker: Optional[CandidateRanker] = None,
+        planner: Optional[QueryPlanner] = None,
+        classifier: Optional[ContentClassifier] = None,
+        video_index: Optional[VideoIndex] = None,
+        author_pool: Optional[AuthorPool] = None,
+        relevance: Optional[RelevanceIndex] = None,
+        page_budget: int = 0,
+        target_candidates: int = config.SEARCH_TARGET_CANDIDATES,
+        min_relevance: float = config.SEARCH_MIN_RELEVANCE,
+        page_size: int = config.SEARCH_PAGE_SIZE,
+        profiler=None
+    ):
         """
         Initialize YouTube scraper client.
         
         Args:
             videos_per_search: Number of videos to fetch per search query
+            cache: Optional persistent cache of query results
+            rate_limiter: Limiter shared by every search request
+                (defaults to one built from config)
+            backend: Search backend to delegate queries to
+                (defaults to live scrapetube scraping)
+            ranker: Scores candidate videos and sets the accepted duration
+                range (defaults to config threshold and duration limits)
+            planner: Optional planner that orders search patterns by past success
+            classifier: Classifies candidate titles (defaults to a shared instance)
+            video_index: Run-wide index of claimed videos (defaults to a new one)
+            author_pool: Shared per-author results (defaults to one built from
+                config; disabled when AUTHOR_POOL_SIZE is 0)
+            relevance: Rejects videos whose title does not name the poem
+                (defaults to one built from config; disabled when
+                RELEVANCE_MIN_SCORE is 0)
+            page_budget: Most result pages fetched lazily per query; 0 fetches
+                videos_per_search results in one request instead
+            target_candidates: Acceptable candidates after which a query
+                stops fetching pages (lazy search only)
+            min_relevance: Score a candidate needs to count as acceptable
+            page_size: Videos per results page
+            profiler: Optional RunProfiler recording queries and rejections
         """
         self.videos_per_search = videos_per_search
+        self.cache = cache
+        self.backend = backend or ScrapetubeBackend()
+        self.ranker = ranker or CandidateRanker(
+            confidence_threshold=config.RANKING_CONFIDENCE_THRESHOLD,
+            min_duration=config.MIN_VIDEO_DURATION,
+            max_duration=config.MAX_VIDEO_DURATION
+        )
+        self.planner = planner
+        self.classifier = classifier or DEFAULT_CLASSIFIER
+        self.video_index = video_index if video_index is not None else VideoIndex()
+        if author_pool is None and config.AUTHOR_POOL_SIZE:
+            author_pool = AuthorPool(
+                size=config.AUTHOR_POOL_SIZE,
+                min_title_match=config.AUTHOR_POOL_MIN_TITLE_MATCH,
+                min_poems=config.AUTHOR_POOL_MIN_POEMS
+            )
+        self.author_pool = author_pool
+        if relevance is None and config.RELEVANCE_MIN_SCORE:
+            relevance = RelevanceIndex(min_score=config.RELEVANCE_MIN_SCORE)
+        self.relevance = relevance
+        self.page_budget = page_budget
+        self.target_candidates = max(1, target_candidates)
+        self.min_relevance = min_relevance
+        self.page_size = max(1, page_size)
+        self.profiler = profiler or NULL_PROFILER
+        
+        # Query counters (lookups include cache hits, queries hit the backend)
+        self.lookup_count = 0
+        self.query_count = 0
+        self._counter_lock = threading.Lock()
+        self.rate_limiter = rate_limiter or RateLimiter(
+            rate=config.RATE_LIMIT_PER_SECOND,
+            burst=config.RATE_LIMIT_BURST,
+            min_rate=config.RATE_LIMIT_MIN_PER_SECOND
+        )
+    
+    def _search(
+        self,
+        query: str,
+        pattern: str = "",
+        limit: Optional[int] = None,
+        report: Optional[SearchReport] = None
+    ) -> List[Dict]:
+        """
+        Run a search query, serving it from the cache when possible.
+        
+        A limit beyond one results page (the author pool) is fetched page
+        by page, each page under the rate limiter: a single backend call
+        would fetch every continuation page unpaced.
+        
+        Args:
+            query: Search query string
+            pattern: Search pattern the query was built from (for profiling)
+            limit: Videos to fetch (defaults to videos_per_search)
+            report: Optional report the fetched pages are added to
+            
+        Returns:
+            List of raw video dictionaries
+        """
+        profiler = self.profiler
+        limit = limit or self.videos_per_search
+        with self._counter_lock:
+            self.lookup_count += 1
+        
+        if self.cache:
+            start = time.perf_counter() if profiler.enabled else 0.0
+            cached = self.cache.get(query, limit)
+            if cached is not None:
+                if profiler.enabled:
+                    profiler.record_query(pattern, 'cache', time.perf_counter() - start, len(cached))
+                return cached
+        
+        if limit > self.page_size:
+            videos = self._search_pages(query, pattern, limit, report)
+        else:
+            waited = self.rate_limiter.acquire()
+            with self._counter_lock:
+                self.query_count += 1
+            start = time.perf_counter() if profiler.enabled else 0.0
+            try:
+                videos = self.backend.search(query, limit)
+            except Exception as e:
+                self.rate_limiter.record_failure()
+                if profiler.enabled:
+                    profiler.record_query(pattern, 'backend', time.perf_counter() - start, 0, waited, e)
+                raise
+            
+            if profiler.enabled:
+                profiler.record_query(pattern, 'backend', time.perf_counter() - start, len(videos), waited)
+            if report is not None:
+                report.pages += 1
+            
+            if videos:
+                self.rate_limiter.record_success()
+            else:
+                self.rate_limiter.record_failure()
+        
+        # An empty result may be throttling: leave it out of the cache so the
+        # next run asks again
+        if self.cache and videos:
+            self.cache.set(query, limit, slim_videos(videos))
+        
+        return videos
+    
+    def _search_pages(
+        self,
+        query: str,
+        pattern: str,
+        limit: int,
+        report: Optional[SearchReport] = None
+    ) -> List[Dict]:
+        """
+        Fetch the first results of a query one backend page at a time.
+        
+        Args:
+            query: Search query string
+            pattern: Search pattern the query was built from (for profiling)
+            limit: Videos to fetch
+            report: Optional report the fetched pages are added to
+            
+        Returns:
+            List of raw video dictionaries
+        """
+        with self._counter_lock:
+            self.query_count += 1
+        videos: List[Dict] = []
+        live = self.backend.iter_pages(query, self.page_size)
+        try:
+            while len(videos) < limit:
+                page = self._next_page(live, pattern, first=not videos)
+                if report is not None:
+                    report.pages += 1
+                if not page:
+                    break
+                videos.extend(page)
+        finally:
+            live.close()
+        return videos[:limit]
+    
+    def _iter_pages(self, query: str, pattern: str, report: SearchReport) -> Iterator[List[Dict]]:
+        """
+        Yield the result pages of a query one at a time, up to the page budget.
+        
+        A page is only requested when the caller asks for it, so a caller
+        that stops iterating stops the fetching. The results seen so far are
+        cached after every non-empty page (keyed by page count), and a later
+        run replays them page by page before going back to the backend. A failed
+        page ends the iteration; the pages already yielded still count.
+        
+        Args:
+            query: Search query string
+            pattern: Search pattern the query was built from (for profiling)
+            report: Report the fetched pages are added to
+            
+        Yields:
+            Lists of raw video dictionaries
+        """
+        profiler = self.profiler
+        with self._counter_lock:
+            self.lookup_count += 1
+        
+        seen: List[Dict] = []
+        live = None
+        try:
+            for page in range(1, self.page_budget + 1):
+                limit = page * self.page_size
+                if live is None and self.cache:
+                    start = time.perf_counter() if profiler.enabled else 0.0
+                    cached = self.cache.get(query, limit)
+                    if cached is not None:
+                        new = cached[len(seen):]
+                        if profiler.enabled:
+                            profiler.record_query(pattern, 'cache', time.perf_counter() - start, len(new))
+                        if not new:
+                            return
+                        seen = cached
+                        yield new
+                        continue
+                
+                if live is None:
+                    live = self.backend.iter_pages(query, self.page_size)
+                    with self._counter_lock:
+                        self.query_count += 1
+                    # The backend starts over from the first page: fetch the
+                    # pages replayed from the cache again to reach the next one
+                    replayed = 0
+                    while replayed < len(seen):
+                        videos = self._next_page(live, pattern, first=not replayed)
+                        report.pages += 1
+                        if not videos:
+                            return
+                        replayed += len(videos)
+                
+                videos = self._next_page(live, pattern, first=not seen)
+                report.pages += 1
+                if not videos:
+                    return
+                seen = seen + videos
+                if self.cache:
+                    self.cache.set(query, limit, slim_videos(seen))
+                yield videos
+        except Exception as e:
+            profiler.record_exception('search', e)
+        finally:
+            if live is not None:
+                live.close()
+    
+    def _next_page(self, live: Iterator[List[Dict]], pattern: str, first: bool = False) -> List[Dict]:
+        """
+        Fetch the next backend page under the rate limiter.
+        
+        Only an error or an empty first page slows the limiter down; running
+        out of pages after the first is the normal end of the results.
+        
+        Args:
+            live: Page iterator of the backend
+            pattern: Search pattern the query was built from (for profiling)
+            first: Whether this is the query's first page
+            
+        Returns:
+            List of raw video dictionaries (empty past the last page)
+        """
+        profiler = self.profiler
+        waited = self.rate_limiter.acquire()
+        start = time.perf_counter() if profiler.enabled else 0.0
+        try:
+            videos = next(live, [])
+        except Exception as e:
+            self.rate_limiter.record_failure()
+            if profiler.enabled:
+                profiler.record_query(pattern, 'backend', time.perf_counter() - start, 0, waited, e)
+            raise
+        
+        if profiler.enabled:
+            profiler.record_query(pattern, 'backend', time.perf_counter() - start, len(videos), waited)
+        if videos:
+            self.rate_limiter.record_success()
+        elif first:
+            self.rate_limiter.record_failure()
+        return videos
+    
+    def get_cache_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Get search cache counters.
+        
+        Returns:
+            Cache statistics dictionary, or None if caching is disabled
+        """
+        return self.cache.get_stats() if self.cache else None
+    
+    def get_author_pool_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Get author pool counters.
+        
+        Returns:
+            Author pool statistics dictionary, or None if pooling is disabled
+        """
+        return self.author_pool.get_stats() if self.author_pool is not None else None
+    
+    def get_relevance_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Get relevance check counters.
+        
+        Returns:
+            Relevance statistics dictionary, or None if the check is disabled
+        """
+        return self.relevance.get_stats() if self.relevance is not None else None
+    
+    def get_rate_limit_stats(self) -> Dict[str, float]:
+        """
+        Get rate limiter state (current rate and time spent throttled).
+        
+        Returns:
+            Rate limiter statistics dictionary
+        """
+        return self.rate_limiter.get_stats()
     
     def _parse_duration(self, length_seconds: int) -> str:
         """
-        Convert seconds to MM:SS format.
+        Convert seconds to M:SS (or H:MM:SS) format.
         
         Args:
             length_seconds: Duration in seconds
             
         Returns:
-            Duration in MM:SS format
+            Duration display string
         """
-        try:
-            minutes = length_seconds // 60
-            seconds = length_seconds % 60
-            return f"{minutes}:{seconds:02d}"
-        except:
-            return "N/A"
+        return format_duration(length_seconds)
     
     def _determine_content_type(self, title: str, description: str = "") -> str:
         """
@@ -48,28 +377,7 @@ class YouTubeClient:
         Returns:
             Content type classification
         """
-        title_lower = title.lower()
-        desc_lower = description.lower()
-        combined = f"{title_lower} {desc_lower}"
-        
-        if any(word in combined for word in ['recitación', 'recita', 'recitando']):
-            return "Recitación"
-        elif any(word in combined for word in ['dramatización', 'drama', 'teatral', 'teatro']):
-            return "Dramatización"
-        elif any(word in combined for word in ['lectura', 'leyendo', 'lee']):
-            return "Lectura"
-        elif any(word in combined for word in ['performance', 'presentación', 'actuación']):
-            return "Performance"
-        elif any(word in combined for word in ['compilación', 'antología', 'colección']):
-            return "Compilación"
-        elif any(word in combined for word in ['documental', 'educativo', 'análisis']):
-            return "Documental"
-        elif any(word in combined for word in ['audio', 'audiopoesía']):
-            return "Audiopoesía"
-        elif any(word in combined for word in ['fragmento', 'extracto', 'parcial']):
-            return "Fragmentos"
-        else:
-            return "Video Poético"
+        return self.classifier.content_type(title, description)
     
     def _estimate_quality(self, title: str, view_count: int = 0) -> str:
         """
@@ -82,102 +390,253 @@ class YouTubeClient:
         Returns:
             Quality estimation (Excelente, Buena, Aceptable, Baja)
         """
-        title_lower = title.lower()
-        
-        # Check for quality indicators
-        professional_keywords = ['profesional', 'oficial', 'hd', 'alta calidad', 'audio limpio']
-        amateur_keywords = ['celular', 'phone', 'baja calidad', 'audio malo']
-        
-        is_professional = any(kw in title_lower for kw in professional_keywords)
-        is_amateur = any(kw in title_lower for kw in amateur_keywords)
-        
-        if is_professional or view_count > 10000:
-            return "Excelente"
-        elif is_amateur or view_count < 100:
-            return "Aceptable"
-        else:
-            return "Buena"
+        return self.classifier.quality(title, view_count)
     
     def search_poem_recitation(
         self, 
         titulo: str, 
         autor: str,
-        genero: str = ""
-    ) -> Optional[Dict[str, str]]:
+        genero: str = "",
+        claimant: Optional[Hashable] = None,
+        report: Optional[SearchReport] = None
+    ) -> Optional[Dict[str, any]]:
         """
         Search for a poem recitation on YouTube using multiple strategies.
         
+        Candidates from every pattern run are deduplicated by video ID and
+        scored; the search stops as soon as one clears the ranker's
+        confidence threshold, otherwise the best candidate seen is returned.
+        With an author pool, the author's pooled results are matched by
+        title first, so a confident match costs no per-poem query.
+        Videos already claimed by another poem in the video index are
+        skipped; one is only returned (flagged as 'duplicate') when no other
+        candidate was found. Videos whose title does not name the poem
+        (see RelevanceIndex) are rejected outright, so the search goes on
+        instead of settling for an unrelated video. With a page budget, each query's pages are
+        fetched one at a time and filtered as they arrive; no further page
+        is fetched once the query yielded target_candidates acceptable
+        candidates or a confident one.
+        
         Args:
             titulo: Poem title
             autor: Author name
             genero: Poem genre (optional)
+            claimant: Identifier of the poem in the video index
+                (defaults to its normalized title and author)
+            report: Optional SearchReport that receives the pages fetched,
+                results discarded and the scored candidates
             
         Returns:
-            Dictionary with video info if found, None otherwise
-        """
-        # Try multiple search patterns for better results
-        search_patterns = [
-            f"{titulo} {autor} recitación",
-            f"{titulo} poema dominicano",
-            f"{autor} {titulo} completo",
-            f"{titulo} {autor} dramatización",
-            f"poema {titulo} recitado",
-            f"{autor} poesía dominicana",
+            Dictionary with video info (including 'score') if found, None otherwise
+        """
+        if claimant is None:
+            claimant = (titulo.strip().lower(), autor.strip().lower())
+        if report is None:
+            report = SearchReport()
+        
+        # Try multiple search patterns for better results; the genre
+        # pattern is only used when the genre is known
+        patterns = [
+            pattern for pattern in SEARCH_PATTERNS
+            if pattern != GENRE_PATTERN or (genero and genero != "N/A")
         ]
+        if self.planner:
+            patterns = self.planner.plan(autor, patterns)
         
-        # If genre is provided, add genre-specific searches
-        if genero and genero != "N/A":
-            search_patterns.insert(2, f"{titulo} {autor} poema {genero}")
+        # Pooled author results are already paid for: try them first
+        use_pool = self.author_pool is not None and self.author_pool.covers(autor)
+        if use_pool:
+            patterns = [AUTHOR_PATTERN] + [p for p in patterns if p != AUTHOR_PATTERN]
         
-        for query in search_patterns:
+        # Collect candidates across patterns and keep the best-scoring
+        # unclaimed one, stopping early once it is confident enough
+        candidates = {}
+        rejected = set()
+        best = None
+        attempted = []
+        
+        for pattern in patterns:
+            query = pattern.format(titulo=titulo, autor=autor, genero=genero)
+            attempted.append(pattern)
+            pooled = use_pool and pattern == AUTHOR_PATTERN
+            lazy = self.page_budget > 0 and not pooled
             try:
-                videos = scrapetube.get_search(
-                    query, 
-                    limit=self.videos_per_search,
-                    sleep=1  # Be respectful with requests
-                )
-                
+                if pooled:
+                    pages = [self.author_pool.get(
+                        autor, lambda: self._search(query, pattern, limit=self.author_pool.size, report=report)
+                    )]
+                elif lazy:
+                    pages = self._iter_pages(query, pattern, report)
+                else:
+                    pages = [self._search(query, pattern, report=report)]
+            except Exception as e:
+                # Continue to next search pattern if this one fails
+                self.profiler.record_exception('search', e)
+                continue
+            
+            # Acceptable candidates from this query (lazy search stops
+            # fetching pages once it has enough)
+            accepted = 0
+            for videos in pages:
                 for video in videos:
                     video_id = video.get('videoId')
-                    if not video_id:
+                    if not video_id or video_id in candidates or video_id in rejected:
+                        report.discarded += 1
                         continue
                     
-                    title = video.get('title', {}).get('runs', [{}])[0].get('text', '')
-                    length_seconds = int(video.get('lengthText', {}).get('simpleText', '0').replace(':', ''))
-                    
-                    # Skip very short videos (likely not full recitations)
-                    if length_seconds and length_seconds < 30:
+                    # Pooled results cover all the author's poems: keep only
+                    # the ones whose title names this poem
+                    if pooled and self.ranker.title_similarity(
+                        text_of(video.get('title')), titulo
+                    ) < self.author_pool.min_title_match:
+                        report.discarded += 1
                         continue
                     
-                    # Skip very long videos (likely compilations or unrelated)
-                    if length_seconds and length_seconds > 1200:  # 20 minutes
+                    candidate = self._build_candidate(video)
+                    if not candidate:
+                        report.discarded += 1
                         continue
                     
-                    duration = self._parse_duration(length_seconds) if length_seconds else "N/A"
-                    content_type = self._determine_content_type(title)
-                    
-                    # Get view count for quality estimation
-                    view_count_text = video.get('viewCountText', {}).get('simpleText', '0')
-                    view_count = self._extract_view_count(view_count_text)
-                    quality = self._estimate_quality(title, view_count)
-                    
-                    # Try to extract recitador from title
-                    recitador = self._extract_recitador(title)
+                    if self.relevance is not None and not self.relevance.is_relevant(
+                        candidate.title, titulo, autor, candidate.channel
+                    ):
+                        self.profiler.record_rejection('relevance')
+                        rejected.add(video_id)
+                        report.discarded += 1
+                        continue
                     
-                    return {
-                        'url': f"https://www.youtube.com/watch?v={video_id}",
-                        'duration': duration,
-                        'type': content_type,
-                        'recitador': recitador,
-                        'quality': quality,
-                        'title': title
-                    }
+                    candidate.score = self.ranker.score(candidate, titulo, autor)
+                    candidate.query = query
+                    candidate.pattern = pattern
+                    candidates[video_id] = candidate
                     
-            except Exception as e:
-                # Continue to next search pattern if this one fails
-                continue
+                    if self.video_index.is_claimed_by_other(video_id, claimant):
+                        self.profiler.record_rejection('claimed')
+                        report.discarded += 1
+                        continue
+                    if candidate.score >= self.min_relevance:
+                        accepted += 1
+                    if best is None or candidate.score > best.score:
+                        best = candidate
+                
+                if accepted >= self.target_candidates or (best and best.score >= self.ranker.confidence_threshold):
+                    break
+            if lazy:
+                pages.close()
+            
+            if best and best.score >= self.ranker.confidence_threshold:
+                break
+        
+        report.candidates = sorted(candidates.values(), key=lambda c: c.score, reverse=True)
+        chosen, duplicate = self._claim_best(report.candidates, claimant)
+        self.profiler.record_winner(
+            chosen.pattern if chosen else None,
+            patterns.index(chosen.pattern) if chosen else None
+        )
         
-        return None
+        if self.planner:
+            self.planner.record(autor, attempted, chosen.pattern if chosen else None)
+        
+        if not chosen:
+            return None
+        
+        return {
+            'url': f"https://www.youtube.com/watch?v={chosen.video_id}",
+            'video_id': chosen.video_id,
+            'duration': chosen.duration,
+            'length_seconds': chosen.length_seconds,
+            'type': chosen.type,
+            'recitador': chosen.recitador,
+            'quality': chosen.quality,
+            'title': chosen.title,
+            'channel': chosen.channel,
+            'published': chosen.published,
+            'score': chosen.score,
+            'query': chosen.query,
+            'pattern': chosen.pattern,
+            'duplicate': duplicate
+        }
+    
+    def _claim_best(
+        self,
+        ranked: List[VideoCandidate],
+        claimant: Hashable
+    ) -> Tuple[Optional[VideoCandidate], bool]:
+        """
+        Claim the highest-scoring candidate no other poem holds.
+        
+        Claims are atomic, so when concurrent searches pick the same video
+        the loser moves on to its next candidate.
+        
+        Args:
+            ranked: Candidates, best first
+            claimant: Identifier of the poem in the video index
+            
+        Returns:
+            Tuple of (chosen candidate or None, whether it is a duplicate)
+        """
+        for candidate in ranked:
+            if self.video_index.claim(candidate.video_id, claimant):
+                return candidate, False
+        
+        if not ranked:
+            return None, False
+        
+        # Only claimed videos were found: keep the best and flag it
+        self.video_index.add(ranked[0].video_id, claimant)
+        return ranked[0], True
+    
+    def _build_candidate(self, video: Dict) -> Optional[VideoCandidate]:
+        """
+        Extract and classify a raw search result in one pass.
+        
+        Title, duration, views, channel, description snippet and publish
+        time are all read from the result already in hand; the snippet is
+        used for the content type along with the title.
+        
+        Args:
+            video: Raw video dictionary from the search backend
+            
+        Returns:
+            VideoCandidate, or None if the video is filtered out
+        """
+        try:
+            title = text_of(video.get('title'))
+            length_seconds = parse_duration(text_of(video.get('lengthText')))
+        except (ValueError, AttributeError):
+            self.profiler.record_rejection('parse')
+            return None
+        
+        # Skip very short videos (likely not full recitations)
+        if length_seconds and length_seconds < self.ranker.min_duration:
+            self.profiler.record_rejection('duration_short')
+            return None
+        
+        # Skip very long videos (likely compilations or unrelated)
+        if length_seconds and length_seconds > self.ranker.max_duration:
+            self.profiler.record_rejection('duration_long')
+            return None
+        
+        # Get view count for quality estimation
+        view_count = view_count_of(text_of(video.get('viewCountText')))
+        description = description_of(video)
+        
+        # Content type, quality and recitador in one pass over the title
+        classification = self.classifier.classify(title, description=description, view_count=view_count)
+        
+        return VideoCandidate(
+            video_id=video['videoId'],
+            title=title,
+            length_seconds=length_seconds,
+            duration=format_duration(length_seconds),
+            view_count=view_count,
+            channel=channel_of(video),
+            description=description,
+            published=text_of(video.get('publishedTimeText')),
+            type=classification.content_type,
+            quality=classification.quality,
+            recitador=classification.recitador
+        )
     
     def _extract_view_count(self, view_text: str) -> int:
         """
@@ -189,18 +648,7 @@ class YouTubeClient:
         Returns:
             Numeric view count
         """
-        try:
-            # Remove non-numeric characters except K, M, and digits
-            cleaned = re.sub(r'[^\d.KM]', '', view_text.upper())
-            
-            if 'K' in cleaned:
-                return int(float(cleaned.replace('K', '')) * 1000)
-            elif 'M' in cleaned:
-                return int(float(cleaned.replace('M', '')) * 1000000)
-            else:
-                return int(cleaned) if cleaned else 0
-        except:
-            return 0
+        return view_count_of(view_text)
     
     def _extract_recitador(self, title: str) -> str:
         """
@@ -212,20 +660,4 @@ class YouTubeClient:
         Returns:
             Recitador name or "N/A"
         """
-        # Common patterns in Spanish
-        patterns = [
-            r'recitado por (.+?)(?:\||$)',
-            r'por (.+?)(?:\||$)',
-            r'voz de (.+?)(?:\||$)',
-            r'narrado por (.+?)(?:\||$)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                name = match.group(1).strip()
-                # Clean up common suffixes
-                name = re.sub(r'\s*[-–—]\s*.*$', '', name)
-                return name[:50]  # Limit length
-        
-        return "N/A"
+        return self.classifier.recitador(title)
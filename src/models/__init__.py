@@ -1,5 +1,10 @@
 """Data models for poems."""
 
-from .poem import Poem
+from .poem import Poem, EXPORT_COLUMNS, EXPORT_FIELDS
+from .poem_table import PoemTable, PoemRow
+from .duration import parse_duration, duration_to_seconds, format_duration
 
-__all__ = ['Poem']
+__all__ = [
+    'Poem', 'EXPORT_COLUMNS', 'EXPORT_FIELDS', 'PoemTable', 'PoemRow',
+    'parse_duration', 'duration_to_seconds', 'format_duration'
+]
@@ -0,0 +1,74 @@
+"""Video durations: parsing display strings to seconds and back."""
+
+from typing import Optional
+
+
+UNKNOWN_DURATION = "N/A"
+
+
+def parse_duration(text: Optional[str]) -> int:
+    """
+    Parse a "SS", "M:SS" or "H:MM:SS" duration into seconds.
+    
+    Args:
+        text: Duration text as shown by YouTube (e.g. "4:05", "1:02:10")
+        
+    Returns:
+        Duration in seconds (0 for an empty or "N/A" duration)
+        
+    Raises:
+        ValueError: If the text is not a valid duration
+    """
+    if not text:
+        return 0
+    text = text.strip()
+    if not text or text == UNKNOWN_DURATION:
+        return 0
+        
+    parts = text.split(':')
+    if len(parts) > 3 or not all(part.isdigit() for part in parts):
+        raise ValueError(f"Invalid duration: {text!r}")
+        
+    seconds = 0
+    for idx, part in enumerate(parts):
+        value = int(part)
+        # Every field after the first is a base-60 digit
+        if idx and value >= 60:
+            raise ValueError(f"Invalid duration: {text!r}")
+        seconds = seconds * 60 + value
+    return seconds
+
+
+def duration_to_seconds(text: Optional[str]) -> int:
+    """
+    Lenient parse_duration for stored values (exports, journals).
+    
+    Args:
+        text: Duration text
+        
+    Returns:
+        Duration in seconds (0 if unknown or unparsable)
+    """
+    try:
+        return parse_duration(text)
+    except ValueError:
+        return 0
+
+
+def format_duration(seconds: int) -> str:
+    """
+    Format seconds as "M:SS", or "H:MM:SS" from one hour.
+    
+    Args:
+        seconds: Duration in seconds
+        
+    Returns:
+        Display string ("N/A" if unknown)
+    """
+    if not seconds or seconds < 0:
+        return UNKNOWN_DURATION
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
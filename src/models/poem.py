@@ -1,10 +1,31 @@
 """Data model for Dominican poems and recitations."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, asdict, fields
+from typing import Optional, Tuple
+import sys
 
+from .duration import duration_to_seconds
 
-@dataclass
+
+# Column names used by every export, in order
+EXPORT_COLUMNS = [
+    '#', 'Poema', 'Autor', 'Año', 'Género', 'URL YouTube', 'Duración',
+    'Recitador', 'Tipo Contenido', 'Calidad', 'Puntuación', 'Notas', 'Disponibilidad',
+    'Duplicado', 'Actualizado'
+]
+
+# Poem field behind each export column, in the same order
+EXPORT_FIELDS = [
+    'numero', 'titulo', 'autor', 'año', 'genero', 'url_youtube', 'duracion',
+    'recitador', 'tipo_contenido', 'calidad', 'puntuacion', 'notas', 'disponibilidad',
+    'duplicado', 'actualizado'
+]
+
+# Slotted instances (no per-object __dict__) where the interpreter supports it
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Poem:
     """
     Represents a Dominican poem with YouTube recitation information.
@@ -21,6 +42,12 @@ class Poem:
     calidad: str = "N/A"
     notas: str = ""
     disponibilidad: str = "NO ENCONTRADO"
+    duplicado: str = ""  # Other poems assigned the same video, e.g. "#4, #17"
+    actualizado: str = ""  # ISO timestamp of the last search ("" if never searched)
+    paginas: int = 0  # Result pages fetched by the last search
+    descartados: int = 0  # Results the last search filtered out
+    duracion_segundos: int = 0  # Same duration as a number (0 if unknown)
+    puntuacion: float = 0.0  # Ranking score of the chosen video (0-1)
     
     def to_dict(self) -> dict:
         """
@@ -29,20 +56,61 @@ class Poem:
         Returns:
             Dictionary with column names
         """
-        return {
-            '#': self.numero,
-            'Poema': self.titulo,
-            'Autor': self.autor,
-            'Año': self.año,
-            'Género': self.genero,
-            'URL YouTube': self.url_youtube,
-            'Duración': self.duracion,
-            'Recitador': self.recitador,
-            'Tipo Contenido': self.tipo_contenido,
-            'Calidad': self.calidad,
-            'Notas': self.notas,
-            'Disponibilidad': self.disponibilidad
-        }
+        return dict(zip(EXPORT_COLUMNS, self.to_row()))
+    
+    def to_row(self) -> Tuple:
+        """
+        Convert poem to a tuple of export values, in EXPORT_COLUMNS order.
+        
+        Returns:
+            Tuple of column values
+        """
+        return (
+            self.numero,
+            self.titulo,
+            self.autor,
+            self.año,
+            self.genero,
+            self.url_youtube,
+            self.duracion,
+            self.recitador,
+            self.tipo_contenido,
+            self.calidad,
+            round(self.puntuacion, 3),
+            self.notas,
+            self.disponibilidad,
+            self.duplicado,
+            self.actualizado
+        )
+    
+    def to_record(self) -> dict:
+        """
+        Convert poem to a dictionary keyed by field name (for journals).
+        
+        Returns:
+            Dictionary with one entry per dataclass field
+        """
+        return asdict(self)
+    
+    @staticmethod
+    def from_record(record: dict) -> 'Poem':
+        """
+        Rebuild a Poem from a dictionary produced by to_record().
+        
+        Unknown keys are ignored so records written by other versions load;
+        records without 'duracion_segundos' get it from 'duracion'.
+        
+        Args:
+            record: Dictionary keyed by field name
+            
+        Returns:
+            Poem object
+        """
+        known = {f.name for f in fields(Poem)}
+        poem = Poem(**{k: v for k, v in record.items() if k in known})
+        if 'duracion_segundos' not in record:
+            poem.duracion_segundos = duration_to_seconds(poem.duracion)
+        return poem
     
     def mark_as_found(
         self, 
@@ -52,7 +120,9 @@ class Poem:
         recitador: str = "N/A",
         calidad: str = "Buena",
         notas: str = "",
-        partial: bool = False
+        partial: bool = False,
+        puntuacion: float = 0.0,
+        duracion_segundos: Optional[int] = None
     ):
         """
         Mark the poem as found with details.
@@ -65,13 +135,19 @@ class Poem:
             calidad: Quality assessment (Excelente, Buena, Aceptable, Baja)
             notas: Additional notes
             partial: Whether it's a partial/fragment version
+            puntuacion: Ranking score of the chosen video (0-1)
+            duracion_segundos: Duration in seconds (parsed from duration if omitted)
         """
+        if duracion_segundos is None:
+            duracion_segundos = duration_to_seconds(duration)
         self.url_youtube = url
         self.duracion = duration
+        self.duracion_segundos = duracion_segundos
         self.tipo_contenido = content_type
         self.recitador = recitador
         self.calidad = calidad
         self.notas = notas
+        self.puntuacion = puntuacion
         self.disponibilidad = "PARCIAL" if partial else "ENCONTRADO"
     
     def mark_as_partial(
@@ -81,12 +157,16 @@ class Poem:
         content_type: str = "Fragmentos",
         recitador: str = "N/A",
         calidad: str = "Aceptable",
-        notas: str = "Solo fragmentos disponibles"
+        notas: str = "Solo fragmentos disponibles",
+        puntuacion: float = 0.0,
+        duracion_segundos: Optional[int] = None
     ):
         """
         Mark the poem as partially found.
         """
-        self.mark_as_found(url, duration, content_type, recitador, calidad, notas, partial=True)
+        self.mark_as_found(url, duration, content_type, recitador, calidad, notas,
+                           partial=True, puntuacion=puntuacion,
+                           duracion_segundos=duracion_segundos)
     
     @staticmethod
     def create_from_text(numero: int, text: str) -> Optional['Poem']:
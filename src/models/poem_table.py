@@ -0,0 +1,278 @@
+"""Compact columnar container for large poem catalogues."""
+
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import sys
+
+from .poem import Poem
+
+
+class CategoricalColumn:
+    """
+    Low-cardinality string column stored as integer codes.
+    
+    Each distinct value is kept once (interned) and rows only store a
+    4-byte code pointing to it.
+    """
+    
+    __slots__ = ('codes', 'categories', '_index')
+    
+    def __init__(self):
+        self.codes = array('I')
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+    
+    def append(self, value: str):
+        """
+        Append a value.
+        
+        Args:
+            value: String value
+        """
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(sys.intern(value))
+            self._index[value] = code
+        self.codes.append(code)
+    
+    def code_of(self, value: str) -> int:
+        """
+        Look up the code of a value.
+        
+        Args:
+            value: String value
+            
+        Returns:
+            Integer code, or -1 if the value never appears in the column
+        """
+        return self._index.get(value, -1)
+    
+    def __getitem__(self, idx: int) -> str:
+        return self.categories[self.codes[idx]]
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def __iter__(self) -> Iterator[str]:
+        categories = self.categories
+        return (categories[code] for code in self.codes)
+    
+    def value_counts(self, mask: Optional[Iterable[bool]] = None) -> Counter:
+        """
+        Count occurrences of each value.
+        
+        Args:
+            mask: Optional per-row booleans selecting the rows to count
+            
+        Returns:
+            Counter of value -> occurrences
+        """
+        if mask is None:
+            code_counts = Counter(self.codes)
+        else:
+            code_counts = Counter(code for code, keep in zip(self.codes, mask) if keep)
+        return Counter({self.categories[code]: count for code, count in code_counts.items()})
+
+
+class PoemRow:
+    """
+    Read-only view of one row of a PoemTable.
+    
+    Exposes the same attributes as Poem without allocating a Poem or a dict.
+    """
+    
+    __slots__ = ('_table', '_idx')
+    
+    def __init__(self, table: 'PoemTable', idx: int):
+        self._table = table
+        self._idx = idx
+    
+    def to_row(self) -> Tuple:
+        """Export values in EXPORT_COLUMNS order."""
+        return self._table.export_row(self._idx)
+    
+    def to_poem(self) -> Poem:
+        """Materialize the row as a Poem."""
+        return self._table.poem_at(self._idx)
+
+
+class PoemTable:
+    """
+    Columnar storage for hundreds of thousands of poems.
+    
+    Numeric fields live in typed arrays, repetitive strings (author, genre,
+    content type, quality, ...) in categorical columns and free text in
+    plain lists. Exporters and statistics iterate the columns directly.
+    """
+    
+    CATEGORICAL = ('autor', 'año', 'genero', 'duracion', 'recitador',
+                   'tipo_contenido', 'calidad', 'disponibilidad', 'duplicado')
+    TEXT = ('titulo', 'url_youtube', 'notas', 'actualizado')
+    
+    def __init__(self):
+        self.numero = array('q')
+        self.duracion_segundos = array('l')
+        self.puntuacion = array('d')
+        self.paginas = array('l')
+        self.descartados = array('l')
+        for name in self.CATEGORICAL:
+            setattr(self, name, CategoricalColumn())
+        for name in self.TEXT:
+            setattr(self, name, [])
+    
+    @classmethod
+    def from_poems(cls, poems: Iterable[Poem]) -> 'PoemTable':
+        """
+        Build a table from Poem objects.
+        
+        Args:
+            poems: Iterable of Poem objects (consumed once)
+            
+        Returns:
+            PoemTable with one row per poem
+        """
+        table = cls()
+        for poem in poems:
+            table.append(poem)
+        return table
+    
+    def append(self, poem: Poem):
+        """
+        Append a poem as a new row.
+        
+        Args:
+            poem: Poem object
+        """
+        self.numero.append(poem.numero)
+        self.duracion_segundos.append(poem.duracion_segundos)
+        self.puntuacion.append(poem.puntuacion)
+        self.paginas.append(poem.paginas)
+        self.descartados.append(poem.descartados)
+        for name in self.CATEGORICAL:
+            getattr(self, name).append(getattr(poem, name))
+        for name in self.TEXT:
+            getattr(self, name).append(getattr(poem, name))
+    
+    def __len__(self) -> int:
+        return len(self.numero)
+    
+    def __iter__(self) -> Iterator[PoemRow]:
+        return (PoemRow(self, idx) for idx in range(len(self)))
+    
+    def column(self, name: str):
+        """
+        Get a column by Poem field name.
+        
+        Args:
+            name: Field name (e.g. 'autor', 'numero', 'duracion_segundos')
+            
+        Returns:
+            The column (array, list or CategoricalColumn)
+        """
+        return getattr(self, name)
+    
+    def export_row(self, idx: int) -> Tuple:
+        """
+        Export values of one row in EXPORT_COLUMNS order.
+        
+        Args:
+            idx: Row index
+            
+        Returns:
+            Tuple of column values
+        """
+        return (
+            self.numero[idx], self.titulo[idx], self.autor[idx], self.año[idx],
+            self.genero[idx], self.url_youtube[idx], self.duracion[idx],
+            self.recitador[idx], self.tipo_contenido[idx], self.calidad[idx],
+            round(self.puntuacion[idx], 3), self.notas[idx], self.disponibilidad[idx],
+            self.duplicado[idx], self.actualizado[idx]
+        )
+    
+    def iter_export_rows(self) -> Iterator[Tuple]:
+        """
+        Iterate export rows by zipping the columns.
+        
+        Yields:
+            Tuples of column values in EXPORT_COLUMNS order
+        """
+        scores = (round(score, 3) for score in self.puntuacion)
+        return zip(
+            self.numero, self.titulo, self.autor, self.año, self.genero,
+            self.url_youtube, self.duracion, self.recitador, self.tipo_contenido,
+            self.calidad, scores, self.notas, self.disponibilidad, self.duplicado,
+            self.actualizado
+        )
+    
+    def poem_at(self, idx: int) -> Poem:
+        """
+        Materialize one row as a Poem.
+        
+        Args:
+            idx: Row index
+            
+        Returns:
+            Poem object
+        """
+        return Poem(
+            numero=self.numero[idx],
+            titulo=self.titulo[idx],
+            autor=self.autor[idx],
+            año=self.año[idx],
+            genero=self.genero[idx],
+            url_youtube=self.url_youtube[idx],
+            duracion=self.duracion[idx],
+            duracion_segundos=self.duracion_segundos[idx],
+            recitador=self.recitador[idx],
+            tipo_contenido=self.tipo_contenido[idx],
+            calidad=self.calidad[idx],
+            puntuacion=self.puntuacion[idx],
+            notas=self.notas[idx],
+            disponibilidad=self.disponibilidad[idx],
+            duplicado=self.duplicado[idx],
+            actualizado=self.actualizado[idx],
+            paginas=self.paginas[idx],
+            descartados=self.descartados[idx]
+        )
+    
+    def to_poems(self) -> List[Poem]:
+        """
+        Materialize every row as a Poem.
+        
+        Returns:
+            List of Poem objects
+        """
+        return [self.poem_at(idx) for idx in range(len(self))]
+    
+    def value_counts(self, name: str, where: Optional[Tuple[str, str]] = None) -> Counter:
+        """
+        Count values of a categorical column.
+        
+        Args:
+            name: Categorical column name
+            where: Optional (column, value) filter, e.g. ('disponibilidad', 'ENCONTRADO')
+            
+        Returns:
+            Counter of value -> occurrences
+        """
+        mask = None
+        if where:
+            filter_column = self.column(where[0])
+            if isinstance(filter_column, CategoricalColumn):
+                code = filter_column.code_of(where[1])
+                mask = (value == code for value in filter_column.codes)
+            else:
+                mask = (value == where[1] for value in filter_column)
+        return self.column(name).value_counts(mask)
+
+
+def _row_property(name: str) -> property:
+    """Build a PoemRow attribute that reads the table column."""
+    return property(lambda row: row._table.column(name)[row._idx])
+
+
+for _name in ('numero', 'duracion_segundos', 'puntuacion', 'paginas', 'descartados') + PoemTable.CATEGORICAL + PoemTable.TEXT:
+    setattr(PoemRow, _name, _row_property(_name))
+del _name
@@ -1,5 +1,35 @@
-"""Business logic for poem search services."""
+"""
+Business logic for poem search services.
 
-from .poem_service import PoemService
+Public names are imported from their submodule on first use.
+"""
 
-__all__ = ['PoemService']
+from importlib import import_module
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'PoemService': 'poem_service',
+    'StatisticsEngine': 'statistics',
+    'RefreshIndex': 'refresh',
+    'ShardedRunner': 'sharding',
+    'ShardOptions': 'sharding',
+    'ShardResult': 'sharding',
+    'parse_shard': 'sharding',
+    'select_shard': 'sharding',
+    'shard_path': 'sharding',
+    'merge_results': 'sharding',
+    'missing_shards': 'sharding',
+    'save_shard_result': 'sharding',
+    'load_shard_result': 'sharding',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining a public name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,10 +1,24 @@
 """Business logic for processing poem recitation searches."""
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+import time
 
-from src.clients.youtube_client import YouTubeClient
+from src.clients.video_index import video_id_from_url
+from src.clients.candidate import SearchReport
 from src.models.poem import Poem
+from src.models.poem_table import PoemTable
+from src.utils import config
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.stream_writer import StreamWriter
+from .refresh import RefreshIndex
+
+if TYPE_CHECKING:
+    # Only for annotations: importing the client loads the whole search stack
+    from src.clients.youtube_client import YouTubeClient
+    from src.utils.result_store import ResultStore
 
 
 class PoemService:
@@ -12,37 +26,60 @@ class PoemService:
     Service for processing poem recitation search queries.
     """
     
-    def __init__(self, youtube_client: YouTubeClient):
+    def __init__(self, youtube_client: 'YouTubeClient', profiler=None):
         """
         Initialize the service.
         
         Args:
             youtube_client: YouTube client instance
+            profiler: Optional RunProfiler (defaults to the client's)
         """
         self.youtube_client = youtube_client
+        self.profiler = profiler or youtube_client.profiler
+        self.checkpoint = None
+        self.writer = None
+        self.store = None
     
-    def process_poem(self, poem: Poem) -> Tuple[Poem, bool]:
+    def process_poem(self, poem: Poem, verbose: bool = True) -> Tuple[Poem, bool]:
         """
         Process a single poem search and update with YouTube info.
         
         Args:
             poem: Poem object to search for
+            verbose: Whether to print per-poem search details
             
         Returns:
             Tuple of (updated Poem object, success boolean)
         """
-        print(f"   Buscando: {poem.titulo} - {poem.autor} ({poem.genero})")
+        if verbose:
+            print(f"   Buscando: {poem.titulo} - {poem.autor} ({poem.genero})")
         
+        start = time.perf_counter() if self.profiler.enabled else 0.0
+        report = SearchReport()
         result = self.youtube_client.search_poem_recitation(
             poem.titulo, 
             poem.autor,
-            poem.genero
+            poem.genero,
+            claimant=poem.numero,
+            report=report
         )
+        if self.profiler.enabled:
+            self.profiler.record_poem(time.perf_counter() - start, 'found' if result else 'not_found')
+        poem.actualizado = datetime.now().isoformat(timespec='seconds')
+        poem.paginas = report.pages
+        poem.descartados = report.discarded
+        if self.store:
+            self.store.add_candidates(poem, report.candidates)
+        if verbose and self.youtube_client.page_budget:
+            print(f"      Páginas: {report.pages}, resultados descartados: {report.discarded}")
         
         if result:
             is_partial = 'fragmento' in result['type'].lower() or 'parcial' in result['type'].lower()
             
             notas = f"Video: {result['title'][:100]}"
+            if result.get('duplicate'):
+                others = self.youtube_client.video_index.claimants(result['video_id'])
+                poem.duplicado = self._format_duplicates(n for n in others if n != poem.numero)
             
             if is_partial:
                 poem.mark_as_partial(
@@ -51,9 +88,12 @@ class PoemService:
                     content_type=result['type'],
                     recitador=result.get('recitador', 'N/A'),
                     calidad=result.get('quality', 'Aceptable'),
-                    notas=notas
+                    notas=notas,
+                    puntuacion=result.get('score', 0.0),
+                    duracion_segundos=result.get('length_seconds')
                 )
-                print(f"      Parcial: {result['type']} ({result['duration']}) - {result.get('recitador', 'N/A')}")
+                if verbose:
+                    print(f"      Parcial: {result['type']} ({result['duration']}) - {result.get('recitador', 'N/A')}")
                 return poem, True
             else:
                 poem.mark_as_found(
@@ -62,68 +102,116 @@ class PoemService:
                     content_type=result['type'],
                     recitador=result.get('recitador', 'N/A'),
                     calidad=result.get('quality', 'Buena'),
-                    notas=notas
+                    notas=notas,
+                    puntuacion=result.get('score', 0.0),
+                    duracion_segundos=result.get('length_seconds')
                 )
-                print(f"      Encontrado: {result['type']} ({result['duration']}) - {result.get('recitador', 'N/A')}")
+                if verbose:
+                    print(f"      Encontrado: {result['type']} ({result['duration']}) - {result.get('recitador', 'N/A')}")
                 return poem, True
         else:
-            print(f"      No encontrado")
+            if verbose:
+                print(f"      No encontrado")
             return poem, False
     
     def process_multiple_poems(
         self,
         poems: List[Poem],
-        show_progress: bool = True
+        show_progress: bool = True,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[CheckpointJournal] = None,
+        writer: Optional[StreamWriter] = None,
+        refresh: Optional[RefreshIndex] = None,
+        store: Optional['ResultStore'] = None
     ) -> Tuple[List[Poem], Dict[str, any]]:
         """
-        Process multiple poems.
+        Process multiple poems, optionally searching several at once.
         
         Args:
             poems: List of Poem objects
             show_progress: Whether to show progress messages
+            max_workers: Number of poems searched in parallel
+                (defaults to config.MAX_WORKERS, 1 = sequential)
+            checkpoint: Optional journal that records each poem as it
+                completes; in resume mode, poems already in it are restored
+                instead of searched again
+            writer: Optional streaming writer that receives each poem
+                (including restored ones) as soon as it is done
+            refresh: Optional index of a previous export; fresh results
+                found there are reused instead of searched again
+            store: Optional result store with a started run; every poem
+                (including restored ones) and its best candidates are
+                written to it
             
         Returns:
             Tuple of (updated poems list, statistics dictionary)
         """
-        stats = {
-            'total': len(poems),
-            'found': 0,
-            'partial': 0,
-            'not_found': 0,
-            'authors': [],
-            'genres': [],
-            'content_types': [],
-            'qualities': [],
-            'total_duration': 0,
-            'duration_count': 0
-        }
+        stats = self._new_stats(len(poems))
+        self.checkpoint = checkpoint
+        self.writer = writer
+        self.store = store
         
-        for idx, poem in enumerate(poems, 1):
+        pending = poems
+        if checkpoint:
+            pending = self._restore_from_checkpoint(poems, stats, checkpoint)
+            if show_progress and stats['resumed']:
+                print(f"Reanudando: {stats['resumed']} poemas restaurados desde '{checkpoint.filepath}', "
+                      f"{len(pending)} pendientes")
+        
+        if refresh:
+            pending = self._reuse_previous_results(pending, stats, refresh)
+            if show_progress:
+                print(f"Actualización incremental: {stats['reused']} resultados reutilizados, "
+                      f"{len(pending)} poemas por buscar ({stats['stale']} caducados)")
+        
+        # Authors with several poems left share one pooled author query
+        author_pool = self.youtube_client.author_pool
+        if author_pool is not None:
+            author_pool.register(poem.autor for poem in pending)
+        
+        # Titles and authors are normalized once for the relevance checks
+        relevance = self.youtube_client.relevance
+        if relevance is not None:
+            relevance.register(text for poem in pending for text in (poem.titulo, poem.autor))
+        
+        if max_workers is None:
+            max_workers = config.MAX_WORKERS
+        
+        if max_workers <= 1 or len(pending) <= 1:
+            self._process_sequential(pending, stats, show_progress)
+        else:
+            self._process_concurrent(pending, stats, show_progress, max_workers)
+        
+        stats['duplicates'] = self.flag_duplicates(poems)
+        stats['cache'] = self.youtube_client.get_cache_stats()
+        stats['rate_limit'] = self.youtube_client.get_rate_limit_stats()
+        stats['author_pool'] = self.youtube_client.get_author_pool_stats()
+        stats['relevance'] = self.youtube_client.get_relevance_stats()
+        
+        return poems, stats
+    
+    def _process_sequential(
+        self,
+        poems: List[Poem],
+        stats: Dict[str, any],
+        show_progress: bool
+    ):
+        """
+        Process poems one at a time in input order.
+        
+        Args:
+            poems: List of Poem objects
+            stats: Statistics dictionary to update
+            show_progress: Whether to show progress messages
+        """
+        offset = stats['resumed']
+        for idx, poem in enumerate(poems, offset + 1):
             try:
                 if show_progress:
                     print(f"\n[{idx}/{stats['total']}] Procesando...")
                 
                 updated_poem, success = self.process_poem(poem)
-                
-                if updated_poem.disponibilidad == "ENCONTRADO":
-                    stats['found'] += 1
-                    stats['authors'].append(updated_poem.autor)
-                    stats['genres'].append(updated_poem.genero)
-                    stats['content_types'].append(updated_poem.tipo_contenido)
-                    stats['qualities'].append(updated_poem.calidad)
-                    
-                    duration_parts = updated_poem.duracion.split(':')
-                    if len(duration_parts) == 2 and duration_parts[0].isdigit():
-                        minutes = int(duration_parts[0])
-                        stats['total_duration'] += minutes
-                        stats['duration_count'] += 1
-                        
-                elif updated_poem.disponibilidad == "PARCIAL":
-                    stats['partial'] += 1
-                    stats['authors'].append(updated_poem.autor)
-                    stats['genres'].append(updated_poem.genero)
-                else:
-                    stats['not_found'] += 1
+                self._complete(stats, updated_poem)
                     
             except KeyboardInterrupt:
                 print("\n\n  Proceso interrumpido por el usuario")
@@ -131,12 +219,317 @@ class PoemService:
                 break
             except Exception as e:
                 print(f"    Error inesperado: {e}")
+                self.profiler.record_exception('poem', e)
                 stats['not_found'] += 1
                 continue
+    
+    def _process_concurrent(
+        self,
+        poems: List[Poem],
+        stats: Dict[str, any],
+        show_progress: bool,
+        max_workers: int
+    ):
+        """
+        Process poems on a bounded thread pool.
         
-        return poems, stats
+        Poems are updated in place, so the input order is kept. Statistics
+        are only touched from the calling thread as results come in. On
+        KeyboardInterrupt, queued poems are cancelled and the searches
+        already in flight are allowed to finish and be counted.
+        
+        Args:
+            poems: List of Poem objects
+            stats: Statistics dictionary to update
+            show_progress: Whether to show progress messages
+            max_workers: Size of the worker pool
+        """
+        if show_progress:
+            print(f"Procesando {stats['total']} poemas con {max_workers} búsquedas en paralelo...")
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {
+            executor.submit(self.process_poem, poem, False): poem
+            for poem in poems
+        }
+        completed = stats['resumed']
+        
+        def collect(future):
+            nonlocal completed
+            poem = futures[future]
+            completed += 1
+            try:
+                updated_poem, success = future.result()
+                self._complete(stats, updated_poem)
+                if show_progress:
+                    pages = f" ({updated_poem.paginas} págs.)" if self.youtube_client.page_budget else ""
+                    print(f"[{completed}/{stats['total']}] {poem.titulo} - {poem.autor}: "
+                          f"{updated_poem.disponibilidad}{pages}")
+            except Exception as e:
+                print(f"    Error inesperado en '{poem.titulo}': {e}")
+                self.profiler.record_exception('poem', e)
+                stats['not_found'] += 1
+        
+        try:
+            for future in as_completed(futures):
+                collect(future)
+        except KeyboardInterrupt:
+            print("\n\n  Proceso interrumpido por el usuario")
+            in_flight = [f for f in futures if not f.done() and not f.cancel()]
+            try:
+                if in_flight:
+                    print(f"Esperando {len(in_flight)} búsquedas en curso... (Ctrl+C de nuevo para abandonarlas)")
+                for future in as_completed(in_flight):
+                    collect(future)
+            except KeyboardInterrupt:
+                print("Búsquedas en curso abandonadas")
+            print(f"Poemas procesados hasta ahora: {completed}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     
-    def print_statistics(self, stats: Dict[str, any]):
+    def _restore_from_checkpoint(
+        self,
+        poems: List[Poem],
+        stats: Dict[str, any],
+        checkpoint: CheckpointJournal
+    ) -> List[Poem]:
+        """
+        Replace poems already recorded in the journal with their results.
+        
+        The list is updated in place and statistics are rebuilt from the
+        journal entries, so resuming twice never searches a poem again.
+        
+        Args:
+            poems: List of Poem objects (updated in place)
+            stats: Statistics dictionary to update
+            checkpoint: Journal to restore from
+            
+        Returns:
+            Poems that still need to be searched
+        """
+        done = checkpoint.load()
+        pending = []
+        
+        for idx, poem in enumerate(poems):
+            restored = done.get(checkpoint.poem_key(poem))
+            if restored is None:
+                pending.append(poem)
+                continue
+            
+            restored.numero = poem.numero
+            poems[idx] = restored
+            self._register_video(restored)
+            stats['resumed'] += 1
+            self._update_stats(stats, restored)
+            self._publish(restored)
+        
+        return pending
+    
+    def _reuse_previous_results(
+        self,
+        poems: List[Poem],
+        stats: Dict[str, any],
+        refresh: RefreshIndex
+    ) -> List[Poem]:
+        """
+        Copy fresh results of a previous export onto matching poems.
+        
+        Args:
+            poems: Poems still to be searched (updated in place)
+            stats: Statistics dictionary to update
+            refresh: Index of the previous export
+            
+        Returns:
+            Poems that still need to be searched
+        """
+        pending = []
+        for poem in poems:
+            if not refresh.apply(poem):
+                pending.append(poem)
+                continue
+            
+            self._register_video(poem)
+            stats['reused'] += 1
+            self._update_stats(stats, poem)
+            self._publish(poem)
+        
+        stats['stale'] = refresh.stale
+        return pending
+    
+    def _register_video(self, poem: Poem):
+        """
+        Record the video of an already processed poem in the video index,
+        so new searches avoid it.
+        
+        Args:
+            poem: Restored or reused Poem object
+        """
+        video_id = video_id_from_url(poem.url_youtube)
+        if video_id:
+            self.youtube_client.video_index.add(video_id, poem.numero)
+    
+    @staticmethod
+    def flag_duplicates(poems: List[Poem]) -> int:
+        """
+        Fill the 'duplicado' field of poems that share a video.
+        
+        Args:
+            poems: Processed poems (updated in place)
+            
+        Returns:
+            Number of poems sharing their video with another poem
+        """
+        by_video: Dict[str, List[Poem]] = {}
+        for poem in poems:
+            video_id = video_id_from_url(poem.url_youtube)
+            if video_id:
+                by_video.setdefault(video_id, []).append(poem)
+        
+        flagged = 0
+        for group in by_video.values():
+            for poem in group:
+                poem.duplicado = PoemService._format_duplicates(
+                    other.numero for other in group if other is not poem
+                )
+            if len(group) > 1:
+                flagged += len(group)
+        return flagged
+    
+    @staticmethod
+    def _format_duplicates(numbers) -> str:
+        """Format poem numbers as "#4, #17"."""
+        return ', '.join(f"#{numero}" for numero in numbers)
+    
+    def _complete(self, stats: Dict[str, any], poem: Poem):
+        """
+        Count a freshly processed poem and hand it to the checkpoint, the
+        streaming writer and the result store.
+        
+        Args:
+            stats: Statistics dictionary to update
+            poem: Processed Poem object
+        """
+        self._update_stats(stats, poem)
+        if self.checkpoint:
+            self.checkpoint.record(poem)
+        self._publish(poem)
+    
+    def _publish(self, poem: Poem):
+        """
+        Hand a finished poem to the streaming writer and the result store.
+        
+        Args:
+            poem: Processed, restored or reused Poem object
+        """
+        if self.writer:
+            self.writer.write(poem)
+        if self.store:
+            self.store.record(poem)
+    
+    @staticmethod
+    def _new_stats(total: int) -> Dict[str, any]:
+        """
+        Create an empty statistics dictionary.
+        
+        Args:
+            total: Number of poems in the run
+            
+        Returns:
+            Statistics dictionary
+        """
+        return {
+            'total': total,
+            'found': 0,
+            'partial': 0,
+            'not_found': 0,
+            'authors': [],
+            'genres': [],
+            'content_types': [],
+            'qualities': [],
+            'total_duration': 0,  # Seconds
+            'duration_count': 0,
+            'resumed': 0,
+            'reused': 0,
+            'stale': 0,
+            'duplicates': 0,
+            'pages': 0,  # Result pages fetched
+            'discarded': 0  # Results filtered out
+        }
+    
+    @staticmethod
+    def _update_stats(stats: Dict[str, any], poem: Poem):
+        """
+        Add a processed poem to the statistics.
+        
+        Args:
+            stats: Statistics dictionary to update
+            poem: Processed Poem object
+        """
+        stats['pages'] += poem.paginas
+        stats['discarded'] += poem.descartados
+        if poem.disponibilidad == "ENCONTRADO":
+            stats['found'] += 1
+            stats['authors'].append(poem.autor)
+            stats['genres'].append(poem.genero)
+            stats['content_types'].append(poem.tipo_contenido)
+            stats['qualities'].append(poem.calidad)
+            
+            if poem.duracion_segundos:
+                stats['total_duration'] += poem.duracion_segundos
+                stats['duration_count'] += 1
+                
+        elif poem.disponibilidad == "PARCIAL":
+            stats['partial'] += 1
+            stats['authors'].append(poem.autor)
+            stats['genres'].append(poem.genero)
+        else:
+            stats['not_found'] += 1
+    
+    @staticmethod
+    def statistics_from_table(table: PoemTable) -> Dict[str, any]:
+        """
+        Build the statistics dictionary by iterating table columns.
+        
+        The 'authors', 'genres', 'content_types' and 'qualities' entries are
+        Counters instead of lists, which print_statistics accepts as well.
+        
+        Args:
+            table: PoemTable with processed poems
+            
+        Returns:
+            Statistics dictionary
+        """
+        availability = table.value_counts('disponibilidad')
+        found_or_partial = table.value_counts('autor', where=('disponibilidad', 'ENCONTRADO'))
+        found_or_partial.update(table.value_counts('autor', where=('disponibilidad', 'PARCIAL')))
+        genres = table.value_counts('genero', where=('disponibilidad', 'ENCONTRADO'))
+        genres.update(table.value_counts('genero', where=('disponibilidad', 'PARCIAL')))
+        
+        found_code = table.disponibilidad.code_of("ENCONTRADO")
+        found_seconds = [
+            seconds
+            for seconds, code in zip(table.duracion_segundos, table.disponibilidad.codes)
+            if code == found_code and seconds
+        ]
+        
+        stats = PoemService._new_stats(len(table))
+        stats.update({
+            'found': availability.get("ENCONTRADO", 0),
+            'partial': availability.get("PARCIAL", 0),
+            'not_found': len(table) - availability.get("ENCONTRADO", 0) - availability.get("PARCIAL", 0),
+            'authors': found_or_partial,
+            'genres': genres,
+            'content_types': table.value_counts('tipo_contenido', where=('disponibilidad', 'ENCONTRADO')),
+            'qualities': table.value_counts('calidad', where=('disponibilidad', 'ENCONTRADO')),
+            'total_duration': sum(found_seconds),
+            'duration_count': len(found_seconds),
+            'pages': sum(table.paginas),
+            'discarded': sum(table.descartados)
+        })
+        return stats
+    
+    @staticmethod
+    def print_statistics(stats: Dict[str, any]):
         """
         Print detailed search statistics.
         
@@ -152,6 +545,14 @@ class PoemService:
         print(f"    Encontrados: {stats['found']} ({stats['found']/stats['total']*100:.1f}%)")
         print(f"     Parciales: {stats['partial']} ({stats['partial']/stats['total']*100:.1f}%)")
         print(f"    No encontrados: {stats['not_found']} ({stats['not_found']/stats['total']*100:.1f}%)")
+        if stats.get('resumed'):
+            print(f"    Restaurados del checkpoint: {stats['resumed']}")
+        if stats.get('reused') or stats.get('stale'):
+            print(f"    Reutilizados de la exportación anterior: {stats['reused']} "
+                  f"({stats['stale']} caducados buscados de nuevo)")
+        
+        if stats.get('duplicates'):
+            print(f"    Con video repetido (ver columna 'Duplicado'): {stats['duplicates']}")
         
         success_rate = (stats['found'] + stats['partial']) / stats['total'] * 100
         print(f"\n    Tasa de éxito: {success_rate:.1f}%")
@@ -185,7 +586,42 @@ class PoemService:
                     print(f"   - {quality}: {count} videos")
         
         if stats['duration_count'] > 0:
-            avg_duration = stats['total_duration'] / stats['duration_count']
+            avg_duration = stats['total_duration'] / stats['duration_count'] / 60
             print(f"\n⏱  Duración Promedio: {avg_duration:.1f} minutos")
         
+        if stats.get('cache'):
+            cache_stats = stats['cache']
+            lookups = cache_stats['hits'] + cache_stats['misses']
+            hit_rate = cache_stats['hits'] / lookups * 100 if lookups else 0.0
+            print(f"\n Caché de Búsquedas:")
+            print(f"   - Aciertos: {cache_stats['hits']} ({hit_rate:.1f}%)")
+            print(f"   - Fallos: {cache_stats['misses']}")
+            print(f"   - Entradas almacenadas: {cache_stats['entries']}")
+        
+        if stats.get('pages'):
+            print(f"\n Páginas de Resultados:")
+            print(f"   - Descargadas: {stats['pages']} ({stats['pages'] / stats['total']:.2f} por poema)")
+            print(f"   - Resultados descartados: {stats['discarded']}")
+        
+        if stats.get('author_pool'):
+            pool_stats = stats['author_pool']
+            print(f"\n Resultados por Autor:")
+            print(f"   - Autores consultados: {pool_stats['authors']}")
+            print(f"   - Búsquedas evitadas: {pool_stats['reuses']}")
+        
+        if stats.get('relevance'):
+            relevance_stats = stats['relevance']
+            checked = relevance_stats['checked']
+            rejected_rate = relevance_stats['rejected'] / checked * 100 if checked else 0.0
+            print(f"\n Relevancia de Títulos:")
+            print(f"   - Candidatos revisados: {checked}")
+            print(f"   - Rechazados por no nombrar el poema: {relevance_stats['rejected']} ({rejected_rate:.1f}%)")
+        
+        if stats.get('rate_limit'):
+            rate_stats = stats['rate_limit']
+            print(f"\n Limitador de Peticiones:")
+            print(f"   - Peticiones: {rate_stats['requests']} ({rate_stats['failures']} con error o vacías)")
+            print(f"   - Tasa actual: {rate_stats['current_rate']:.2f}/s (máx. {rate_stats['max_rate']:.2f}/s, ráfaga {rate_stats['burst']})")
+            print(f"   - Tiempo en espera: {rate_stats['throttle_seconds']:.1f} s")
+        
         print(f"\n{'='*70}\n")
@@ -0,0 +1,120 @@
+"""Reuse results from a previous export in incremental refresh runs."""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+import os
+
+from src.models.poem import Poem
+from src.utils import config, PoemLoader, CheckpointJournal
+
+
+# Result fields copied from a previous export onto a catalogue poem
+RESULT_FIELDS = (
+    'url_youtube', 'duracion', 'duracion_segundos', 'recitador', 'tipo_contenido',
+    'calidad', 'puntuacion', 'notas', 'disponibilidad', 'actualizado'
+)
+
+
+class RefreshIndex:
+    """
+    Results of a previous export, keyed by normalized title and author.
+    
+    Only poems found in full and searched within the maximum age are
+    reused; NO ENCONTRADO and PARCIAL rows, and stale ones, are searched
+    again.
+    """
+    
+    def __init__(
+        self,
+        poems: Iterable[Poem],
+        max_age_days: float = config.REFRESH_MAX_AGE_DAYS,
+        fallback_time: Optional[datetime] = None,
+        now: Optional[datetime] = None
+    ):
+        """
+        Args:
+            poems: Poems from the previous export
+            max_age_days: Results older than this are searched again
+            fallback_time: Search time assumed for rows without 'Actualizado'
+                (e.g. the export's modification time)
+            now: Reference time (defaults to the current time)
+        """
+        self.entries: Dict[Tuple[str, str], Poem] = {
+            CheckpointJournal.poem_key(poem): poem for poem in poems
+        }
+        self.fallback_time = fallback_time
+        self.cutoff = (now or datetime.now()) - timedelta(days=max_age_days)
+        self.reused = 0
+        self.stale = 0
+    
+    @classmethod
+    def from_export(
+        cls,
+        filepath: str,
+        max_age_days: float = config.REFRESH_MAX_AGE_DAYS
+    ) -> 'RefreshIndex':
+        """
+        Load a previous CSV, JSON Lines or XLSX export.
+        
+        Args:
+            filepath: Export filepath
+            max_age_days: Results older than this are searched again
+            
+        Returns:
+            RefreshIndex instance
+        """
+        loader = PoemLoader()
+        poems = loader.iter_poems([filepath])
+        fallback_time = None
+        if os.path.exists(filepath):
+            fallback_time = datetime.fromtimestamp(os.path.getmtime(filepath))
+        index = cls(poems, max_age_days, fallback_time)
+        if loader.report.error_count:
+            loader.report.print_summary()
+        return index
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def apply(self, poem: Poem) -> bool:
+        """
+        Copy a fresh previous result onto a catalogue poem.
+        
+        Args:
+            poem: Catalogue poem (updated in place when reused)
+            
+        Returns:
+            True if the previous result was reused, False if it must be searched
+        """
+        previous = self.entries.get(CheckpointJournal.poem_key(poem))
+        if previous is None or previous.disponibilidad != "ENCONTRADO":
+            return False
+            
+        if not self._is_fresh(previous):
+            self.stale += 1
+            return False
+            
+        for name in RESULT_FIELDS:
+            setattr(poem, name, getattr(previous, name))
+        if not poem.actualizado and self.fallback_time:
+            poem.actualizado = self.fallback_time.isoformat(timespec='seconds')
+        self.reused += 1
+        return True
+    
+    def _is_fresh(self, poem: Poem) -> bool:
+        """
+        Check whether a previous result is within the maximum age.
+        
+        Args:
+            poem: Poem from the previous export
+            
+        Returns:
+            True if the result can be reused
+        """
+        searched_at = self.fallback_time
+        if poem.actualizado:
+            try:
+                searched_at = datetime.fromisoformat(poem.actualizado)
+            except ValueError:
+                pass
+        return searched_at is not None and searched_at >= self.cutoff
@@ -0,0 +1,390 @@
+"""Deterministic sharding of poem catalogues across processes or machines."""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import json
+import os
+import zlib
+
+from src.clients import (
+    YouTubeClient, SearchCache, RateLimiter, FixtureBackend, AsyncSearchBackend, QueryPlanner
+)
+from src.models.poem import Poem
+from src.models.poem_table import PoemTable
+from src.utils import config
+from src.utils.checkpoint import CheckpointJournal
+from src.utils.stream_writer import StreamWriter
+from .poem_service import PoemService
+from .refresh import RefreshIndex
+
+
+# Per-shard counters that are added up when shards are merged (the rest of
+# the statistics are recomputed from the merged poems)
+SUMMED_STATS = ('resumed', 'reused', 'stale')
+
+# Nested values that are gauges rather than counters (size of the shared
+# cache, each shard's rate limiter settings): the merge keeps the highest
+# shard value instead of adding them up
+SHARED_COUNTERS = ('entries', 'current_rate', 'max_rate', 'burst')
+
+
+def shard_of(numero: int, shards: int) -> int:
+    """
+    Get the (0-based) shard a poem belongs to.
+    
+    Uses crc32 of the poem number, so every process and machine assigns
+    the same poems to the same shard.
+    
+    Args:
+        numero: Poem number
+        shards: Total number of shards
+        
+    Returns:
+        Shard index between 0 and shards - 1
+    """
+    return zlib.crc32(str(numero).encode('ascii')) % shards
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification such as "2/4".
+    
+    Args:
+        text: "i/N" with 1 <= i <= N
+        
+    Returns:
+        Tuple of (shard number, total shards), shard number starting at 1
+        
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    index, sep, shards = text.partition('/')
+    if not sep or not index.strip().isdigit() or not shards.strip().isdigit():
+        raise ValueError(f"shard inválido: {text!r} (use i/N, por ejemplo 2/4)")
+    index, shards = int(index), int(shards)
+    if not 1 <= index <= shards:
+        raise ValueError(f"shard fuera de rango: {text!r}")
+    return index, shards
+
+
+def select_shard(poems: Iterable[Poem], index: int, shards: int) -> List[Poem]:
+    """
+    Keep the poems of one shard.
+    
+    Args:
+        poems: All poems of the catalogue
+        index: Shard number (starting at 1)
+        shards: Total number of shards
+        
+    Returns:
+        Poems of the shard, in catalogue order
+    """
+    return [poem for poem in poems if shard_of(poem.numero, shards) == index - 1]
+
+
+def shard_path(filepath: str, index: int, shards: int) -> str:
+    """
+    Add the shard to a filename ("out.csv" -> "out.shard-2-of-4.csv").
+    
+    Args:
+        filepath: Path shared by all shards
+        index: Shard number (starting at 1)
+        shards: Total number of shards
+        
+    Returns:
+        Path of the shard's own file
+    """
+    root, ext = os.path.splitext(filepath)
+    return f"{root}.shard-{index}-of-{shards}{ext}"
+
+
+class ShardOptions(NamedTuple):
+    """Settings every shard worker builds its own client from."""
+    rate: float = config.RATE_LIMIT_PER_SECOND
+    burst: int = config.RATE_LIMIT_BURST
+    use_cache: bool = True
+    refresh_cache: bool = False
+    fixtures: Optional[str] = None
+    async_search: bool = False
+    page_budget: int = 0
+    use_planner: bool = True
+    refresh_from: Optional[str] = None
+    refresh_max_age: float = config.REFRESH_MAX_AGE_DAYS
+    stream: Optional[str] = None
+    resume: bool = False
+
+
+class ShardResult(NamedTuple):
+    """Processed poems and statistics of one shard."""
+    index: int
+    shards: int
+    poems: List[Poem]
+    stats: Dict[str, object]
+    planner: Dict[str, Dict]
+
+
+def run_shard(poems: List[Poem], index: int, shards: int, options: ShardOptions) -> ShardResult:
+    """
+    Search the poems of one shard with a client of its own.
+    
+    Top-level so it can run in a worker process. Each shard has its own
+    rate limiter, checkpoint journal and stream file; the search cache is
+    shared (SQLite handles concurrent processes) and the planner is only
+    read, its new outcomes are returned for the parent to merge.
+    
+    Args:
+        poems: Poems of the shard
+        index: Shard number (starting at 1)
+        shards: Total number of shards
+        options: Client settings
+        
+    Returns:
+        ShardResult of the shard
+    """
+    cache = None
+    if options.use_cache:
+        cache = SearchCache(
+            config.CACHE_FILE,
+            ttl_seconds=config.CACHE_TTL_HOURS * 3600,
+            max_entries=config.CACHE_MAX_ENTRIES,
+            refresh=options.refresh_cache,
+            busy_timeout=config.CACHE_BUSY_TIMEOUT_SECONDS
+        )
+    planner = None
+    if options.use_planner:
+        planner = QueryPlanner(
+            config.PLANNER_STATS_FILE,
+            min_attempts=config.PLANNER_MIN_ATTEMPTS,
+            prune_below=config.PLANNER_PRUNE_BELOW
+        )
+    backend = None
+    if options.fixtures:
+        backend = FixtureBackend(options.fixtures)
+    elif options.async_search:
+        backend = AsyncSearchBackend()
+    youtube_client = YouTubeClient(
+        videos_per_search=config.VIDEOS_PER_SEARCH,
+        cache=cache,
+        rate_limiter=RateLimiter(
+            rate=options.rate,
+            burst=options.burst,
+            min_rate=config.RATE_LIMIT_MIN_PER_SECOND
+        ),
+        backend=backend,
+        planner=planner,
+        page_budget=options.page_budget
+    )
+    
+    refresh = None
+    if options.refresh_from:
+        refresh = RefreshIndex.from_export(options.refresh_from, max_age_days=options.refresh_max_age)
+    checkpoint = CheckpointJournal(shard_path(config.CHECKPOINT_FILE, index, shards), resume=options.resume)
+    writer = StreamWriter(shard_path(options.stream, index, shards)) if options.stream else None
+    
+    try:
+        poems, stats = PoemService(youtube_client).process_multiple_poems(
+            poems,
+            checkpoint=checkpoint,
+            writer=writer,
+            refresh=refresh
+        )
+    finally:
+        checkpoint.close()
+        if writer:
+            writer.close()
+        if cache:
+            cache.close()
+        youtube_client.backend.close()
+            
+    return ShardResult(index, shards, poems, stats, planner.session if planner else {})
+
+
+def merge_results(results: List[ShardResult]) -> Tuple[List[Poem], Dict[str, object]]:
+    """
+    Combine shard results into one catalogue and one statistics dictionary.
+    
+    Poems are put back in catalogue order and videos shared across shards
+    are flagged again over the whole catalogue.
+    
+    Args:
+        results: Results of the shards
+        
+    Returns:
+        Tuple of (poems, statistics dictionary)
+    """
+    poems = sorted((poem for result in results for poem in result.poems), key=lambda p: p.numero)
+    duplicates = PoemService.flag_duplicates(poems)
+    
+    stats = PoemService.statistics_from_table(PoemTable.from_poems(poems))
+    stats['duplicates'] = duplicates
+    for key in SUMMED_STATS:
+        stats[key] = sum(result.stats.get(key, 0) for result in results)
+    for key in ('cache', 'rate_limit', 'author_pool', 'relevance'):
+        parts = [result.stats[key] for result in results if result.stats.get(key)]
+        if parts:
+            stats[key] = _merge_counters(parts)
+    return poems, stats
+
+
+def missing_shards(results: List[ShardResult]) -> List[int]:
+    """
+    Find the shards absent from a set of results.
+    
+    Args:
+        results: Results of the shards
+        
+    Returns:
+        Missing shard numbers (empty if complete)
+        
+    Raises:
+        ValueError: If the results disagree on the number of shards
+    """
+    counts = {result.shards for result in results}
+    if len(counts) > 1:
+        raise ValueError(f"los resultados mezclan distintos números de shards: {sorted(counts)}")
+    if not counts:
+        return []
+    present = {result.index for result in results}
+    return [index for index in range(1, counts.pop() + 1) if index not in present]
+
+
+def save_shard_result(result: ShardResult, filepath: str):
+    """
+    Write a shard result as JSON Lines for a later merge.
+    
+    The first line holds the shard and its counters, every following line
+    one poem record (the checkpoint journal format).
+    
+    Args:
+        result: Result of the shard
+        filepath: Output filepath
+    """
+    header = {
+        'shard': result.index,
+        'shards': result.shards,
+        'stats': {key: value for key, value in result.stats.items()
+                  if not isinstance(value, (list, Counter))},
+    }
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(header, ensure_ascii=False) + '\n')
+        for poem in result.poems:
+            f.write(json.dumps(poem.to_record(), ensure_ascii=False) + '\n')
+
+
+def load_shard_result(filepath: str) -> ShardResult:
+    """
+    Read a shard result written by save_shard_result.
+    
+    Args:
+        filepath: Shard result filepath
+        
+    Returns:
+        ShardResult (without planner outcomes)
+        
+    Raises:
+        ValueError: If the file is not a shard result
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline() or '{}')
+        if 'shard' not in header or 'shards' not in header:
+            raise ValueError(f"'{filepath}' no es un resultado de shard")
+        poems = [Poem.from_record(json.loads(line)) for line in f if line.strip()]
+    return ShardResult(header['shard'], header['shards'], poems, header.get('stats', {}), {})
+
+
+class ShardedRunner:
+    """
+    Runs every shard of a catalogue in its own worker process.
+    
+    Each process has its own interpreter and rate-limit identity, so the
+    shards search at the same time; their results are merged as if one
+    process had searched the whole catalogue.
+    """
+    
+    def __init__(self, shards: int, options: Optional[ShardOptions] = None):
+        """
+        Initialize the runner.
+        
+        Args:
+            shards: Number of shards (and worker processes)
+            options: Client settings shared by all shards
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.shards = shards
+        self.options = options or ShardOptions()
+    
+    def run(
+        self,
+        poems: List[Poem],
+        planner: Optional[QueryPlanner] = None
+    ) -> Tuple[List[Poem], Dict[str, object]]:
+        """
+        Search all poems, one process per shard.
+        
+        A shard that fails is reported and left out of the merge. On
+        KeyboardInterrupt (which the shard processes also receive, and
+        answer by returning the poems searched so far) the shards still
+        running are waited for; a second Ctrl+C abandons them. Either way
+        the shards that completed are merged, and the missing poems can be
+        searched again with --resume.
+        
+        Args:
+            poems: Poems of the catalogue
+            planner: Optional planner that receives the shards' outcomes
+            
+        Returns:
+            Tuple of (merged poems, merged statistics dictionary)
+        """
+        jobs = [(select_shard(poems, index, self.shards), index) for index in range(1, self.shards + 1)]
+        pool = ProcessPoolExecutor(max_workers=self.shards)
+        futures = {
+            pool.submit(run_shard, shard_poems, index, self.shards, self.options): index
+            for shard_poems, index in jobs if shard_poems
+        }
+        results: List[ShardResult] = []
+        collected = set()
+        
+        def collect(future):
+            collected.add(future)
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"    Error en el shard {futures[future]}: {e}")
+        
+        try:
+            for future in as_completed(futures):
+                collect(future)
+        except KeyboardInterrupt:
+            print("\n\n  Proceso interrumpido por el usuario")
+            pending = [f for f in futures if f not in collected and not f.cancel()]
+            try:
+                if pending:
+                    print(f"Esperando {len(pending)} shards en curso... (Ctrl+C de nuevo para abandonarlos)")
+                for future in as_completed(pending):
+                    collect(future)
+            except KeyboardInterrupt:
+                print("Shards en curso abandonados")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        if len(results) < len(futures):
+            done = sorted(result.index for result in results)
+            print(f"Shards completados: {', '.join(map(str, done)) or 'ninguno'} de {self.shards}")
+        if planner:
+            for result in results:
+                planner.merge(result.planner)
+        return merge_results(results)
+
+
+def _merge_counters(parts: List[Dict[str, object]]) -> Dict[str, object]:
+    """Add up numeric counters of several shards (gauges take the maximum)."""
+    merged: Dict[str, object] = {}
+    for part in parts:
+        for key, value in part.items():
+            if key in SHARED_COUNTERS:
+                merged[key] = max(merged.get(key, 0), value)
+            else:
+                merged[key] = merged.get(key, 0) + value
+    return merged
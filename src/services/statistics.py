@@ -0,0 +1,181 @@
+"""Vectorized statistics over processed poems using pandas."""
+
+from typing import Dict, List, Tuple, Union
+import os
+
+from src.models.poem import Poem
+from src.models.poem_table import PoemTable, CategoricalColumn
+
+
+FOUND_STATUSES = ("ENCONTRADO", "PARCIAL")
+
+
+class StatisticsEngine:
+    """
+    Builds one DataFrame from the processed poems and computes every
+    aggregate with vectorized pandas operations.
+    """
+    
+    def __init__(self, frame):
+        """
+        Args:
+            frame: pandas DataFrame with one row per poem
+        """
+        self.frame = frame
+        self._tables = None
+    
+    @classmethod
+    def from_poems(cls, poems: Union[List[Poem], PoemTable]) -> 'StatisticsEngine':
+        """
+        Build the engine from a poem list or a PoemTable.
+        
+        Categorical table columns are handed to pandas as codes, so no
+        per-row Python objects are created for them.
+        
+        Args:
+            poems: List of Poem objects or a PoemTable
+            
+        Returns:
+            StatisticsEngine instance
+        """
+        import numpy as np
+        import pandas as pd
+        
+        table = poems if isinstance(poems, PoemTable) else PoemTable.from_poems(poems)
+        
+        # array.array columns expose the buffer protocol, so these are copies
+        # of contiguous memory rather than per-row conversions
+        data = {
+            'numero': np.asarray(table.numero, dtype=np.int64),
+            'duracion_segundos': np.asarray(table.duracion_segundos, dtype=np.int64),
+            'puntuacion': np.asarray(table.puntuacion, dtype=np.float64),
+        }
+        for name in ('autor', 'genero', 'tipo_contenido', 'calidad', 'disponibilidad'):
+            column: CategoricalColumn = table.column(name)
+            data[name] = pd.Categorical.from_codes(
+                np.asarray(column.codes, dtype=np.int64),
+                categories=column.categories
+            )
+        
+        return cls(pd.DataFrame(data))
+    
+    def compute(self) -> Dict[str, object]:
+        """
+        Compute every aggregate (once; later calls reuse the result).
+        
+        Returns:
+            Dictionary of DataFrames keyed by table name
+        """
+        if self._tables is not None:
+            return self._tables
+        
+        import pandas as pd
+        
+        df = self.frame
+        status = df['disponibilidad'].astype(str)
+        found_mask = status.isin(FOUND_STATUSES)
+        full_mask = status == "ENCONTRADO"
+        
+        summary = status.value_counts().rename_axis('Disponibilidad').reset_index(name='Poemas')
+        summary['Porcentaje'] = summary['Poemas'] / max(len(df), 1) * 100
+        
+        by_author = (
+            df.assign(encontrado=full_mask, parcial=status == "PARCIAL")
+            .groupby('autor', observed=True)
+            .agg(total=('numero', 'size'), encontrados=('encontrado', 'sum'), parciales=('parcial', 'sum'))
+        )
+        by_author['tasa_exito'] = (by_author['encontrados'] + by_author['parciales']) / by_author['total'] * 100
+        by_author = by_author.sort_values(['tasa_exito', 'total'], ascending=False).reset_index()
+        
+        def counts(column: str, mask) -> 'pd.DataFrame':
+            return (
+                df.loc[mask, column].astype(str).value_counts()
+                .rename_axis(column).reset_index(name='poemas')
+            )
+            
+        durations = df.loc[full_mask & (df['duracion_segundos'] > 0), 'duracion_segundos']
+        duration_columns = ['media_s', 'mediana_s', 'p25_s', 'p75_s', 'p90_s', 'p95_s', 'min_s', 'max_s']
+        if len(durations):
+            quantiles = durations.quantile([0.25, 0.5, 0.75, 0.9, 0.95])
+            duration_values = [
+                durations.mean(), quantiles[0.5], quantiles[0.25], quantiles[0.75],
+                quantiles[0.9], quantiles[0.95], durations.min(), durations.max()
+            ]
+        else:
+            duration_values = [0] * len(duration_columns)
+        duration = pd.DataFrame([dict(zip(duration_columns, duration_values), videos=int(durations.size))])
+        
+        self._tables = {
+            'resumen': summary,
+            'autores': by_author,
+            'generos': counts('genero', found_mask),
+            'tipos': counts('tipo_contenido', full_mask),
+            'calidad': counts('calidad', full_mask),
+            'duracion': duration,
+        }
+        return self._tables
+    
+    def print_summary(self, top: int = 5):
+        """
+        Print exact duration figures and per-author success rates.
+        
+        Args:
+            top: Number of authors to show
+        """
+        tables = self.compute()
+        duration = tables['duracion'].iloc[0]
+        
+        if duration['videos']:
+            print(f"\n Duración de los Videos ({int(duration['videos'])} videos):")
+            print(f"   - Media: {self._format_seconds(duration['media_s'])}")
+            print(f"   - Mediana: {self._format_seconds(duration['mediana_s'])}")
+            print(f"   - P90 / P95: {self._format_seconds(duration['p90_s'])} / "
+                  f"{self._format_seconds(duration['p95_s'])}")
+                  
+        authors = tables['autores']
+        if len(authors):
+            print(f"\n Tasa de Éxito por Autor (top {top}):")
+            for row in authors.head(top).itertuples(index=False):
+                print(f"   - {row.autor}: {row.tasa_exito:.1f}% ({row.encontrados + row.parciales}/{row.total})")
+    
+    def excel_sheets(self) -> Dict[str, List[Tuple]]:
+        """
+        Convert the statistics tables to worksheet rows.
+        
+        The rows are written by FileHandler into the workbook it is
+        exporting, so the statistics never require reopening the file.
+        
+        Returns:
+            Dictionary of sheet name -> rows (header first)
+        """
+        sheets = {}
+        for name, frame in self.compute().items():
+            values = frame.astype(object).where(frame.notna(), None)
+            sheets[f"Estadísticas {name}"[:31]] = [tuple(frame.columns)] + list(values.itertuples(index=False, name=None))
+        return sheets
+    
+    def export_parquet(self, directory: str) -> bool:
+        """
+        Write each statistics table as a Parquet file.
+        
+        Args:
+            directory: Output directory (created if needed)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for name, frame in self.compute().items():
+                frame.to_parquet(os.path.join(directory, f"{name}.parquet"), index=False)
+            return True
+            
+        except Exception as e:
+            print(f"Error saving statistics to Parquet: {e}")
+            return False
+    
+    @staticmethod
+    def _format_seconds(seconds: float) -> str:
+        """Format seconds as M:SS."""
+        seconds = int(round(seconds))
+        return f"{seconds // 60}:{seconds % 60:02d}"
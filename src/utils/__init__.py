@@ -1,7 +1,37 @@
-"""Utility modules."""
+"""
+Utility modules.
+
+Public names are imported from their submodule on first use, so importing
+`config` does not load the loaders, exporters or their dependencies.
+"""
+
+from importlib import import_module
 
 from . import config
-from .file_handler import FileHandler
-from .dominican_poems import DOMINICAN_POEMS, get_poems_as_objects
 
-__all__ = ['config', 'FileHandler', 'DOMINICAN_POEMS', 'get_poems_as_objects']
+# Public name -> submodule defining it
+_EXPORTS = {
+    'FileHandler': 'file_handler',
+    'PoemLoader': 'loaders',
+    'LoadReport': 'loaders',
+    'CheckpointJournal': 'checkpoint',
+    'StreamWriter': 'stream_writer',
+    'ResultStore': 'result_store',
+    'StoredRun': 'result_store',
+    'RunProfiler': 'profiler',
+    'NullProfiler': 'profiler',
+    'NULL_PROFILER': 'profiler',
+    'DOMINICAN_POEMS': 'dominican_poems',
+    'get_poems_as_objects': 'dominican_poems',
+}
+
+__all__ = ['config', *_EXPORTS]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining a public name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,92 @@
+"""Append-only checkpoint journal for resumable batch runs."""
+
+from typing import Dict, Tuple
+import json
+import os
+import threading
+
+from src.models.poem import Poem
+
+
+class CheckpointJournal:
+    """
+    Records every processed poem as one JSON line as soon as it completes.
+    
+    A killed run leaves at most one incomplete trailing line, which is
+    ignored when the journal is read back.
+    """
+    
+    def __init__(self, filepath: str, resume: bool = False):
+        """
+        Open the journal.
+        
+        Args:
+            filepath: Path to the JSON Lines journal
+            resume: Keep existing entries instead of starting a new journal
+        """
+        self.filepath = filepath
+        self.resume = resume
+        self._lock = threading.Lock()
+        
+        mode = 'a' if resume else 'w'
+        self._file = open(filepath, mode, encoding='utf-8')
+        
+        # Never glue a new record onto a line cut short by a crash
+        if resume and self._file.tell() > 0:
+            with open(filepath, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self._file.write('\n')
+    
+    @staticmethod
+    def poem_key(poem: Poem) -> Tuple[str, str]:
+        """
+        Build the key used to match journal entries with input poems.
+        
+        Args:
+            poem: Poem object
+            
+        Returns:
+            Tuple of normalized (title, author)
+        """
+        return (poem.titulo.strip().lower(), poem.autor.strip().lower())
+    
+    def load(self) -> Dict[Tuple[str, str], Poem]:
+        """
+        Read back the poems already recorded in the journal.
+        
+        Returns:
+            Dictionary mapping poem key to the last recorded Poem
+        """
+        done = {}
+        if not self.resume or not os.path.exists(self.filepath):
+            return done
+            
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    poem = Poem.from_record(json.loads(line))
+                except (ValueError, TypeError):
+                    # Truncated line from an interrupted write
+                    continue
+                done[self.poem_key(poem)] = poem
+                
+        return done
+    
+    def record(self, poem: Poem):
+        """
+        Append a processed poem and flush it to disk.
+        
+        Args:
+            poem: Processed Poem object
+        """
+        line = json.dumps(poem.to_record(), ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+    
+    def close(self):
+        """Close the journal file."""
+        with self._lock:
+            self._file.close()
@@ -3,13 +3,79 @@
 # YouTube search settings
 VIDEOS_PER_SEARCH = 3  # Number of videos to check per poem
 
+# Lazy paginated search (--lazy-search): result pages are fetched one at a
+# time and a query stops fetching once it has enough acceptable candidates
+SEARCH_PAGE_SIZE = 20  # Videos per results page
+SEARCH_PAGE_BUDGET = 3  # Most pages fetched per query
+SEARCH_TARGET_CANDIDATES = 3  # Acceptable candidates that stop a query's paging
+SEARCH_MIN_RELEVANCE = 0.5  # Candidate score (0-1) needed to count as acceptable
+
+# Async search client (--async-search)
+YOUTUBE_BASE_URL = "https://www.youtube.com"  # Point at a local stand-in server for offline runs
+ASYNC_SEARCH_CONCURRENCY = 8  # HTTP requests in flight at once
+ASYNC_SEARCH_POOL_SIZE = 8  # Keep-alive connections kept open
+ASYNC_SEARCH_TIMEOUT = 20  # Seconds allowed per request
+
+# Request rate limiting (shared by all search workers)
+RATE_LIMIT_PER_SECOND = 2.0  # Maximum sustained search requests per second
+RATE_LIMIT_BURST = 5  # Requests that may be sent back to back before throttling
+RATE_LIMIT_MIN_PER_SECOND = 0.2  # Floor for adaptive backoff after errors/empty pages
+
+# Concurrency settings
+MAX_WORKERS = 4  # Number of poems searched in parallel (1 = sequential)
+
 # Output files
 OUTPUT_FILE = "dominican_poems.xlsx"
 OUTPUT_CSV = "dominican_poems.csv"
+PROFILE_FILE = "run_profile.json"  # Written by --profile
+CHECKPOINT_FILE = "dominican_poems.checkpoint.jsonl"  # Journal of processed poems (for --resume)
+SHARD_RESULTS_FILE = "dominican_poems.results.jsonl"  # Written per shard by --shard i/N (for merge)
+
+# Result store: every run's poems, chosen videos and best candidates (SQLite)
+RESULTS_DB = "dominican_poems.db"
+RESULT_STORE_BATCH_SIZE = 500  # Poems written per transaction
+RESULT_STORE_CANDIDATES = 5  # Best-scoring candidates kept per poem (0 keeps none)
+
+# Excel export
+EXCEL_FAST_EXPORT_MIN_ROWS = 5000  # Use streaming write-only workbooks from this many rows
+EXCEL_ROWS_PER_SHEET = 500000  # Split large exports into sheets of this many rows
+EXCEL_WIDTH_SAMPLE_ROWS = 1000  # Rows per sheet measured for column widths in streaming exports
+EXCEL_STATS_SHEETS = True  # Write the statistics tables as extra sheets of the export
 
 # Optional input file for custom poems
 POEMS_FILE = "poems_list.txt"
 
+# Catalogue loading (txt / CSV / JSONL / XLSX)
+LOADER_BATCH_SIZE = 5000  # Records parsed per batch
+LOADER_WORKERS = 4  # Parser processes for large inputs
+LOADER_PARALLEL_MIN_BYTES = 8 * 1024 * 1024  # Below this total size, parse in-process
+LOADER_MAX_REPORTED_ERRORS = 20  # Error lines printed in the load summary
+
+# Incremental refresh (--refresh-from)
+REFRESH_MAX_AGE_DAYS = 30  # Found results older than this are searched again
+
 # Search parameters
 MIN_VIDEO_DURATION = 30  # Minimum video duration in seconds
 MAX_VIDEO_DURATION = 1200  # Maximum video duration in seconds (20 minutes)
+RANKING_CONFIDENCE_THRESHOLD = 0.75  # Candidate score (0-1) that stops trying further search patterns
+RELEVANCE_MIN_SCORE = 0.6  # Title match (0-1) a video needs to be a candidate at all (0 disables the check)
+
+# Author pool: "{autor} poesía dominicana" is fetched once per author and
+# shared by all of the author's poems
+AUTHOR_POOL_SIZE = 60  # Videos fetched per author (0 disables the pool)
+AUTHOR_POOL_MIN_TITLE_MATCH = 0.8  # Share of the poem title's words a pooled video title needs
+AUTHOR_POOL_MIN_POEMS = 2  # Authors with fewer poems in the catalogue are not pooled
+
+# Adaptive query planner
+PLANNER_STATS_FILE = "query_planner.json"  # Per-pattern win statistics kept across runs
+PLANNER_MIN_ATTEMPTS = 20  # Attempts before a pattern can be pruned
+PLANNER_PRUNE_BELOW = 0.02  # Patterns winning less often than this are skipped
+
+# Command line start-up (checked by `main.py bench imports`)
+CLI_IMPORT_BUDGET_MS = 60  # Import time allowed for --help and the light commands (fastest of several runs)
+
+# Search result cache
+CACHE_FILE = "search_cache.db"
+CACHE_TTL_HOURS = 168  # Cached results older than this are searched again (7 days)
+CACHE_MAX_ENTRIES = 50000  # Least recently used queries are evicted past this size
+CACHE_BUSY_TIMEOUT_SECONDS = 30  # Wait for other processes (shards) writing the cache
@@ -1,9 +1,20 @@
 """File handling utilities for poems data."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Iterator, Iterable, Sequence, Tuple, Union, TYPE_CHECKING
+from itertools import chain, islice
 import os
 
-from src.models.poem import Poem
+from src.models.poem import Poem, EXPORT_COLUMNS
+from src.models.poem_table import PoemTable
+from . import config
+from .loaders import PoemLoader
+
+if TYPE_CHECKING:
+    from .result_store import StoredRun
+
+# Anything the exporters accept: in-memory poems or a stored run streamed
+# from the result store
+PoemSource = Union[List[Poem], PoemTable, 'StoredRun']
 
 
 class FileHandler:
@@ -14,48 +25,47 @@ class FileHandler:
     @staticmethod
     def load_poems_from_file(filepath: str) -> Optional[List[Poem]]:
         """
-        Load poems from a text file.
+        Load poems from a catalogue file.
         
-        Expected format: "Título | Autor | Año | Género" (one per line)
-        Lines starting with # are ignored (comments)
+        Text files use "Título | Autor | Año | Género" (one per line, lines
+        starting with # are comments); CSV, JSON Lines and XLSX files are
+        also accepted (see PoemLoader). Rejected lines are summarized.
         
         Args:
             filepath: Path to the input file
             
         Returns:
-            List of Poem objects or None if file doesn't exist
+            List of Poem objects or None if the file doesn't exist, can't
+            be read or holds no poems
         """
         if not os.path.exists(filepath):
             return None
         
-        poems = []
+        loader = PoemLoader()
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for idx, line in enumerate(f, 1):
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    poem = Poem.create_from_text(idx, line)
-                    if poem:
-                        poems.append(poem)
-            
-            return poems if poems else None
-            
-        except Exception as e:
+            poems = loader.load([filepath])
+        except (OSError, ValueError) as e:
             print(f"Error loading poems from file: {e}")
             return None
+        if loader.report.error_count:
+            loader.report.print_summary()
+        
+        return poems if poems else None
     
     @staticmethod
-    def save_to_excel(poems: List[Poem], filepath: str) -> bool:
+    def save_to_excel(
+        poems: Union[List[Poem], 'StoredRun'],
+        filepath: str,
+        extra_sheets: Optional[Dict[str, Sequence[Sequence]]] = None
+    ) -> bool:
         """
         Save poems to Excel file.
         
         Args:
-            poems: List of Poem objects
+            poems: List of Poem objects or a StoredRun
             filepath: Output filepath
+            extra_sheets: Optional sheet name -> rows (header first) added
+                after the poems, e.g. the statistics tables
             
         Returns:
             True if successful, False otherwise
@@ -70,8 +80,7 @@ class FileHandler:
             ws.title = "Poemas Dominicanos"
             
             # Headers
-            headers = list(poems[0].to_dict().keys())
-            ws.append(headers)
+            ws.append(EXPORT_COLUMNS)
             
             # Style headers
             header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
@@ -103,8 +112,9 @@ class FileHandler:
                 ws.column_dimensions[column_letter].width = adjusted_width
             
             # Color-code by availability
+            availability_column = EXPORT_COLUMNS.index('Disponibilidad') + 1
             for row_idx, poem in enumerate(poems, start=2):
-                availability_cell = ws.cell(row=row_idx, column=len(headers))
+                availability_cell = ws.cell(row=row_idx, column=availability_column)
                 
                 if poem.disponibilidad == "ENCONTRADO":
                     availability_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
@@ -116,6 +126,8 @@ class FileHandler:
                     availability_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
                     availability_cell.font = Font(color="9C0006")
             
+            FileHandler._add_sheets(wb, extra_sheets)
+            
             # Save file
             wb.save(filepath)
             return True
@@ -125,12 +137,177 @@ class FileHandler:
             return False
     
     @staticmethod
-    def save_to_csv(poems: List[Poem], filepath: str) -> bool:
+    def save_to_excel_fast(
+        poems: PoemSource,
+        filepath: str,
+        rows_per_sheet: Optional[int] = None,
+        split_files: bool = False,
+        width_sample_rows: int = config.EXCEL_WIDTH_SAMPLE_ROWS,
+        extra_sheets: Optional[Dict[str, Sequence[Sequence]]] = None
+    ) -> bool:
+        """
+        Save poems to Excel using streaming (write-only) worksheets.
+        
+        Meant for large catalogues: rows are streamed to the file as they
+        are produced, column widths are measured on the first rows of each
+        sheet, styles are shared and the availability colours come from
+        conditional formatting instead of per-cell styles.
+        
+        Args:
+            poems: List of Poem objects, a PoemTable or a StoredRun
+            filepath: Output filepath
+            rows_per_sheet: Split the output into sheets of this many rows
+            split_files: Write each chunk to its own file
+                ("name.part1.xlsx", ...) instead of its own sheet
+            width_sample_rows: Rows per sheet measured for the column widths
+            extra_sheets: Optional sheet name -> rows (header first) added
+                after the poems (to the last file when splitting files)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            import openpyxl
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.formatting.rule import CellIsRule, FormulaRule
+            from openpyxl.styles import Font, PatternFill, Alignment
+            from openpyxl.utils import get_column_letter
+            
+            if not poems:
+                return False
+            
+            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            header_font = Font(bold=True, color="FFFFFF")
+            header_alignment = Alignment(horizontal="center", vertical="center")
+            letters = [get_column_letter(idx) for idx in range(1, len(EXPORT_COLUMNS) + 1)]
+            availability_letter = letters[EXPORT_COLUMNS.index('Disponibilidad')]
+            found_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+            partial_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+            missing_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+            availability_rules = [
+                CellIsRule(operator='equal', formula=['"ENCONTRADO"'], fill=found_fill, font=Font(color="006100")),
+                CellIsRule(operator='equal', formula=['"PARCIAL"'], fill=partial_fill, font=Font(color="9C5700")),
+                # Any other value (NO ENCONTRADO, blank, ...) is red, as in save_to_excel
+                FormulaRule(
+                    formula=[f'AND({availability_letter}2<>"ENCONTRADO",{availability_letter}2<>"PARCIAL")'],
+                    fill=missing_fill, font=Font(color="9C0006")
+                ),
+            ]
+            
+            chunk_size = rows_per_sheet or len(poems)
+            chunk_count = (len(poems) + chunk_size - 1) // chunk_size
+            chunks = FileHandler._chunk(FileHandler._export_rows(poems), chunk_size)
+            base, ext = os.path.splitext(filepath)
+            wb = None
+            
+            for part, chunk in enumerate(chunks, 1):
+                if wb is None or split_files:
+                    wb = openpyxl.Workbook(write_only=True)
+                
+                title = "Poemas Dominicanos" if chunk_count == 1 or split_files else f"Poemas {part}"
+                ws = wb.create_sheet(title)
+                
+                # Widths come from a bounded sample: the rest is never held in memory
+                sample = list(islice(chunk, width_sample_rows))
+                widths = [len(header) for header in EXPORT_COLUMNS]
+                for row in sample:
+                    for idx, value in enumerate(row):
+                        length = len(value) if isinstance(value, str) else len(str(value))
+                        if length > widths[idx]:
+                            widths[idx] = length
+                
+                # Column dimensions must be set before the first row is written
+                for letter, width in zip(letters, widths):
+                    ws.column_dimensions[letter].width = min(width + 2, 80)
+                
+                header_cells = []
+                for header in EXPORT_COLUMNS:
+                    cell = WriteOnlyCell(ws, value=header)
+                    cell.fill = header_fill
+                    cell.font = header_font
+                    cell.alignment = header_alignment
+                    header_cells.append(cell)
+                ws.append(header_cells)
+                
+                row_count = 0
+                for row in chain(sample, chunk):
+                    ws.append(row)
+                    row_count += 1
+                
+                cell_range = f"{availability_letter}2:{availability_letter}{row_count + 1}"
+                for rule in availability_rules:
+                    ws.conditional_formatting.add(cell_range, rule)
+                
+                if split_files:
+                    if part == chunk_count:
+                        FileHandler._add_sheets(wb, extra_sheets)
+                    wb.save(f"{base}.part{part}{ext}" if chunk_count > 1 else filepath)
+            
+            if not split_files:
+                FileHandler._add_sheets(wb, extra_sheets)
+                wb.save(filepath)
+            return True
+            
+        except Exception as e:
+            print(f"Error saving to Excel: {e}")
+            return False
+    
+    @staticmethod
+    def _add_sheets(wb, sheets: Optional[Dict[str, Sequence[Sequence]]]):
+        """
+        Append plain sheets to a workbook (normal or write-only) before saving.
+        
+        Args:
+            wb: openpyxl Workbook
+            sheets: Optional sheet name -> rows
+        """
+        for title, rows in (sheets or {}).items():
+            ws = wb.create_sheet(title)
+            for row in rows:
+                ws.append(row)
+    
+    @staticmethod
+    def _export_rows(poems: PoemSource) -> Iterator[Tuple]:
+        """
+        Iterate export rows without building per-poem dictionaries.
+        
+        Args:
+            poems: List of Poem objects, a PoemTable or a StoredRun
+            
+        Returns:
+            Iterator of tuples in EXPORT_COLUMNS order
+        """
+        if hasattr(poems, 'iter_export_rows'):
+            # PoemTable zips its columns, StoredRun reads a database cursor
+            return poems.iter_export_rows()
+        return (poem.to_row() for poem in poems)
+    
+    @staticmethod
+    def _chunk(rows: Iterable[Tuple], size: int) -> Iterator[Iterator[Tuple]]:
+        """
+        Split a stream of rows into consecutive chunks, without buffering them.
+        
+        Each chunk reads from the shared stream, so it must be consumed
+        before the next one is requested.
+        
+        Args:
+            rows: Iterable of export rows
+            size: Maximum chunk size
+            
+        Yields:
+            Iterators over at most `size` rows
+        """
+        rows = iter(rows)
+        for first in rows:
+            yield chain((first,), islice(rows, size - 1))
+    
+    @staticmethod
+    def save_to_csv(poems: PoemSource, filepath: str) -> bool:
         """
         Save poems to CSV file.
         
         Args:
-            poems: List of Poem objects
+            poems: List of Poem objects, a PoemTable or a StoredRun
             filepath: Output filepath
             
         Returns:
@@ -140,17 +317,12 @@ class FileHandler:
             import csv
             
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                if not poems:
+                if not len(poems):
                     return False
                 
-                # Get headers from first poem
-                headers = list(poems[0].to_dict().keys())
-                
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                
-                for poem in poems:
-                    writer.writerow(poem.to_dict())
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_COLUMNS)
+                writer.writerows(FileHandler._export_rows(poems))
             
             return True
             
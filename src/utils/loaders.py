@@ -0,0 +1,420 @@
+"""Streaming catalogue loaders for txt, CSV, JSON Lines and XLSX inputs."""
+
+from collections import deque
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+import csv
+import json
+import os
+import unicodedata
+
+from src.models.duration import duration_to_seconds
+from src.models.poem import Poem, EXPORT_COLUMNS, EXPORT_FIELDS
+from src.models.poem_table import PoemTable
+from . import config
+
+
+# File extension -> input format
+FORMATS = {
+    '.txt': 'txt',
+    '.csv': 'csv',
+    '.tsv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.xlsx': 'xlsx',
+}
+
+
+def header_key(name) -> str:
+    """
+    Normalize a column name for matching (lowercase, no accents or underscores).
+    
+    Args:
+        name: Column name
+        
+    Returns:
+        Normalized key
+    """
+    text = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode('ascii')
+    return ' '.join(text.lower().replace('_', ' ').split())
+
+
+# Column name -> Poem field. Accepts field names, export column names (so
+# previous exports load back with their results) and a few English aliases.
+# The source '#' column is ignored: numbers are reassigned contiguously.
+FIELD_ALIASES: Dict[str, str] = {}
+for _column, _field in zip(EXPORT_COLUMNS, EXPORT_FIELDS):
+    if _field != 'numero':
+        for _name in (_column, _field):
+            FIELD_ALIASES[_name] = _field
+            FIELD_ALIASES[header_key(_name)] = _field
+FIELD_ALIASES.update({
+    'title': 'titulo',
+    'author': 'autor',
+    'year': 'año',
+    'anio': 'año',
+    'genre': 'genero',
+    'url': 'url_youtube',
+})
+del _column, _field, _name
+
+
+class LoadIssue(NamedTuple):
+    """A record that could not be loaded."""
+    source: str
+    line: int
+    message: str
+
+
+class LoadReport:
+    """
+    Summary of a load: poems per source, skipped lines and per-line errors.
+    """
+    
+    def __init__(self, max_errors: int = config.LOADER_MAX_REPORTED_ERRORS):
+        """
+        Args:
+            max_errors: Number of error lines kept for printing
+        """
+        self.max_errors = max_errors
+        self.loaded: Dict[str, int] = {}
+        self.skipped = 0
+        self.error_count = 0
+        self.errors: List[LoadIssue] = []
+    
+    @property
+    def total(self) -> int:
+        """Number of poems loaded from every source."""
+        return sum(self.loaded.values())
+    
+    def add_issues(self, issues: Iterable[LoadIssue]):
+        """
+        Record rejected lines (only the first max_errors are kept).
+        
+        Args:
+            issues: LoadIssue entries
+        """
+        for issue in issues:
+            self.error_count += 1
+            if len(self.errors) < self.max_errors:
+                self.errors.append(issue)
+    
+    def print_summary(self):
+        """Print poems per source, skipped lines and the first errors."""
+        print(f"\n Carga del Catálogo ({self.total} poemas):")
+        for source, count in self.loaded.items():
+            print(f"   - {source}: {count}")
+        if self.skipped:
+            print(f"   - Líneas omitidas (vacías o comentarios): {self.skipped}")
+        if self.error_count:
+            print(f"   - Líneas con errores: {self.error_count}")
+            for issue in self.errors:
+                print(f"       {issue.source}:{issue.line}: {issue.message}")
+            if self.error_count > len(self.errors):
+                print(f"       ... y {self.error_count - len(self.errors)} más")
+
+
+def build_record(pairs: Iterable[Tuple[Optional[str], object]]) -> Optional[Dict[str, object]]:
+    """
+    Validate (field, value) pairs and build Poem keyword arguments.
+    
+    Args:
+        pairs: (Poem field or None, raw value) pairs
+        
+    Returns:
+        Keyword arguments for Poem (without numero), or None for a blank record
+        
+    Raises:
+        ValueError: If title or author is missing or a value has the wrong type
+    """
+    record: Dict[str, object] = {}
+    blank = True
+    for field, value in pairs:
+        if value is None:
+            continue
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        text = str(value).strip()
+        if not text:
+            continue
+        blank = False
+        if field is None or field == 'numero':
+            continue
+        if field == 'puntuacion':
+            try:
+                record[field] = float(text)
+            except ValueError:
+                raise ValueError(f"puntuación no numérica: {text!r}")
+        else:
+            record[field] = text
+            
+    if blank:
+        return None
+    if not record.get('titulo') or not record.get('autor'):
+        raise ValueError("faltan el título o el autor")
+    record.setdefault('año', "N/A")
+    record.setdefault('genero', "N/A")
+    if 'duracion' in record:
+        record['duracion_segundos'] = duration_to_seconds(record['duracion'])
+    return record
+
+
+def _parse_text_line(line: str, columns) -> Optional[Dict[str, object]]:
+    """Parse a "Título | Autor | Año | Género" line (None for comments)."""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    parts = line.split('|')
+    if len(parts) < 2:
+        raise ValueError("se esperaba 'Título | Autor | Año | Género'")
+    return build_record(zip(('titulo', 'autor', 'año', 'genero'), parts))
+
+
+def _parse_json_line(line: str, columns) -> Optional[Dict[str, object]]:
+    """Parse one JSON Lines object keyed by field or export column names."""
+    if not line.strip():
+        return None
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON inválido: {e.msg}")
+    if not isinstance(data, dict):
+        raise ValueError("se esperaba un objeto JSON")
+    return build_record(
+        (FIELD_ALIASES.get(key) or FIELD_ALIASES.get(header_key(key)), value)
+        for key, value in data.items()
+    )
+
+
+def _parse_row(row: Sequence, columns) -> Optional[Dict[str, object]]:
+    """Parse a CSV / worksheet row using the mapped header columns."""
+    return build_record(zip(columns, row))
+
+
+_PARSERS = {
+    'txt': _parse_text_line,
+    'jsonl': _parse_json_line,
+    'csv': _parse_row,
+    'xlsx': _parse_row,
+}
+
+
+def parse_batch(
+    fmt: str,
+    source: str,
+    columns: Optional[Tuple[Optional[str], ...]],
+    batch: List[Tuple[int, object]]
+) -> Tuple[str, List[Dict[str, object]], List[LoadIssue], int]:
+    """
+    Parse a batch of raw records (runs in worker processes).
+    
+    Args:
+        fmt: Input format
+        source: Source label for error messages
+        columns: Poem field per column (tabular formats only)
+        batch: (line number, raw line or row) pairs
+        
+    Returns:
+        Tuple of (source, records, issues, skipped line count)
+    """
+    parser = _PARSERS[fmt]
+    records = []
+    issues = []
+    skipped = 0
+    for line_no, raw in batch:
+        try:
+            record = parser(raw, columns)
+        except ValueError as e:
+            issues.append(LoadIssue(source, line_no, str(e)))
+            continue
+        if record is None:
+            skipped += 1
+        else:
+            records.append(record)
+    return source, records, issues, skipped
+
+
+class PoemLoader:
+    """
+    Streams poems from one or more catalogue files.
+    
+    Files are read lazily and cut into batches; large inputs are parsed by a
+    process pool while the next batches (of the same or the following file)
+    are being read. Poems are yielded in input order and numbered
+    contiguously, and rejected lines are collected in a LoadReport.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = config.LOADER_BATCH_SIZE,
+        workers: int = config.LOADER_WORKERS,
+        parallel_min_bytes: int = config.LOADER_PARALLEL_MIN_BYTES
+    ):
+        """
+        Args:
+            batch_size: Records parsed per batch
+            workers: Parser processes, capped at the CPU count (1 parses in-process)
+            parallel_min_bytes: Total input size from which the pool is used
+        """
+        self.batch_size = batch_size
+        self.workers = min(workers, os.cpu_count() or 1)
+        self.parallel_min_bytes = parallel_min_bytes
+        self.report = LoadReport()
+    
+    def iter_poems(self, paths: Sequence[str]) -> Iterator[Poem]:
+        """
+        Stream poems from the given files, in order.
+        
+        Args:
+            paths: Input filepaths (.txt, .csv, .tsv, .jsonl, .ndjson, .xlsx)
+            
+        Yields:
+            Poem objects numbered from 1
+        """
+        self.report = LoadReport()
+        numero = 0
+        for source, records, issues, skipped in self._parsed_batches(paths):
+            self.report.add_issues(issues)
+            self.report.skipped += skipped
+            self.report.loaded[source] = self.report.loaded.get(source, 0) + len(records)
+            for record in records:
+                numero += 1
+                yield Poem(numero=numero, **record)
+    
+    def load(self, paths: Sequence[str]) -> List[Poem]:
+        """
+        Load every poem into a list.
+        
+        Args:
+            paths: Input filepaths
+            
+        Returns:
+            List of Poem objects
+        """
+        return list(self.iter_poems(paths))
+    
+    def load_table(self, paths: Sequence[str]) -> PoemTable:
+        """
+        Load every poem into a columnar PoemTable (for very large catalogues).
+        
+        Args:
+            paths: Input filepaths
+            
+        Returns:
+            PoemTable with one row per poem
+        """
+        return PoemTable.from_poems(self.iter_poems(paths))
+    
+    def _parsed_batches(self, paths: Sequence[str]) -> Iterator[Tuple]:
+        """Parse batches in order, in a process pool for large inputs."""
+        batches = self._batches(paths)
+        total_size = sum(os.path.getsize(p) for p in paths if os.path.isfile(p))
+        
+        if self.workers <= 1 or total_size < self.parallel_min_bytes:
+            for args in batches:
+                yield parse_batch(*args)
+            return
+            
+        # Imported here: multiprocessing is only needed for large inputs
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Bounded window of in-flight batches keeps memory flat
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for args in batches:
+                pending.append(executor.submit(parse_batch, *args))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def _batches(self, paths: Sequence[str]) -> Iterator[Tuple]:
+        """
+        Cut every input segment into batches of raw records.
+        
+        A file that can't be read or decoded is recorded in the report like
+        a missing one; the batches already read from it are kept.
+        """
+        for path in paths:
+            try:
+                for fmt, source, columns, rows in self._segments(path):
+                    while True:
+                        batch = list(islice(rows, self.batch_size))
+                        if not batch:
+                            break
+                        yield fmt, source, columns, batch
+            except (OSError, ValueError) as e:
+                self.report.add_issues([LoadIssue(path, 0, f"no se pudo leer el archivo ({e})")])
+    
+    def _segments(self, path: str) -> Iterator[Tuple]:
+        """
+        Open one input and yield its segments (one per worksheet for XLSX).
+        
+        Yields:
+            Tuples of (format, source label, columns, (line, raw) iterator)
+        """
+        fmt = FORMATS.get(os.path.splitext(path)[1].lower())
+        if not os.path.isfile(path):
+            self.report.add_issues([LoadIssue(path, 0, "archivo no encontrado")])
+            return
+        if fmt is None:
+            self.report.add_issues([LoadIssue(path, 0, "formato no soportado")])
+            return
+            
+        if fmt in ('txt', 'jsonl'):
+            with open(path, 'r', encoding='utf-8') as f:
+                yield fmt, path, None, enumerate(f, 1)
+                
+        elif fmt == 'csv':
+            with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+                reader = csv.reader(f, self._sniff_dialect(f))
+                columns = self._map_header(next(reader, None))
+                if columns is None:
+                    self.report.add_issues([LoadIssue(path, 1, "el encabezado no tiene columnas de título y autor")])
+                    return
+                yield fmt, path, columns, ((reader.line_num, row) for row in reader)
+                
+        else:
+            import openpyxl
+            
+            workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+            try:
+                for sheet in workbook.worksheets:
+                    rows = sheet.iter_rows(values_only=True)
+                    columns = self._map_header(next(rows, None))
+                    # Sheets without title/author columns (e.g. statistics) are skipped
+                    if columns is not None:
+                        yield fmt, f"{path}:{sheet.title}", columns, enumerate(rows, 2)
+            finally:
+                workbook.close()
+    
+    @staticmethod
+    def _map_header(header: Optional[Sequence]) -> Optional[Tuple[Optional[str], ...]]:
+        """
+        Map header cells to Poem fields.
+        
+        Args:
+            header: Header row
+            
+        Returns:
+            Poem field (or None) per column, or None without title/author columns
+        """
+        if not header:
+            return None
+        columns = tuple(
+            FIELD_ALIASES.get(header_key(name)) if name is not None else None
+            for name in header
+        )
+        if 'titulo' not in columns or 'autor' not in columns:
+            return None
+        return columns
+    
+    @staticmethod
+    def _sniff_dialect(f) -> type:
+        """Detect the CSV delimiter from the start of the file."""
+        sample = f.read(64 * 1024)
+        f.seek(0)
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=',;\t|')
+        except csv.Error:
+            return csv.excel
@@ -0,0 +1,304 @@
+"""Run instrumentation: per-query timings, rejections, errors and export times."""
+
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+import json
+import threading
+import time
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of numbers.
+    
+    Args:
+        values: Numbers (need not be sorted)
+        pct: Percentile between 0 and 100
+        
+    Returns:
+        Percentile value (0.0 for an empty list)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def _summarize(values: List[float]) -> Dict[str, float]:
+    """Count, total, mean, p50, p95 and max of a list of durations."""
+    total = sum(values)
+    return {
+        'count': len(values),
+        'total_s': round(total, 4),
+        'mean_s': round(total / len(values), 4) if values else 0.0,
+        'p50_s': round(percentile(values, 50), 4),
+        'p95_s': round(percentile(values, 95), 4),
+        'max_s': round(max(values), 4) if values else 0.0,
+    }
+
+
+class RunProfiler:
+    """
+    Collects timings and counters from every layer of a run.
+    
+    YouTubeClient records each query (source, rate-limit wait, latency,
+    results, errors), candidate rejections and which pattern won;
+    PoemService records per-poem latency and outcome; timed sections
+    (loading, exports) are measured with timer(). Thread-safe.
+    """
+    
+    enabled = True
+    
+    def __init__(self):
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.query_latencies: Dict[str, List[float]] = {'backend': [], 'cache': []}
+        self.wait_seconds = 0.0
+        self.results = Counter()
+        self.empty_queries = 0
+        self.patterns: Dict[str, Dict[str, float]] = {}
+        self.rejections = Counter()
+        self.exceptions = Counter()
+        self.winner_positions = Counter()
+        self.poem_latencies: List[float] = []
+        self.poem_status = Counter()
+        self.sections: Dict[str, float] = {}
+        self.extra: Dict[str, object] = {}
+    
+    def record_query(
+        self,
+        pattern: str,
+        source: str,
+        seconds: float,
+        results: int,
+        wait: float = 0.0,
+        error: Optional[BaseException] = None
+    ):
+        """
+        Record one search query.
+        
+        Args:
+            pattern: Search pattern the query came from ("" if unknown)
+            source: 'backend' or 'cache'
+            seconds: Time spent in the backend (or cache lookup)
+            results: Number of videos returned
+            wait: Seconds spent waiting on the rate limiter
+            error: Exception raised by the backend, if any
+        """
+        with self._lock:
+            self.query_latencies.setdefault(source, []).append(seconds)
+            self.wait_seconds += wait
+            self.results[source] += results
+            if not results and error is None:
+                self.empty_queries += 1
+            entry = self.patterns.setdefault(
+                pattern, {'queries': 0, 'seconds': 0.0, 'results': 0, 'errors': 0, 'wins': 0}
+            )
+            entry['queries'] += 1
+            entry['seconds'] += seconds
+            entry['results'] += results
+            if error is not None:
+                entry['errors'] += 1
+    
+    def record_rejection(self, reason: str, count: int = 1):
+        """
+        Count candidates discarded before ranking.
+        
+        Args:
+            reason: e.g. 'duration_short', 'duration_long', 'parse', 'relevance', 'claimed'
+            count: Number of candidates
+        """
+        with self._lock:
+            self.rejections[reason] += count
+    
+    def record_exception(self, where: str, error: BaseException):
+        """
+        Count an exception that was caught and skipped.
+        
+        Args:
+            where: Layer that caught it (e.g. 'search', 'poem')
+            error: The exception
+        """
+        with self._lock:
+            self.exceptions[f"{where}:{type(error).__name__}"] += 1
+    
+    def record_winner(self, pattern: Optional[str], position: Optional[int]):
+        """
+        Record which pattern produced the chosen video.
+        
+        Args:
+            pattern: Winning pattern, or None when nothing was found
+            position: Index of the pattern in the planned order
+        """
+        with self._lock:
+            self.winner_positions['none' if position is None else str(position)] += 1
+            if pattern is not None:
+                entry = self.patterns.setdefault(
+                    pattern, {'queries': 0, 'seconds': 0.0, 'results': 0, 'errors': 0, 'wins': 0}
+                )
+                entry['wins'] += 1
+    
+    def record_poem(self, seconds: float, status: str):
+        """
+        Record one processed poem.
+        
+        Args:
+            seconds: Time spent searching it
+            status: 'found' or 'not_found'
+        """
+        with self._lock:
+            self.poem_latencies.append(seconds)
+            self.poem_status[status] += 1
+    
+    @contextmanager
+    def timer(self, section: str) -> Iterator[None]:
+        """
+        Time a block of code and add it to a named section.
+        
+        Args:
+            section: Section name (e.g. 'export_excel')
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.sections[section] = self.sections.get(section, 0.0) + elapsed
+    
+    def attach(self, name: str, data: object):
+        """
+        Include extra JSON-serializable data (e.g. cache stats) in the profile.
+        
+        Args:
+            name: Key in the profile
+            data: Data to include
+        """
+        with self._lock:
+            self.extra[name] = data
+    
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Build the machine-readable profile.
+        
+        Returns:
+            Profile dictionary
+        """
+        with self._lock:
+            profile = {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'wall_seconds': round(time.perf_counter() - self._start, 3),
+                'queries': {
+                    source: dict(_summarize(latencies), results=self.results[source])
+                    for source, latencies in self.query_latencies.items()
+                },
+                'rate_limit_wait_s': round(self.wait_seconds, 3),
+                'empty_queries': self.empty_queries,
+                'patterns': {
+                    pattern: dict(entry, seconds=round(entry['seconds'], 4))
+                    for pattern, entry in self.patterns.items()
+                },
+                'winner_positions': dict(self.winner_positions),
+                'rejections': dict(self.rejections),
+                'exceptions': dict(self.exceptions),
+                'poems': dict(_summarize(self.poem_latencies), status=dict(self.poem_status)),
+                'sections_s': {name: round(seconds, 4) for name, seconds in self.sections.items()},
+            }
+            profile.update(self.extra)
+        return profile
+    
+    def save(self, filepath: str) -> bool:
+        """
+        Write the profile as JSON.
+        
+        Args:
+            filepath: Output filepath
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            return True
+        except OSError as e:
+            print(f"Error saving profile: {e}")
+            return False
+    
+    def format_table(self) -> str:
+        """
+        Format a summary of where the run spent its time.
+        
+        Returns:
+            Multi-line table
+        """
+        profile = self.to_dict()
+        lines = [f"\n Perfil de Ejecución ({profile['wall_seconds']:.1f} s):"]
+        lines.append(f"   {'Etapa':<28}{'Cantidad':>10}{'Total (s)':>12}{'p50 (s)':>10}{'p95 (s)':>10}")
+        for source, summary in profile['queries'].items():
+            if summary['count']:
+                lines.append(f"   {'Consultas (' + source + ')':<28}{summary['count']:>10}"
+                             f"{summary['total_s']:>12.2f}{summary['p50_s']:>10.3f}{summary['p95_s']:>10.3f}")
+        lines.append(f"   {'Espera del limitador':<28}{'':>10}{profile['rate_limit_wait_s']:>12.2f}")
+        poems = profile['poems']
+        if poems['count']:
+            lines.append(f"   {'Poemas':<28}{poems['count']:>10}"
+                         f"{poems['total_s']:>12.2f}{poems['p50_s']:>10.3f}{poems['p95_s']:>10.3f}")
+        for name, seconds in profile['sections_s'].items():
+            lines.append(f"   {name:<28}{'':>10}{seconds:>12.2f}")
+            
+        if profile['patterns']:
+            lines.append(f"\n   {'Patrón':<40}{'Consultas':>10}{'Resultados':>12}{'Errores':>9}{'Ganó':>7}")
+            for pattern, entry in sorted(profile['patterns'].items(), key=lambda item: -item[1]['wins']):
+                lines.append(f"   {pattern[:39]:<40}{entry['queries']:>10}{entry['results']:>12}"
+                             f"{entry['errors']:>9}{entry['wins']:>7}")
+        if profile['winner_positions']:
+            positions = ', '.join(f"{pos}: {count}" for pos, count in sorted(profile['winner_positions'].items()))
+            lines.append(f"\n   Posición del patrón ganador: {positions}")
+        if profile['rejections']:
+            rejections = ', '.join(f"{reason}: {count}" for reason, count in profile['rejections'].items())
+            lines.append(f"   Candidatos descartados: {rejections}")
+        if profile['exceptions']:
+            exceptions = ', '.join(f"{name}: {count}" for name, count in profile['exceptions'].items())
+            lines.append(f"   Excepciones: {exceptions}")
+        return '\n'.join(lines)
+
+
+class NullProfiler:
+    """
+    Drop-in RunProfiler that records nothing.
+    
+    Instrumented code checks `enabled` before taking timestamps, so a
+    disabled profiler costs one attribute lookup per instrumented call.
+    """
+    
+    enabled = False
+    
+    def record_query(self, *args, **kwargs):
+        pass
+    
+    def record_rejection(self, *args, **kwargs):
+        pass
+    
+    def record_exception(self, *args, **kwargs):
+        pass
+    
+    def record_winner(self, *args, **kwargs):
+        pass
+    
+    def record_poem(self, *args, **kwargs):
+        pass
+    
+    def timer(self, section: str):
+        return nullcontext()
+    
+    def attach(self, *args, **kwargs):
+        pass
+
+
+# Shared no-op instance used when profiling is disabled
+NULL_PROFILER = NullProfiler()
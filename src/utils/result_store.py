@@ -0,0 +1,451 @@
+"""SQLite store keeping the results of every search run."""
+
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+import sqlite3
+import threading
+
+from src.models.poem import Poem
+from src.utils import config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    label TEXT NOT NULL DEFAULT '',
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    total INTEGER NOT NULL DEFAULT 0,
+    found INTEGER NOT NULL DEFAULT 0,
+    partial INTEGER NOT NULL DEFAULT 0,
+    not_found INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS poems (
+    id INTEGER PRIMARY KEY,
+    titulo TEXT NOT NULL,
+    autor TEXT NOT NULL,
+    año TEXT NOT NULL,
+    genero TEXT NOT NULL,
+    UNIQUE (titulo, autor, año, genero)
+);
+CREATE INDEX IF NOT EXISTS idx_poems_autor ON poems (autor);
+CREATE TABLE IF NOT EXISTS choices (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    numero INTEGER NOT NULL,
+    poem_id INTEGER NOT NULL REFERENCES poems (id),
+    url_youtube TEXT NOT NULL,
+    duracion TEXT NOT NULL,
+    duracion_segundos INTEGER NOT NULL,
+    recitador TEXT NOT NULL,
+    tipo_contenido TEXT NOT NULL,
+    calidad TEXT NOT NULL,
+    puntuacion REAL NOT NULL,
+    notas TEXT NOT NULL,
+    disponibilidad TEXT NOT NULL,
+    duplicado TEXT NOT NULL,
+    actualizado TEXT NOT NULL,
+    paginas INTEGER NOT NULL,
+    descartados INTEGER NOT NULL,
+    PRIMARY KEY (run_id, numero)
+);
+CREATE INDEX IF NOT EXISTS idx_choices_poem ON choices (poem_id, run_id);
+CREATE INDEX IF NOT EXISTS idx_choices_url ON choices (url_youtube);
+CREATE TABLE IF NOT EXISTS candidates (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    numero INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    video_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    duracion_segundos INTEGER NOT NULL,
+    tipo_contenido TEXT NOT NULL,
+    calidad TEXT NOT NULL,
+    puntuacion REAL NOT NULL,
+    pattern TEXT NOT NULL,
+    PRIMARY KEY (run_id, numero, rank)
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_video ON candidates (video_id);
+"""
+
+# Choice columns written for each poem, after run_id, numero and poem_id
+CHOICE_FIELDS = (
+    'url_youtube', 'duracion', 'duracion_segundos', 'recitador', 'tipo_contenido', 'calidad',
+    'puntuacion', 'notas', 'disponibilidad', 'duplicado', 'actualizado', 'paginas', 'descartados'
+)
+
+# Poem fields of a stored poem and the query selecting them, in the same order
+POEM_COLUMNS = ('numero', 'titulo', 'autor', 'año', 'genero') + CHOICE_FIELDS
+POEM_SELECT = "c.numero, p.titulo, p.autor, p.año, p.genero, " + ", ".join(f"c.{name}" for name in CHOICE_FIELDS)
+
+
+class RunSummary(NamedTuple):
+    """One stored run and its availability counts."""
+    id: int
+    label: str
+    started_at: str
+    finished_at: Optional[str]  # None while running or if the run was killed
+    total: int
+    found: int
+    partial: int
+    not_found: int
+
+
+class PoemHistory(NamedTuple):
+    """Result of one poem in one stored run."""
+    run_id: int
+    started_at: str
+    disponibilidad: str
+    url_youtube: str
+    puntuacion: float
+
+
+class StoredRun:
+    """
+    Read-only view of one stored run, for the exporters.
+    
+    Iterating yields Poem objects and iter_export_rows yields export
+    tuples, both in poem number order and straight from a database
+    cursor, so a run is never loaded into memory as a whole. Every
+    iteration uses its own connection and can run while a search is
+    still writing to the store.
+    """
+    
+    def __init__(self, filepath: str, run_id: int):
+        """
+        Args:
+            filepath: Path to the SQLite file
+            run_id: Stored run to read
+        """
+        self.filepath = filepath
+        self.run_id = run_id
+    
+    def _rows(self, columns: str) -> Iterator[Tuple]:
+        """Stream the choices of the run joined with their poems."""
+        conn = sqlite3.connect(self.filepath)
+        try:
+            cursor = conn.execute(
+                f"SELECT {columns} FROM choices c JOIN poems p ON p.id = c.poem_id "
+                "WHERE c.run_id = ? ORDER BY c.numero",
+                (self.run_id,)
+            )
+            cursor.arraysize = 1000
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            conn.close()
+    
+    def __iter__(self) -> Iterator[Poem]:
+        return (Poem(**dict(zip(POEM_COLUMNS, row))) for row in self._rows(POEM_SELECT))
+    
+    def iter_export_rows(self) -> Iterator[Tuple]:
+        """
+        Iterate export rows without building Poem objects.
+        
+        Yields:
+            Tuples of column values in EXPORT_COLUMNS order
+        """
+        for row in self._rows(
+            "c.numero, p.titulo, p.autor, p.año, p.genero, c.url_youtube, c.duracion, c.recitador, "
+            "c.tipo_contenido, c.calidad, c.puntuacion, c.notas, c.disponibilidad, c.duplicado, c.actualizado"
+        ):
+            yield row[:10] + (round(row[10], 3),) + row[11:]
+    
+    def __len__(self) -> int:
+        conn = sqlite3.connect(self.filepath)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM choices WHERE run_id = ?", (self.run_id,)).fetchone()[0]
+        finally:
+            conn.close()
+
+
+class ResultStore:
+    """
+    SQLite database keeping the poems, chosen videos and best candidates of
+    every run, so results can be compared across runs and read by other
+    tools.
+    
+    Writes are buffered and committed in batches of batch_size poems (WAL
+    journal, one transaction per batch), so recording a poem from the
+    search loop costs a list append. Candidates may be added from the
+    search worker threads.
+    """
+    
+    def __init__(
+        self,
+        filepath: str,
+        batch_size: int = config.RESULT_STORE_BATCH_SIZE,
+        candidates_per_poem: int = config.RESULT_STORE_CANDIDATES
+    ):
+        """
+        Open (or create) the store.
+        
+        Args:
+            filepath: Path to the SQLite file
+            batch_size: Poems written per transaction
+            candidates_per_poem: Best-scoring candidates kept per poem
+                (0 keeps none)
+        """
+        self.filepath = filepath
+        self.batch_size = max(1, batch_size)
+        self.candidates_per_poem = candidates_per_poem
+        self.run_id: Optional[int] = None
+        self.commits = 0
+        
+        self._poem_ids: Dict[Tuple[str, str, str, str], int] = {}
+        self._recorded = set()  # Poem numbers recorded in the current run
+        self._choices: List[Tuple] = []
+        self._candidates: List[Tuple] = []
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filepath, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+    
+    @staticmethod
+    def _poem_key(poem: Poem) -> Tuple[str, str, str, str]:
+        return (poem.titulo, poem.autor, str(poem.año), poem.genero)
+    
+    def start_run(self, poems: Sequence[Poem], label: str = "") -> int:
+        """
+        Create a run and register its poems.
+        
+        Args:
+            poems: Every poem of the run
+            label: Description of the run (e.g. its command line)
+            
+        Returns:
+            ID of the new run
+        """
+        with self._lock:
+            self._flush()
+            cursor = self._conn.execute(
+                "INSERT INTO runs (label, started_at, total) VALUES (?, ?, ?)",
+                (label, datetime.now().isoformat(timespec='seconds'), len(poems))
+            )
+            self.run_id = cursor.lastrowid
+            self._recorded = set()
+            
+            # Only the run's own poems are looked up (joined through a
+            # temporary table), however many catalogues the store holds
+            keys = list(dict.fromkeys(self._poem_key(poem) for poem in poems))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO poems (titulo, autor, año, genero) VALUES (?, ?, ?, ?)", keys
+            )
+            self._conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS run_poems (titulo TEXT, autor TEXT, año TEXT, genero TEXT)"
+            )
+            self._conn.execute("DELETE FROM run_poems")
+            self._conn.executemany("INSERT INTO run_poems VALUES (?, ?, ?, ?)", keys)
+            self._poem_ids = {}
+            for poem_id, *key in self._conn.execute(
+                "SELECT p.id, p.titulo, p.autor, p.año, p.genero FROM run_poems r "
+                "JOIN poems p USING (titulo, autor, año, genero)"
+            ):
+                self._poem_ids[tuple(key)] = poem_id
+            self._conn.execute("DELETE FROM run_poems")
+            self._conn.commit()
+            self.commits += 1
+            return self.run_id
+    
+    def record(self, poem: Poem):
+        """
+        Buffer the result of a processed poem, committing a batch when full.
+        
+        Args:
+            poem: Processed Poem of the current run
+        """
+        with self._lock:
+            self._recorded.add(poem.numero)
+            self._choices.append((
+                self.run_id, poem.numero, self._poem_id(poem),
+                *(getattr(poem, name) for name in CHOICE_FIELDS)
+            ))
+            if len(self._choices) >= self.batch_size:
+                self._flush()
+    
+    def record_many(self, poems: Iterable[Poem]):
+        """
+        Buffer the results of several poems.
+        
+        Args:
+            poems: Processed Poems of the current run
+        """
+        for poem in poems:
+            self.record(poem)
+    
+    def add_candidates(self, poem: Poem, candidates: Sequence):
+        """
+        Buffer the best candidates a search considered for a poem.
+        
+        Args:
+            poem: Poem searched
+            candidates: VideoCandidate objects, best first
+        """
+        rows = [
+            (self.run_id, poem.numero, rank, c.video_id, c.title, c.channel, c.length_seconds,
+             c.type, c.quality, c.score, c.pattern)
+            for rank, c in enumerate(candidates[:self.candidates_per_poem], 1)
+        ]
+        if rows:
+            with self._lock:
+                self._candidates.extend(rows)
+    
+    def finish_run(self, poems: Iterable[Poem]):
+        """
+        Write the remaining batch, the final 'duplicado' values and the
+        run's availability counts.
+        
+        Poems never recorded (interrupted or failed searches) are written
+        as they are, so the stored run holds the whole catalogue like the
+        exports always did. Duplicates are only known once every poem is
+        done, so they are rewritten here for poems recorded earlier.
+        
+        Args:
+            poems: Every poem of the run
+        """
+        poems = list(poems)
+        self.record_many(poem for poem in poems if poem.numero not in self._recorded)
+        with self._lock:
+            self._flush()
+            self._conn.execute("UPDATE choices SET duplicado = '' WHERE run_id = ?", (self.run_id,))
+            self._conn.executemany(
+                "UPDATE choices SET duplicado = ? WHERE run_id = ? AND numero = ?",
+                ((poem.duplicado, self.run_id, poem.numero) for poem in poems if poem.duplicado)
+            )
+            self._conn.execute(
+                """
+                UPDATE runs SET
+                    finished_at = ?,
+                    found = (SELECT COUNT(*) FROM choices WHERE run_id = runs.id AND disponibilidad = 'ENCONTRADO'),
+                    partial = (SELECT COUNT(*) FROM choices WHERE run_id = runs.id AND disponibilidad = 'PARCIAL'),
+                    not_found = (SELECT COUNT(*) FROM choices WHERE run_id = runs.id
+                                 AND disponibilidad NOT IN ('ENCONTRADO', 'PARCIAL'))
+                WHERE id = ?
+                """,
+                (datetime.now().isoformat(timespec='seconds'), self.run_id)
+            )
+            self._conn.commit()
+            self.commits += 1
+    
+    def save_run(self, poems: Sequence[Poem], label: str = "") -> int:
+        """
+        Store a run whose poems are all processed already (e.g. merged shards).
+        
+        Args:
+            poems: Processed poems
+            label: Description of the run
+            
+        Returns:
+            ID of the new run
+        """
+        run_id = self.start_run(poems, label)
+        self.finish_run(poems)
+        return run_id
+    
+    def _poem_id(self, poem: Poem) -> int:
+        """Get the ID of a poem, registering it if start_run did not."""
+        key = self._poem_key(poem)
+        poem_id = self._poem_ids.get(key)
+        if poem_id is None:
+            self._conn.execute("INSERT OR IGNORE INTO poems (titulo, autor, año, genero) VALUES (?, ?, ?, ?)", key)
+            poem_id = self._conn.execute(
+                "SELECT id FROM poems WHERE titulo = ? AND autor = ? AND año = ? AND genero = ?", key
+            ).fetchone()[0]
+            self._poem_ids[key] = poem_id
+        return poem_id
+    
+    def _flush(self):
+        """Write buffered rows in one transaction (lock held by the caller)."""
+        if not self._choices and not self._candidates:
+            return
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO choices VALUES ({', '.join('?' * (3 + len(CHOICE_FIELDS)))})",
+            self._choices
+        )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO candidates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._candidates
+        )
+        self._conn.commit()
+        self.commits += 1
+        self._choices = []
+        self._candidates = []
+    
+    def flush(self):
+        """Write buffered rows now."""
+        with self._lock:
+            self._flush()
+    
+    def view(self, run_id: Optional[int] = None) -> StoredRun:
+        """
+        Get a streaming view of a run.
+        
+        Args:
+            run_id: Stored run (defaults to the current one)
+            
+        Returns:
+            StoredRun over the run's poems
+        """
+        self.flush()
+        return StoredRun(self.filepath, run_id if run_id is not None else self.run_id)
+    
+    def runs(self, limit: Optional[int] = None) -> List[RunSummary]:
+        """
+        List stored runs, newest first.
+        
+        Args:
+            limit: Maximum number of runs
+            
+        Returns:
+            List of RunSummary
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, label, started_at, finished_at, total, found, partial, not_found "
+                "FROM runs ORDER BY id DESC LIMIT ?",
+                (limit if limit else -1,)
+            ).fetchall()
+        return [RunSummary(*row) for row in rows]
+    
+    def history(self, titulo: str, autor: Optional[str] = None) -> List[Tuple[str, str, List[PoemHistory]]]:
+        """
+        Get the result of matching poems in every stored run.
+        
+        Args:
+            titulo: Poem title (case-insensitive)
+            autor: Author name (case-insensitive, optional)
+            
+        Returns:
+            List of (title, author, results per run, oldest first)
+        """
+        where, params = "p.titulo = ? COLLATE NOCASE", [titulo]
+        if autor:
+            where += " AND p.autor = ? COLLATE NOCASE"
+            params.append(autor)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT p.titulo, p.autor, r.id, r.started_at, c.disponibilidad, c.url_youtube, c.puntuacion
+                FROM poems p
+                JOIN choices c ON c.poem_id = p.id
+                JOIN runs r ON r.id = c.run_id
+                WHERE {where}
+                ORDER BY p.titulo, p.autor, r.id
+                """,
+                params
+            ).fetchall()
+            
+        grouped: Dict[Tuple[str, str], List[PoemHistory]] = {}
+        for poem_titulo, poem_autor, *result in rows:
+            grouped.setdefault((poem_titulo, poem_autor), []).append(PoemHistory(*result))
+        return [(poem_titulo, poem_autor, results) for (poem_titulo, poem_autor), results in grouped.items()]
+    
+    def close(self):
+        """Write buffered rows and close the database connection."""
+        with self._lock:
+            self._flush()
+            self._conn.close()
@@ -0,0 +1,92 @@
+"""Streaming CSV / JSON Lines output, one row per completed poem."""
+
+from typing import Optional
+import csv
+import io
+import json
+import os
+import threading
+
+from src.models.poem import Poem, EXPORT_COLUMNS
+
+
+class StreamWriter:
+    """
+    Appends one row per poem as soon as it is processed.
+    
+    Rows use the same columns as Poem.to_dict. Each row is written with a
+    single write call and flushed immediately, so readers tailing the file
+    always see complete rows and a killed process leaves a valid file.
+    """
+    
+    FORMATS = ('csv', 'jsonl')
+    
+    def __init__(self, filepath: str, fmt: Optional[str] = None):
+        """
+        Open the output file and write the header (CSV only).
+        
+        Args:
+            filepath: Output filepath
+            fmt: 'csv' or 'jsonl' (inferred from the extension if omitted)
+        """
+        if fmt is None:
+            ext = os.path.splitext(filepath)[1].lower().lstrip('.')
+            fmt = 'jsonl' if ext in ('jsonl', 'ndjson', 'json') else 'csv'
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unsupported stream format: {fmt}")
+            
+        self.filepath = filepath
+        self.fmt = fmt
+        self.rows_written = 0
+        self._lock = threading.Lock()
+        self._file = open(filepath, 'w', newline='', encoding='utf-8')
+        
+        if fmt == 'csv':
+            self._write_line(self._format_csv(EXPORT_COLUMNS))
+    
+    def write(self, poem: Poem):
+        """
+        Append a processed poem and flush it.
+        
+        Args:
+            poem: Processed Poem object
+        """
+        if self.fmt == 'csv':
+            line = self._format_csv(poem.to_row())
+        else:
+            line = json.dumps(poem.to_dict(), ensure_ascii=False) + '\n'
+            
+        with self._lock:
+            self._write_line(line)
+            self.rows_written += 1
+    
+    def close(self):
+        """Close the output file."""
+        with self._lock:
+            self._file.close()
+    
+    def __enter__(self) -> 'StreamWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _write_line(self, line: str):
+        """Write a complete line and flush it to the OS."""
+        self._file.write(line)
+        self._file.flush()
+    
+    @staticmethod
+    def _format_csv(values) -> str:
+        """
+        Format one CSV row as a string.
+        
+        Args:
+            values: Row values
+            
+        Returns:
+            CSV line including the line terminator
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+        return buffer.getvalue()
@@ -0,0 +1,50 @@
+"""Shared pytest setup and fixtures."""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.clients import FixtureBackend  # noqa: E402
+from tests.standin_server import PAGE_SIZE, StandInServer  # noqa: E402
+
+# Queries served by the stand-in server and how many videos each one has
+STANDIN_QUERIES = {
+    "poema tres paginas": PAGE_SIZE * 2 + 5,
+    "poema una pagina": PAGE_SIZE - 3,
+    "poema sin resultados": 0,
+}
+
+
+@pytest.fixture
+def standin_server(tmp_path):
+    """
+    Stand-in YouTube server running on a background event loop.
+    
+    The server serves STANDIN_QUERIES from a fixture file; its
+    `backend.fixtures` holds the recorded videos per query and `requests`
+    counts the requests served.
+    """
+    fixtures = {query: FixtureBackend._synthesize(query, count) for query, count in STANDIN_QUERIES.items()}
+    filepath = tmp_path / "fixtures.json"
+    filepath.write_text(json.dumps(fixtures, ensure_ascii=False), encoding='utf-8')
+    
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="standin-server", daemon=True)
+    thread.start()
+    server = StandInServer(FixtureBackend(str(filepath)))
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    try:
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,117 @@
+"""
+Local stand-in for YouTube's search, for AsyncSearchClient.
+
+Serves recorded search results through the two requests of the search
+protocol: the `/results` HTML page and `youtubei/v1/search`
+continuations, split into pages like the real site. Used by the tests
+(the `standin_server` fixture) and by benchmarks/async_search_benchmark.py.
+"""
+
+from typing import Dict, List, Optional
+import asyncio
+import json
+
+from src.clients import FixtureBackend
+
+PAGE_SIZE = 20  # Videos per results page, as served by YouTube
+API_KEY = "stand-in-key"
+CLIENT_CONTEXT = {'hl': 'es', 'gl': 'DO', 'clientName': 'WEB', 'clientVersion': '2.20240101.00.00'}
+
+
+def page_contents(videos: List[Dict], token: Optional[str]) -> List[Dict]:
+    """
+    Build the section list of one results page.
+    
+    Args:
+        videos: Videos on the page
+        token: Continuation token of the next page (None on the last one)
+        
+    Returns:
+        Section list contents
+    """
+    contents = [{'itemSectionRenderer': {'contents': [{'videoRenderer': video} for video in videos]}}]
+    if token:
+        contents.append({'continuationItemRenderer': {'continuationEndpoint': {
+            'clickTrackingParams': f"click-{token}",
+            'continuationCommand': {'token': token, 'request': 'CONTINUATION_REQUEST_TYPE_SEARCH'},
+        }}})
+    return contents
+
+
+class StandInServer:
+    """
+    Local HTTP server serving recorded search results as YouTube pages.
+    """
+    
+    def __init__(self, backend: FixtureBackend, latency: float = 0.0):
+        """
+        Args:
+            backend: Recorded (or synthesized) results per query
+            latency: Seconds each response is delayed
+        """
+        self.backend = backend
+        self.latency = latency
+        self.base_url = ""
+        self.requests = 0
+        self._runner = None
+    
+    def _page(self, query: str, page: int) -> List[Dict]:
+        """Contents of one page of a query's results."""
+        videos = self.backend.search(query, (page + 2) * PAGE_SIZE)
+        more = len(videos) > (page + 1) * PAGE_SIZE
+        token = json.dumps({'q': query, 'page': page + 1}) if more else None
+        return page_contents(videos[page * PAGE_SIZE:(page + 1) * PAGE_SIZE], token)
+    
+    async def _results(self, request):
+        from aiohttp import web
+        
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        data = {'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'sectionListRenderer': {
+            'contents': self._page(request.query.get('search_query', ''), 0)
+        }}}}}
+        # Compact JSON, as embedded in the real page
+        config_json = json.dumps({'INNERTUBE_CONTEXT': {'client': CLIENT_CONTEXT}, 'innertubeApiKey': API_KEY},
+                                 separators=(',', ':'))
+        html = (
+            f"<html><head><script>ytcfg.set({config_json});</script></head><body>"
+            f"<script>var ytInitialData = {json.dumps(data, separators=(',', ':'))};</script></body></html>"
+        )
+        return web.Response(text=html, content_type='text/html')
+    
+    async def _continuation(self, request):
+        from aiohttp import web
+        
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        if request.query.get('key') != API_KEY:
+            return web.Response(status=403)
+        token = json.loads((await request.json())['continuation'])
+        data = {'onResponseReceivedCommands': [{'appendContinuationItemsAction': {
+            'continuationItems': self._page(token['q'], token['page'])
+        }}]}
+        return web.json_response(data)
+    
+    async def start(self) -> str:
+        """
+        Start listening on a free local port.
+        
+        Returns:
+            Base URL of the server
+        """
+        from aiohttp import web
+        
+        app = web.Application()
+        app.router.add_get('/results', self._results)
+        app.router.add_post('/youtubei/v1/search', self._continuation)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+    
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
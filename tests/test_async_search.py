@@ -0,0 +1,106 @@
+"""AsyncSearchClient and AsyncSearchBackend against the stand-in server."""
+
+import asyncio
+
+import pytest
+
+from src.clients import AsyncSearchBackend, AsyncSearchClient
+from tests.standin_server import PAGE_SIZE
+
+
+def run_client(server, coroutine_factory, **options):
+    """Run a coroutine with a client of the stand-in server, returning its result and the client."""
+    async def scenario():
+        async with AsyncSearchClient(server.base_url, **options) as client:
+            return await coroutine_factory(client), client
+    return asyncio.run(scenario())
+
+
+def test_search_follows_continuations(standin_server):
+    query = "poema tres paginas"
+    videos, client = run_client(standin_server, lambda client: client.search(query))
+    
+    assert videos == standin_server.backend.fixtures[query]
+    # Results page plus two continuations
+    assert client.requests == standin_server.requests == 3
+
+
+def test_iter_pages_splits_results_like_the_site(standin_server):
+    query = "poema tres paginas"
+    
+    async def pages(client):
+        return [page async for page in client.iter_pages(query)]
+    
+    result, _ = run_client(standin_server, pages)
+    assert [len(page) for page in result] == [PAGE_SIZE, PAGE_SIZE, 5]
+
+
+@pytest.mark.parametrize("limit, pages", [(PAGE_SIZE, 1), (PAGE_SIZE + 5, 2), (None, 3)])
+def test_limit_stops_fetching_continuations(standin_server, limit, pages):
+    query = "poema tres paginas"
+    videos, _ = run_client(standin_server, lambda client: client.search(query, limit))
+    
+    expected = standin_server.backend.fixtures[query]
+    assert videos == expected[:limit]
+    assert standin_server.requests == pages
+
+
+@pytest.mark.parametrize("query", ["poema una pagina", "poema sin resultados"])
+def test_last_page_has_no_continuation(standin_server, query):
+    videos, _ = run_client(standin_server, lambda client: client.search(query))
+    
+    assert videos == standin_server.backend.fixtures[query]
+    assert standin_server.requests == 1
+
+
+def test_pooled_session_reuses_connections(standin_server):
+    queries = list(standin_server.backend.fixtures) * 3
+    results, client = run_client(
+        standin_server, lambda client: client.search_many(queries), concurrency=2, pool_size=2
+    )
+    
+    for query, videos in results.items():
+        assert videos == standin_server.backend.fixtures[query]
+    stats = client.get_stats()
+    assert stats['requests'] == standin_server.requests
+    assert stats['connections'] <= 2 < stats['requests']
+
+
+def test_backend_iter_pages_closes_early(standin_server):
+    client = AsyncSearchClient(standin_server.base_url)
+    generators = []
+    
+    def iter_pages(query):
+        generators.append(AsyncSearchClient.iter_pages(client, query))
+        return generators[-1]
+    
+    client.iter_pages = iter_pages
+    backend = AsyncSearchBackend(client)
+    try:
+        pages = backend.iter_pages("poema tres paginas", PAGE_SIZE)
+        first = next(pages)
+        pages.close()
+        
+        assert len(first) == PAGE_SIZE
+        # Closing after the first page must not fetch the continuations...
+        assert standin_server.requests == 1
+        # ...and must close the client's page generator (aclose ran)
+        assert generators[0].ag_frame is None
+        
+        # The shared loop and session keep working after the early close
+        query = "poema una pagina"
+        assert backend.search(query, PAGE_SIZE) == standin_server.backend.fixtures[query]
+    finally:
+        backend.close()
+
+
+def test_backend_close_shuts_down_loop_and_session(standin_server):
+    backend = AsyncSearchBackend(AsyncSearchClient(standin_server.base_url))
+    backend.search("poema una pagina", PAGE_SIZE)
+    thread = backend._thread
+    
+    backend.close()
+    
+    assert not thread.is_alive()
+    assert backend.client._session is None
+    backend.close()  # Closing twice is a no-op
@@ -0,0 +1,17 @@
+"""Import-time budget of the light commands (see benchmarks/import_benchmark.py)."""
+
+import pytest
+
+from benchmarks import import_benchmark
+from src.utils import config
+
+
+@pytest.mark.parametrize("command", ["--help", "stats export.csv"])
+def test_command_imports_within_budget(command):
+    result, = import_benchmark.measure_commands(repeat=5, commands=[command])
+    
+    assert not result['heavy'], f"{command} loads {', '.join(result['heavy'])}"
+    assert result['import_ms'] <= config.CLI_IMPORT_BUDGET_MS, (
+        f"{command} spends {result['import_ms']:.1f} ms importing "
+        f"(budget {config.CLI_IMPORT_BUDGET_MS} ms)"
+    )